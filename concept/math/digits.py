@@ -29,6 +29,96 @@
    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import math
+from itertools import permutations
+
+#: number of decimal digits handled by one table lookup.
+CHUNK_DIGITS = 4
+#: value of one chunk (10^4).
+CHUNK = 10 ** CHUNK_DIGITS
+#: for each chunk value the four digits (with leading zeros).
+CHUNK_STRINGS = tuple("%04d" % value for value in range(CHUNK))
+#: for each chunk value the sum of its digits.
+CHUNK_SUMS = bytes(sum(int(digit) for digit in text) for text in CHUNK_STRINGS)
+#: floor(log10(2) * 2^64); used to estimate the number of digits from the bit length.
+LOG10_2_SCALED = 5553023288523357132
+
+
+def chunk_powers(value):
+    """
+    Powers 10^(4*2^i) for splitting given value into chunks of 4 digits.
+
+    :param value: non negative integer value
+    :returns: list of powers where the last one is greater than value
+
+    >>> chunk_powers(123456789)
+    [10000, 100000000, 10000000000000000]
+    """
+    powers = [CHUNK]
+    while powers[-1] <= value:
+        powers.append(powers[-1] * powers[-1])
+    return powers
+
+
+def digit_chunks(value, powers=None):
+    """
+    Splitting value into chunks of 4 digits (most significant chunk first).
+
+    The value is split in halves by 10^(4*2^i) (divide and conquer) so the big
+    divisions are done on a few numbers only instead of peeling one digit at a time
+    with each step dividing the whole number by 10.
+
+    :param value: integer value (can also be negative)
+    :param powers: optional result of chunk_powers for a value at least as big (for reuse)
+    :returns: list of integers 0 <= chunk < 10^4 (all but the first one with 4 digits)
+
+    >>> digit_chunks(123456789)
+    [1, 2345, 6789]
+    >>> digit_chunks(0)
+    [0]
+    """
+    value = abs(value)
+    if value < CHUNK:
+        return [value]
+
+    if powers is None:
+        powers = chunk_powers(value)
+    level = 0
+    while powers[level + 1] <= value:
+        level += 1
+
+    chunks = []
+    # each entry: value < powers[level]^2, leading (True: no zero padding at the front)
+    stack = [(value, level, True)]
+    while stack:
+        value, level, leading = stack.pop()
+        if level < 0:
+            chunks.append(value)
+            continue
+        high, low = divmod(value, powers[level])
+        if leading and high == 0:
+            stack.append((low, level - 1, True))
+        else:
+            stack.append((low, level - 1, False))
+            stack.append((high, level - 1, leading))
+    return chunks
+
+
+def digit_string(value, powers=None):
+    """
+    Decimal digits of given value (without sign).
+
+    Unlike str() there's no limit for the number of digits (sys.set_int_max_str_digits).
+
+    :param value: integer value (can also be negative)
+    :param powers: optional result of chunk_powers for a value at least as big (for reuse)
+    :returns: string of digits
+
+    >>> digit_string(-1000200030004)
+    '1000200030004'
+    """
+    chunks = digit_chunks(value, powers)
+    return str(chunks[0]) + "".join(CHUNK_STRINGS[chunk] for chunk in chunks[1:])
 
 
 def sum_digits(value):
@@ -45,18 +135,16 @@ def sum_digits(value):
     >>> sum_digits(-1234567890)
     45
     """
-    value = abs(value)
-    result = 0
-    while value > 0:
-        result += value % 10
-        value //= 10
-    return result
+    return sum(CHUNK_SUMS[chunk] for chunk in digit_chunks(value))
 
 
 def count_digits(value):
     """
     Count of digits of given number.
 
+    The bit length provides a lower bound floor((bits - 1) * log10(2)) + 1
+    which is at most one too small; one comparison corrects it.
+
     :param value: integer value (can also be negative)
     :returns: count of digits of given number
 
@@ -69,14 +157,13 @@ def count_digits(value):
     >>> count_digits(-1234567890)
     10
     """
-    if value == 0:
-        return 1
-
     value = abs(value)
-    result = 0
-    while value > 0:
+    if value < CHUNK:
+        return 1 if value < 10 else 2 if value < 100 else 3 if value < 1000 else 4
+
+    result = (((value.bit_length() - 1) * LOG10_2_SCALED) >> 64) + 1
+    if value >= 10 ** result:
         result += 1
-        value //= 10
     return result
 
 
@@ -98,14 +185,10 @@ def is_pandigital(value):
     >>> is_pandigital(10240)
     False
     """
-    value = abs(value)
-    digits = set()
-    counter = 0
-    while value > 0:
-        digits.add(value % 10)
-        counter += 1
-        value //= 10
-    return counter == len(digits)
+    if abs(value) >= 10 ** 10:
+        return False  # more than 10 digits; at least one appears twice
+    digits = digit_string(value)
+    return len(set(digits)) == len(digits)
 
 
 def is_palindrome(value):
@@ -120,17 +203,207 @@ def is_palindrome(value):
     >>> is_palindrome(1231)
     False
     """
-    value = abs(value)
-    digits = []
-    while value > 0:
-        digits.append(value % 10)
-        value //= 10
-
-    left = 0
-    right = len(digits) - 1
-    while left < right:
-        if not digits[left] == digits[right]:
-            return False
-        left += 1
-        right -= 1
-    return True
+    digits = digit_string(value)
+    return digits == digits[::-1]
+
+
+def sum_digits_many(values):
+    """
+    Sum of digits for each given number (sharing the powers for splitting).
+
+    :param values: iterable of integer values
+    :returns: list of sums of digits
+
+    >>> sum_digits_many([1024, -99, 0])
+    [7, 18, 0]
+    """
+    values = list(values)
+    powers = chunk_powers(max((abs(value) for value in values), default=0))
+    return [sum(CHUNK_SUMS[chunk] for chunk in digit_chunks(value, powers)) for value in values]
+
+
+def count_digits_many(values):
+    """
+    Count of digits for each given number.
+
+    :param values: iterable of integer values
+    :returns: list of counts of digits
+
+    >>> count_digits_many([0, 1024, -99])
+    [1, 4, 2]
+    """
+    return [count_digits(value) for value in values]
+
+
+def is_pandigital_many(values):
+    """
+    Check each given number to be pandigital.
+
+    :param values: iterable of integer values
+    :returns: list of booleans
+
+    >>> is_pandigital_many([1024, 10240])
+    [True, False]
+    """
+    return [is_pandigital(value) for value in values]
+
+
+def is_palindrome_many(values):
+    """
+    Check each given number to be a palindrome (sharing the powers for splitting).
+
+    :param values: iterable of integer values
+    :returns: list of booleans
+
+    >>> is_palindrome_many([161, 2332, 1231])
+    [True, True, False]
+    """
+    values = list(values)
+    powers = chunk_powers(max((abs(value) for value in values), default=0))
+    return [digits == digits[::-1]
+            for digits in (digit_string(value, powers) for value in values)]
+
+
+def palindromes(length):
+    """
+    Generating all palindromes with given number of digits in ascending order.
+
+    Each palindrome is constructed from its first half instead of
+    testing all numbers of that length.
+
+    :param length: number of digits (>= 1)
+    :returns: generator for the positive palindromes with that many digits
+
+    >>> list(palindromes(1))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    >>> list(palindromes(3))[:5]
+    [101, 111, 121, 131, 141]
+    """
+    half_length = (length + 1) // 2
+    for half in range(10 ** (half_length - 1), 10 ** half_length):
+        text = str(half)
+        yield int(text + text[-1 - length % 2::-1])
+
+
+def palindromes_up_to(limit):
+    """
+    Generating all positive palindromes <= limit in ascending order.
+
+    :param limit: maximum value
+    :returns: generator for palindromes
+
+    >>> list(palindromes_up_to(60))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22, 33, 44, 55]
+    """
+    for length in range(1, count_digits(max(limit, 0)) + 1):
+        for value in palindromes(length):
+            if value > limit:
+                return
+            yield value
+
+
+def count_palindromes(limit):
+    """
+    Count positive palindromes <= limit without enumerating them.
+
+    There are 9*10^(h-1) palindromes with 2h-1 or 2h digits; for the length
+    of the limit the first half of the limit decides.
+
+    :param limit: maximum value
+    :returns: number of palindromes
+
+    >>> count_palindromes(60)
+    14
+    >>> count_palindromes(10 ** 18)
+    1999999998
+    """
+    if limit < 1:
+        return 0
+
+    text = digit_string(limit)
+    length = len(text)
+    result = sum(9 * 10 ** ((current + 1) // 2 - 1) for current in range(1, length))
+    half_length = (length + 1) // 2
+    result += limit // 10 ** (length - half_length) - 10 ** (half_length - 1)
+    half_text = text[:half_length]
+    # same number of digits: comparing the strings compares the values
+    if half_text + half_text[-1 - length % 2::-1] <= text:
+        result += 1
+    return result
+
+
+def pandigital_digits(count, zero=False):
+    """
+    Digits of a pandigital number.
+
+    :param count: number of digits (1..9; 1..10 with zero)
+    :param zero: when true the digits start with 0 otherwise with 1
+    :returns: string of digits in ascending order
+
+    >>> pandigital_digits(4), pandigital_digits(4, zero=True)
+    ('1234', '0123')
+    """
+    first = 0 if zero else 1
+    if count < 1 or first + count > 10:
+        raise ValueError("%d pandigital digits not possible" % count)
+    return "".join(str(digit) for digit in range(first, first + count))
+
+
+def pandigitals(count, zero=False):
+    """
+    Generating all pandigital numbers (each digit 1..count exactly once) in ascending order.
+
+    The lexicographic order of the permutations of the sorted digits is the
+    ascending order of the numbers; with zero those with a leading zero are skipped.
+
+    :param count: number of digits (1..9; 1..10 with zero)
+    :param zero: when true the digits are 0..count-1 otherwise 1..count
+    :returns: generator for pandigital numbers
+
+    >>> list(pandigitals(3))
+    [123, 132, 213, 231, 312, 321]
+    >>> list(pandigitals(3, zero=True))
+    [102, 120, 201, 210]
+    """
+    digits = pandigital_digits(count, zero)
+    for index, first in enumerate(digits):
+        if first == "0":
+            continue
+        rest = digits[:index] + digits[index + 1:]
+        for permutation in permutations(rest):
+            yield int(first + "".join(permutation))
+
+
+def count_pandigitals(limit, count, zero=False):
+    """
+    Count pandigital numbers <= limit without enumerating them.
+
+    For each position of the limit the permutations starting with the same prefix
+    and a smaller digit are counted (the rank of the limit).
+
+    :param limit: maximum value
+    :param count: number of digits (1..9; 1..10 with zero)
+    :param zero: when true the digits are 0..count-1 otherwise 1..count
+    :returns: number of pandigital numbers
+
+    >>> count_pandigitals(231, 3)
+    4
+    >>> count_pandigitals(10 ** 10, 10, zero=True)
+    3265920
+    """
+    digits = pandigital_digits(count, zero)
+    if limit < 1 or len(str(limit)) < count:
+        return 0
+    if len(str(limit)) > count:
+        return math.factorial(count) - (math.factorial(count - 1) if zero else 0)
+
+    available = list(digits)
+    result = 0
+    for position, current in enumerate(str(limit)):
+        smaller = sum(1 for digit in available
+                      if digit < current and not (position == 0 and digit == "0"))
+        result += smaller * math.factorial(len(available) - 1)
+        if current not in available:
+            return result
+        available.remove(current)
+    return result + 1
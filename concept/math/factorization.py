@@ -29,13 +29,132 @@
    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import math
+from concept.primes.is_prime import SMALL_PRIMES, is_prime
 
 
-def probe(value):
+def factorize(value):
+    """
+    Prime factorization of a value.
+
+    Small prime factors are found by trial division; the remaining part is
+    split with Pollard-Brent rho until each factor is a prime (Miller-Rabin).
+
+    :param value: value to factorize (not 0).
+    :returns: dictionary with prime as key and exponent as value (ascending primes).
+
+    >>> factorize(360)
+    {2: 3, 3: 2, 5: 1}
+    >>> factorize(1000000016000000063)
+    {1000000007: 1, 1000000009: 1}
+    """
+    value = abs(value)
+    if value == 0:
+        raise ValueError("0 cannot be factorized")
+
+    factors = {}
+    for prime in SMALL_PRIMES:
+        while value % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            value //= prime
+
+    remaining = [value] if value > 1 else []
+    while remaining:
+        value = remaining.pop()
+        if is_prime(value):
+            factors[value] = factors.get(value, 0) + 1
+        else:
+            factor = pollard_brent(value)
+            remaining.extend([factor, value // factor])
+
+    return dict(sorted(factors.items()))
+
+
+def pollard_brent(value):
+    """
+    Finding a non trivial factor of a composite value (Pollard rho with Brent's cycle detection).
+
+    The differences are multiplied up (modulo value) to compute one gcd per
+    batch only; when a batch overshoots the steps are repeated one by one.
+    Another polynomial x^2 + c is used when no factor has been found.
+
+    :param value: composite value.
+    :returns: factor f with 1 < f < value.
+
+    >>> pollard_brent(8051) in (83, 97)
+    True
+    """
+    if value % 2 == 0:
+        return 2
+
+    batch = 128
+    for constant in range(1, value):
+        power, cycle, product, factor = 2, 1, 1, 1
+        while factor == 1:
+            start = power
+            for _ in range(cycle):
+                power = (power * power + constant) % value
+            step = 0
+            while step < cycle and factor == 1:
+                saved = power
+                for _ in range(min(batch, cycle - step)):
+                    power = (power * power + constant) % value
+                    product = product * abs(start - power) % value
+                factor = math.gcd(product, value)
+                step += batch
+            cycle *= 2
+
+        if factor == value:
+            factor = 1
+            while factor == 1:
+                saved = (saved * saved + constant) % value
+                factor = math.gcd(abs(start - saved), value)
+
+        if factor != value:
+            return factor
+
+    raise ValueError("no factor found for %d" % value)
+
+
+def divisors(value):
+    """
+    All divisors of a value derived from its prime factorization.
+
+    :param value: value (not 0).
+    :returns: sorted list of all divisors.
+
+    >>> divisors(28)
+    [1, 2, 4, 7, 14, 28]
+    """
+    return divisors_from_factors(factorize(value))
+
+
+def divisors_from_factors(factors):
+    """
+    All divisors for a given prime factorization in O(d(n)).
+
+    :param factors: dictionary with prime as key and exponent as value.
+    :returns: sorted list of all divisors.
+
+    >>> divisors_from_factors({2: 2, 3: 1})
+    [1, 2, 3, 4, 6, 12]
+    >>> divisors_from_factors({})
+    [1]
+    """
+    result = [1]
+    for prime, exponent in factors.items():
+        powers = [prime ** power for power in range(1, exponent + 1)]
+        result += [divisor * power for divisor in result for power in powers]
+    return sorted(result)
+
+
+def probe(value, sieve=None):
     """
     Factorization of n by probing.
 
     :param n: value to factorize.
+    :param sieve: optional sieve providing factorize(value) (like concept.primes.factor_sieve)
+                  used when value is not greater than the maximum of the sieve.
     :returns: all proper divisors of n.
 
     >>> probe(10)
@@ -44,17 +163,11 @@ def probe(value):
     [1, 2, 3, 4, 6, 12]
     """
     value = abs(value)
-    limit = value // 2
-    divisors = [1]
-    divisor = 2
-
-    while divisor <= limit:
-        if value % divisor == 0:
-            divisors.append(divisor)
-
-        divisor += 1
+    if sieve is not None and 1 <= value <= sieve.max_n:
+        return divisors_from_factors(sieve.factorize(value))
 
-    if not value == 1:
-        divisors.append(value)
+    if value > 0:
+        return divisors(value)
 
-    return divisors
+    # 0 cannot be factorized; as before: 1 and the value itself
+    return [1, value]
@@ -0,0 +1,300 @@
+"""
+   Searching magic squares (constraint propagation).
+
+.. module:: magic_square
+    :platform: Unix, Windows
+    :synopis: finding all magic squares of a given size
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import os
+from multiprocessing import Pool
+
+
+def search_magic_squares(arguments):
+    """
+    Search magic squares for one prefix (function for the processes of MagicSquareSearch.findall).
+
+    :param arguments: tuple of size of the square and the prefix (see MagicSquareSearch.search)
+    :return: list of magic squares
+    """
+    size, prefix = arguments
+    return MagicSquareSearch(size).search(prefix)
+
+
+class MagicSquareSearch(object):
+    """
+    Search of all magic squares with the numbers 1 .. size*size.
+
+    The cells are filled row and column wise (see create_order); the last cell
+    of a line (row, column or diagonal) is not searched but calculated from
+    the magic constant. The available numbers are the bits of an integer and
+    each partial line is checked to be still completable with the smallest and
+    the biggest available numbers.
+
+    Of the eight squares created by rotation and reflection only the one is searched
+    with the smallest corner top left and the top right corner smaller than the
+    bottom left corner; the others are created by the symmetries method.
+
+    >>> search = MagicSquareSearch(3)
+    >>> search.magic_constant
+    15
+    >>> search.search()
+    [(2, 9, 4, 7, 5, 3, 6, 1, 8)]
+    >>> len(search.findall())
+    8
+    """
+
+    def __init__(self, size):
+        """
+        Initialize search.
+
+        :param size: number of rows and columns of the square
+        """
+        if size < 1:
+            raise ValueError("size of at least 1 expected, %d given" % size)
+        self.size = size
+        self.magic_constant = size * (size * size + 1) // 2
+        self.order = self.create_order(size)
+        self.steps = self.create_steps()
+
+    @staticmethod
+    def create_order(size):
+        """
+        Order of the cells being filled.
+
+        The next cell is the first open cell of the line with fewest open cells
+        (on same number: row 0, column 0, row 1, ..., diagonal, other diagonal).
+
+        >>> MagicSquareSearch.create_order(3)
+        [0, 1, 2, 3, 6, 4, 5, 7, 8]
+
+        :param size: number of rows and columns of the square
+        :return: list of cell positions (row * size + column)
+        """
+        lines = []
+        for index in range(size):
+            lines.append([index * size + column for column in range(size)])
+            lines.append([row * size + index for row in range(size)])
+        lines.append([index * size + index for index in range(size)])
+        lines.append([index * size + size - 1 - index for index in range(size)])
+
+        order = []
+        while len(order) < size * size:
+            open_cells = [[position for position in line if position not in order] for line in lines]
+            order.append(min((cells for cells in open_cells if cells), key=len)[0])
+        return order
+
+    def lines(self, position):
+        """
+        Lines with given cell.
+
+        Rows are 0 .. size-1, columns size .. 2*size-1, the main diagonal
+        is 2*size and the other diagonal is 2*size+1.
+
+        :param position: position of the cell (row * size + column)
+        :return: list of lines
+        """
+        row, column = divmod(position, self.size)
+        lines = [row, self.size + column]
+        if row == column:
+            lines.append(2 * self.size)
+        if row + column == self.size - 1:
+            lines.append(2 * self.size + 1)
+        return lines
+
+    def create_steps(self):
+        """
+        Precalculate the work for each cell in order of the search.
+
+        :return: list of (position, lines of the cell, line with last cell or None,
+                 other lines with last cell, lines with number of remaining cells
+                 and the sum of 0 .. number-1,
+                 positions with smaller values, positions with bigger values,
+                 smallest value, biggest value)
+        """
+        last = self.size * self.size - 1
+        corners = (0, self.size - 1, last - self.size + 1, last)
+        # symmetry breaking: smallest corner top left, top right smaller than bottom left
+        smaller_than = [(corners[0], corners[1]), (corners[0], corners[2]),
+                        (corners[0], corners[3]), (corners[1], corners[2])] if self.size > 1 else []
+
+        remaining = [self.size] * (2 * self.size + 2)
+        steps = []
+        for step, position in enumerate(self.order):
+            placed = set(self.order[:step])
+            completed, bounded = [], []
+            lines = self.lines(position)
+            for line in lines:
+                remaining[line] -= 1
+                if remaining[line] == 0:
+                    completed.append(line)
+                else:
+                    bounded.append((line, remaining[line], remaining[line] * (remaining[line] - 1) // 2))
+
+            smaller = [first for first, second in smaller_than if second == position and first in placed]
+            bigger = [second for first, second in smaller_than if first == position and second in placed]
+            # smallest and biggest value allowed by the number of corners having to be smaller or bigger
+            minimum = 1 + sum(1 for first, second in smaller_than if second == position)
+            maximum = self.size * self.size - sum(1 for first, second in smaller_than if first == position)
+            steps.append((position, lines, completed[0] if completed else None, completed[1:],
+                          bounded, smaller, bigger, minimum, maximum))
+        return steps
+
+    def search(self, prefix=()):
+        """
+        Search magic squares (one of each eight being symmetric; see symmetries).
+
+        :param prefix: values of the first cells in search order (see create_order and prefixes)
+        :return: list of magic squares (values row by row)
+        """
+        return self.explore(prefix, len(self.steps))
+
+    def prefixes(self, depth):
+        """
+        Possible values of the first cells (subtrees of the search).
+
+        :param depth: number of cells in search order
+        :return: list of prefixes for the search method
+        """
+        return self.explore((), depth)
+
+    def explore(self, prefix, depth):
+        """
+        Depth first search filling the cells in search order.
+
+        :param prefix: values of the first cells in search order
+        :param depth: number of cells to fill
+        :return: list of magic squares (depth is the number of cells) otherwise
+                 list of values for the first depth cells in search order
+        """
+        steps, order, target = self.steps, self.order, self.magic_constant
+        values = [0] * len(steps)
+        sums = [0] * (2 * self.size + 2)
+        results = []
+
+        def place(step, available):
+            """Fill cell of given step with each possible value and continue with next step."""
+            if step == depth:
+                if depth == len(steps):
+                    results.append(tuple(values))
+                else:
+                    results.append(tuple(values[position] for position in order[:depth]))
+                return
+
+            position, lines, forced, completed, bounded, smaller, bigger, low, high = steps[step]
+            # range of values allowing to complete each line with the remaining available values
+            lowest, highest = (available & -available).bit_length() - 1, available.bit_length() - 1
+            high = min(high, highest)
+            for line, count, spread in bounded:
+                needed = target - sums[line]
+                low = max(low, needed - count * highest + spread)
+                high = min(high, needed - count * lowest - spread)
+            for other in smaller:
+                low = max(low, values[other] + 1)
+            for other in bigger:
+                high = min(high, values[other] - 1)
+            if low > high:
+                return
+
+            if forced is not None:
+                candidates = [target - sums[forced]]
+            elif step < len(prefix):
+                candidates = [prefix[step]]
+            else:
+                candidates, bits = [], available & ((2 << high) - (1 << low))
+                while bits:
+                    bit = bits & -bits
+                    candidates.append(bit.bit_length() - 1)
+                    bits ^= bit
+
+            for value in candidates:
+                if value < low or value > high or not available >> value & 1:
+                    continue
+                if step < len(prefix) and not value == prefix[step]:
+                    return
+                if any(not sums[line] + value == target for line in completed):
+                    continue
+
+                rest = available ^ (1 << value)
+                values[position] = value
+                for line in lines:
+                    sums[line] += value
+                place(step + 1, rest)
+                for line in lines:
+                    sums[line] -= value
+            values[position] = 0
+
+        place(0, ((1 << (len(steps) + 1)) - 1) ^ 1)
+        return results
+
+    @staticmethod
+    def symmetries(square):
+        """
+        All squares created by rotation and reflection.
+
+        >>> MagicSquareSearch.symmetries((1, 2, 3, 4))[:4]
+        [(1, 2, 3, 4), (3, 1, 4, 2), (4, 3, 2, 1), (2, 4, 1, 3)]
+
+        :param square: values row by row
+        :return: list of eight squares (the given one first, then rotations, then
+                 reflections of those)
+        """
+        size = int(len(square) ** 0.5 + 0.5)
+        rows = [square[row * size:(row + 1) * size] for row in range(size)]
+        squares = []
+        for dummy in range(4):
+            squares.append(tuple(value for row in rows for value in row))
+            # rotation clockwise
+            rows = [tuple(rows[size - 1 - row][column] for row in range(size)) for column in range(size)]
+        # reflection at the vertical axis
+        squares.extend(tuple(value for row in range(size)
+                             for value in values[row * size:(row + 1) * size][::-1])
+                       for values in squares[:4])
+        return squares
+
+    def findall(self, workers=1, depth=2):
+        """
+        Search all magic squares (including those created by rotation and reflection).
+
+        :param workers: number of processes (None: number of CPUs); the search tree is
+                        split by the values of the first depth cells of the first row
+        :param depth: number of cells of the prefixes (see prefixes)
+        :return: sorted list of different magic squares (values row by row)
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            squares = self.search()
+        else:
+            pool = Pool(workers)
+            try:
+                arguments = [(self.size, prefix) for prefix in self.prefixes(depth)]
+                squares = [square for found in pool.imap_unordered(search_magic_squares, arguments)
+                           for square in found]
+            finally:
+                pool.close()
+                pool.join()
+        # symmetries of a square may be equal (size 1)
+        return sorted(set(symmetric for square in squares for symmetric in self.symmetries(square)))
@@ -29,14 +29,93 @@ Representation of a  mathematical matrix.
    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import os
+import ast
+import sys
+import struct
+import operator
+from array import array
+from mmap import mmap as memory_map, ACCESS_COPY
+from multiprocessing import Pool
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#: number of result columns calculated together (their values stay in the cache for all rows).
+BLOCK_SIZE = 64
+#: typecodes for which numpy is used automatically (same results as with Python floats).
+NUMPY_TYPECODES = ('d', 'f')
+#: pivot considered zero (singular matrix) when not above this fraction of the biggest value of its row.
+SINGULAR_TOLERANCE = 1e-12
+
+#: first bytes of a file in NPY format (the format of numpy.save and numpy.load).
+NPY_MAGIC = b"\x93NUMPY"
+#: NPY type description (without byte order) for the typecodes of array.
+NPY_TYPES = dict((typecode, "%s%d" % ('f' if typecode in "fd" else 'u' if typecode.isupper() else 'i',
+                                      array(typecode).itemsize))
+                 for typecode in "lLbBhHiIqQfd")
+#: typecode for a NPY type description (without byte order); 'i' and 'q' preferred to 'l'.
+NPY_TYPECODES = dict((description, typecode) for typecode, description in NPY_TYPES.items())
+
+#: shared memory of left matrix, right matrix and result of a worker process (see init_multiply_worker).
+WORKER_MEMORIES = []
+#: columns of the right matrix (copied once per worker process).
+WORKER_COLUMNS = []
+#: width of the left matrix, width of the right matrix and typecode of a worker process.
+WORKER_SHAPE = (0, 0, 'd')
+
+
+def init_multiply_worker(names, inner, width, typecode):
+    """
+    Attaching a worker process to the shared memory of the operands and of the result.
+
+    :param names: names of the shared memory for left matrix, right matrix and result.
+    :param inner: width of the left matrix (height of the right one).
+    :param width: width of the right matrix (and of the result).
+    :param typecode: typecode of the values in the shared memory.
+    """
+    from multiprocessing import shared_memory  # Python 3.8 and newer only
+    global WORKER_MEMORIES, WORKER_COLUMNS, WORKER_SHAPE  # pylint: disable=global-statement
+    WORKER_MEMORIES = [shared_memory.SharedMemory(name=name) for name in names]
+    with WORKER_MEMORIES[1].buf.cast(typecode) as right:
+        WORKER_COLUMNS = [right[column:inner * width:width].tolist() for column in range(width)]
+    WORKER_SHAPE = (inner, width, typecode)
+
+
+def multiply_rows(block):
+    """
+    Calculating rows of the result in a worker process (written into the shared result).
+
+    :param block: tuple (first, last) with the rows first <= row < last.
+    :returns: number of calculated rows
+    """
+    first, last = block
+    inner, width, typecode = WORKER_SHAPE
+    with WORKER_MEMORIES[0].buf.cast(typecode) as left, \
+            WORKER_MEMORIES[2].buf.cast(typecode) as result:
+        for row in range(first, last):
+            values = left[row * inner:(row + 1) * inner].tolist()
+            result[row * width:(row + 1) * width] = \
+                array(typecode, [sum(map(operator.mul, values, column)) for column in WORKER_COLUMNS])
+    return last - first
 
 
 class Matrix(object):
-    """Matrix of dimensions w x h."""
+    """
+    Matrix of dimensions w x h.
+
+    By default the values are stored as list of rows (each a list); with a typecode
+    (like 'd' for float or 'q' for int) the values are stored in one contiguous
+    row-major array (8 bytes per value for 'd' and 'q').
+    """
 
     class Cell(object):
         """represent one cell of the matrix."""
 
+        __slots__ = ("column", "row", "matrix")
+
         def __init__(self, column, row, matrix):
             """initializing cell location."""
             self.column = column
@@ -68,22 +147,91 @@ class Matrix(object):
             other.set(self.get())
             self.set(value)
 
-    class Row(object):
+    class View(object):
+        """
+        Sequence protocol for rows, columns and diagonals working on the values of the matrix.
+
+        Reading and changing values by index or iterating over them does not copy;
+        changes are visible in the matrix (and the other way round).
+        The concrete class provides __len__, __iter__ and location.
+        """
+
+        __slots__ = ()
+
+        def position(self, index):
+            """
+            Validating index (negative index counts from the end).
+
+            :param index: index in the view
+            :return: index 0 <= index < len(view)
+            """
+            size = len(self)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError("index %d outside of %d values" % (index, size))
+            return index
+
+        def __getitem__(self, index):
+            """:return: value at given index (list of the values for a slice)."""
+            if isinstance(index, slice):
+                return [self.matrix[self.location(position)]
+                        for position in range(*index.indices(len(self)))]
+            return self.matrix[self.location(index)]
+
+        def __setitem__(self, index, value):
+            """changing value at given index (for a slice: the same number of values)."""
+            if isinstance(index, slice):
+                positions, values = range(*index.indices(len(self))), list(value)
+                if not len(positions) == len(values):
+                    raise ValueError("%d values expected, %d given" % (len(positions), len(values)))
+                for position, value in zip(positions, values):
+                    self.matrix[self.location(position)] = value
+                return
+            self.matrix[self.location(index)] = value
+
+    class Row(View):
         """represent one row of the matrix."""
 
+        __slots__ = ("row", "matrix")
+
         def __init__(self, row, matrix):
             """initializing row location."""
             self.row = row
             self.matrix = matrix
 
+        def __len__(self):
+            """:return: number of values of the row."""
+            return self.matrix.width
+
+        def __iter__(self):
+            """:return: iterator over the values of the row (without copy)."""
+            if self.matrix.typecode is None:
+                return iter(self.matrix.data[self.row])
+            start = self.row * self.matrix.width
+            return iter(memoryview(self.matrix.data)[start:start + self.matrix.width])
+
+        def location(self, index):
+            """:return: (column, row) for given index of the row."""
+            return self.position(index), self.row
+
         def get(self):
             """:return: copy of the values of the row."""
-            return self.matrix.data[self.row][0:]
+            if self.matrix.typecode is None:
+                return self.matrix.data[self.row][0:]
+            start = self.row * self.matrix.width
+            return self.matrix.data[start:start + self.matrix.width].tolist()
 
         def set(self, values):
             """changing values of the row."""
-            for column in range(self.matrix.width):
-                self.matrix.data[self.row][column] = values[column]
+            self.matrix.decomposition = None
+            if self.matrix.typecode is None:
+                for column in range(self.matrix.width):
+                    self.matrix.data[self.row][column] = values[column]
+            else:
+                start = self.row * self.matrix.width
+                self.matrix.data[start:start + self.matrix.width] \
+                    = array(self.matrix.typecode, values[:self.matrix.width])
 
         def swap(self, other):
             """
@@ -94,6 +242,18 @@ class Matrix(object):
             if not isinstance(other, self.__class__):
                 raise TypeError("instance of type Row expected, %s given" % type(other))
 
+            if self.matrix is other.matrix:
+                self.matrix.decomposition = None
+                data = self.matrix.data
+                if self.matrix.typecode is None:
+                    data[self.row], data[other.row] = data[other.row], data[self.row]
+                else:
+                    first = slice(self.row * self.matrix.width, (self.row + 1) * self.matrix.width)
+                    second = slice(other.row * self.matrix.width, (other.row + 1) * self.matrix.width)
+                    data[first], data[second] \
+                        = array(self.matrix.typecode, data[second]), array(self.matrix.typecode, data[first])
+                return
+
             values = other.get()
             other.set(self.get())
             self.set(values)
@@ -107,22 +267,45 @@ class Matrix(object):
             for column in range(self.matrix.width):
                 yield self.matrix.Cell(column, self.row, self.matrix)
 
-    class Column(object):
+    class Column(View):
         """represent one column of the matrix."""
 
+        __slots__ = ("column", "matrix")
+
         def __init__(self, column, matrix):
             """initializing row location."""
             self.column = column
             self.matrix = matrix
 
+        def __len__(self):
+            """:return: number of values of the column."""
+            return self.matrix.height
+
+        def __iter__(self):
+            """:return: iterator over the values of the column (without copy)."""
+            if self.matrix.typecode is None:
+                return (row[self.column] for row in self.matrix.data)
+            return iter(memoryview(self.matrix.data)[self.column::self.matrix.width])
+
+        def location(self, index):
+            """:return: (column, row) for given index of the column."""
+            return self.column, self.position(index)
+
         def get(self):
             """:return: copy of the values of the column."""
-            return [row[self.column] for row in self.matrix.data]
+            if self.matrix.typecode is None:
+                return [row[self.column] for row in self.matrix.data]
+            return self.matrix.data[self.column::self.matrix.width].tolist()
 
         def set(self, values):
             """hanging values of the column."""
-            for row in range(self.matrix.height):
-                self.matrix.data[row][self.column] = values[row]
+            self.matrix.decomposition = None
+            if self.matrix.typecode is None:
+                for row in range(self.matrix.height):
+                    self.matrix.data[row][self.column] = values[row]
+            else:
+                self.matrix.data[self.column::self.matrix.width] \
+                    = array(self.matrix.typecode, values[:self.matrix.height])
 
         def swap(self, other):
             """
@@ -133,6 +316,14 @@ class Matrix(object):
             if not isinstance(other, self.__class__):
                 raise TypeError("instance of type Row expected, %s given" % type(other))
 
+            if self.matrix is other.matrix and self.matrix.typecode is not None:
+                self.matrix.decomposition = None
+                data, width = self.matrix.data, self.matrix.width
+                data[self.column::width], data[other.column::width] \
+                    = array(self.matrix.typecode, data[other.column::width]), \
+                    array(self.matrix.typecode, data[self.column::width])
+                return
+
             values = other.get()
             other.set(self.get())
             self.set(values)
@@ -146,9 +337,11 @@ class Matrix(object):
             for row in range(self.matrix.height):
                 yield self.matrix.Cell(self.column, row, self.matrix)
 
-    class Diagonal(object):
+    class Diagonal(View):
         """represent one diagonal of the matrix."""
 
+        __slots__ = ("row", "column", "step_column", "step_row", "matrix")
+
         def __init__(self, column, row, step_column, step_row, matrix):
             """initializing row location."""
             self.row = row
@@ -157,8 +350,53 @@ class Matrix(object):
             self.step_row = step_row
             self.matrix = matrix
 
+        def __len__(self):
+            """:return: number of values of the diagonal."""
+            count = self.matrix.width + self.matrix.height
+            for start, step, size in ((self.column, self.step_column, self.matrix.width),
+                                      (self.row, self.step_row, self.matrix.height)):
+                if not 0 <= start < size:
+                    return 0
+                if step > 0:
+                    count = min(count, (size - 1 - start) // step + 1)
+                elif step < 0:
+                    count = min(count, start // -step + 1)
+            return count
+
+        def __iter__(self):
+            """:return: iterator over the values of the diagonal (without copy)."""
+            if self.matrix.typecode is not None:
+                return iter(memoryview(self.matrix.data)[self.flat_slice()])
+            return (self.matrix.data[self.row + index * self.step_row][self.column + index * self.step_column]
+                    for index in range(len(self)))
+
+        def location(self, index):
+            """:return: (column, row) for given index of the diagonal."""
+            index = self.position(index)
+            return self.column + index * self.step_column, self.row + index * self.step_row
+
+        def flat_slice(self):
+            """
+            Location of the diagonal in the row-major storage (typecode mode).
+
+            :return: slice for the values of the diagonal
+            """
+            count = len(self)
+            if count == 0:
+                return slice(0, 0)
+
+            first = self.row * self.matrix.width + self.column
+            step = self.step_row * self.matrix.width + self.step_column
+            if count == 1 or step == 0:
+                return slice(first, first + 1)
+            last = first + step * (count - 1)
+            return slice(first, None if last + step < 0 else last + step, step)
+
         def get(self):
             """:return: copy of the values of the diagonal."""
+            if self.matrix.typecode is not None:
+                return self.matrix.data[self.flat_slice()].tolist()
+
             data = []
             row = self.row
             column = self.column
@@ -171,6 +409,13 @@ class Matrix(object):
 
         def set(self, values):
             """changing values of the diagonal."""
+            self.matrix.decomposition = None
+            if self.matrix.typecode is not None:
+                indices = self.flat_slice()
+                count = len(range(*indices.indices(len(self.matrix.data))))
+                self.matrix.data[indices] = array(self.matrix.typecode, values[:count])
+                return
+
             index = 0
             row = self.row
             column = self.column
@@ -195,16 +440,86 @@ class Matrix(object):
                 row += self.step_row
                 column += self.step_column
 
-    def __init__(self, width, height):
+    class Transposed(object):
+        """lazy transposed view of a matrix (no copy; changes are visible in both)."""
+
+        __slots__ = ("matrix",)
+
+        def __init__(self, matrix):
+            """initializing view for given matrix."""
+            self.matrix = matrix
+
+        @property
+        def width(self):
+            """:return: width of the view (height of the matrix)."""
+            return self.matrix.height
+
+        @property
+        def height(self):
+            """:return: height of the view (width of the matrix)."""
+            return self.matrix.width
+
+        def __len__(self):
+            """:return: same as height."""
+            return self.matrix.width
+
+        def __getitem__(self, key):
+            """
+            Retrieving value of a "cell".
+
+            :param key: (column, row) pair of the view
+            :return: value of the cell
+            """
+            column, row = key
+            return self.matrix[row, column]
+
+        def __setitem__(self, key, value):
+            """
+            Change a value of a "cell".
+
+            :param key: (column, row) pair of the view
+            :param value: new value for cell
+            """
+            column, row = key
+            self.matrix[row, column] = value
+
+        def rows(self):
+            """:return: generator of the rows of the view, which are the columns of the matrix."""
+            return self.matrix.columns()
+
+        def columns(self):
+            """:return: generator of the columns of the view, which are the rows of the matrix."""
+            return self.matrix.rows()
+
+        def transpose(self):
+            """:return: the matrix of this view."""
+            return self.matrix
+
+        def clone(self):
+            """:return: transposed copy as matrix."""
+            matrix = Matrix(self.width, self.height, self.matrix.typecode)
+            for row in self.rows():
+                matrix.Row(row.column, matrix).set(row.get())
+            return matrix
+
+    def __init__(self, width, height, typecode=None):
         """
         Initializing a matrix for given width and height.
 
         :param: width: width of matrix
         :param: height: height of matrix
+        :param: typecode: None for list of rows otherwise the typecode of the
+                          row-major array storing the values (like 'd' or 'q')
         """
         self.width = width
         self.height = height
-        self.data = self.create_data(width, height)
+        self.typecode = typecode
+        # LU decomposition (calculated on demand, reset on each change)
+        self.decomposition = None
+        if typecode is None:
+            self.data = self.create_data(width, height)
+        else:
+            self.data = self.create_flat_data(width, height, typecode)
 
     @staticmethod
     def create_data(width, height):
@@ -220,9 +535,21 @@ class Matrix(object):
             data.append([0] * width)
         return data
 
+    @staticmethod
+    def create_flat_data(width, height, typecode):
+        """
+        Create a row-major array of width x height values initialized with zeroes.
+
+        :param: width: width of matrix
+        :param: height: height of matrix
+        :param: typecode: typecode of the array (like 'd' or 'q')
+        :rtype: array where the value of column c and row r is at r * width + c
+        """
+        return array(typecode, [0]) * (width * height)
+
     def __len__(self):
         """:return: same as height method."""
-        return len(self.data)
+        return self.height
 
     def __setitem__(self, key, value):
         """
@@ -232,7 +559,11 @@ class Matrix(object):
         :param value: new value for cell
         """
         column, row = key
-        self.data[row][column] = value
+        self.decomposition = None
+        if self.typecode is None:
+            self.data[row][column] = value
+        else:
+            self.data[row * self.width + column] = value
 
     def __getitem__(self, key):
         """
@@ -242,7 +573,9 @@ class Matrix(object):
         :return: value of the cell
         """
         column, row = key
-        return self.data[row][column]
+        if self.typecode is None:
+            return self.data[row][column]
+        return self.data[row * self.width + column]
 
     def __delitem__(self, key):
         """
@@ -251,7 +584,7 @@ class Matrix(object):
         :param key: (column, row) pair
         """
         column, row = key
-        self.data[row][column] = 0
+        self[column, row] = 0
 
     def set(self, values):
         """
@@ -260,6 +593,14 @@ class Matrix(object):
         :param: values: list of values
         :return: when successfully assigned list of values
         """
+        self.decomposition = None
+        if self.typecode is not None:
+            for index, value in enumerate(values):
+                if index >= len(self.data):
+                    return False
+                self.data[index] = value
+            return True
+
         row = 0
         column = 0
         for value in values:
@@ -290,12 +631,12 @@ class Matrix(object):
                 yield self.Cell(column, row, self)
 
     def rows(self):
-        """:return: using yield you can iterator over all rows."""
+        """:return: generator of all rows of the matrix."""
         for row in range(self.height):
             yield self.Row(row, self)
 
     def columns(self):
-        """:return: using yield you can iterator over all columns."""
+        """:return: generator of all columns of the matrix."""
         for column in range(self.width):
             yield self.Column(column, self)
 
@@ -311,29 +652,198 @@ class Matrix(object):
         yield self.Diagonal(0, 0, 1, 1, self)
         yield self.Diagonal(0, self.height - 1, 1, -1, self)
 
+    def to_array(self, typecode=None):
+        """
+        Copy of the values row by row.
+
+        :param typecode: typecode of the array (default: the one of this matrix or 'd')
+        :return: array with the value of column c and row r at r * width + c
+        """
+        typecode = typecode or self.typecode or 'd'
+        if self.typecode is None:
+            return array(typecode, [value for row in self.data for value in row])
+        if self.typecode == typecode:
+            values = array(typecode)
+            with memoryview(self.data) as view:
+                values.frombytes(view.cast('B'))
+            return values
+        return array(typecode, self.data)
+
     def clone(self):
         """:return: copy of this instance."""
-        matrix = Matrix(self.width, self.height)
-        for column in range(self.width):
-            for row in range(self.height):
-                matrix[column, row] = self[column, row]
+        if self.typecode is not None:
+            matrix = Matrix(0, 0, self.typecode)
+            matrix.width, matrix.height, matrix.data = self.width, self.height, self.to_array()
+            return matrix
+
+        matrix = Matrix(0, 0)
+        matrix.width, matrix.height, matrix.data = self.width, self.height, [row[:] for row in self.data]
+        return matrix
+
+    def save(self, path, typecode=None):
+        """
+        Save the values in NPY format (readable by numpy.load and Matrix.load).
+
+        The file has a small header (shape and type) followed by the values
+        row by row as little-endian binary data.
+
+        :param path: path and name of the file
+        :param typecode: typecode of the stored values (default: the one of this matrix or 'd')
+        """
+        typecode = typecode or self.typecode or 'd'
+        if typecode not in NPY_TYPES:
+            raise ValueError("typecode %s is not supported by NPY format" % typecode)
+
+        values = self.data if self.typecode == typecode else self.to_array(typecode)
+        if sys.byteorder == 'big':
+            values = self.to_array(typecode)
+            values.byteswap()
+
+        description = NPY_TYPES[typecode]
+        header = "{'descr': '%s%s', 'fortran_order': False, 'shape': (%d, %d), }" \
+            % ('|' if description[1:] == '1' else '<', description, self.height, self.width)
+        # values start at a multiple of 64 bytes (magic, version, length of header, header, newline)
+        header += ' ' * (-(len(NPY_MAGIC) + 4 + len(header) + 1) % 64) + '\n'
+
+        with open(path, 'wb') as stream:
+            stream.write(NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header.encode('latin1'))
+            stream.write(values)
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Load a matrix from a file in NPY format (see save; also two dimensional numpy arrays).
+
+        With mmap the file is mapped into memory: loading is immediate and the values
+        are read by the operating system when used. Changes of the matrix are never
+        written to the file.
+
+        :param path: path and name of the file
+        :param mmap: when False the values are read into an array
+        :return: matrix with the typecode of the stored values
+        """
+        with open(path, 'rb') as stream:
+            if not stream.read(len(NPY_MAGIC)) == NPY_MAGIC:
+                raise ValueError("%s is not a file in NPY format" % path)
+
+            major = stream.read(2)[0]
+            length_format = "<H" if major == 1 else "<I"
+            length = struct.unpack(length_format, stream.read(struct.calcsize(length_format)))[0]
+            header = ast.literal_eval(stream.read(length).decode('latin1'))
+            offset = stream.tell()
+
+            description, shape = header['descr'], header['shape']
+            if description[1:] not in NPY_TYPECODES:
+                raise ValueError("NPY type %s is not supported" % description)
+            if header['fortran_order'] or not len(shape) == 2:
+                raise ValueError("two dimensional values in C order expected")
+
+            matrix = Matrix(0, 0, NPY_TYPECODES[description[1:]])
+            matrix.height, matrix.width = shape
+            size = matrix.width * matrix.height * matrix.data.itemsize
+            if os.fstat(stream.fileno()).st_size < offset + size:
+                raise ValueError("%s has less values than expected" % path)
+
+            swap = description[0] == ('<' if sys.byteorder == 'big' else '>')
+            if mmap and size > 0 and not swap:
+                mapped = memory_map(stream.fileno(), 0, access=ACCESS_COPY)
+                matrix.data = memoryview(mapped)[offset:offset + size].cast(matrix.typecode)
+            else:
+                matrix.data.frombytes(stream.read(size))
+                if swap:
+                    matrix.data.byteswap()
         return matrix
 
+    def transpose(self):
+        """:return: transposed view of this matrix (no copy; see Transposed.clone)."""
+        return self.Transposed(self)
+
+    def apply(self, function, *others):
+        """
+        Change each value to function(value, values of the other matrices at same location).
+
+        No intermediate matrices are created; when all matrices store their values in
+        a row-major array the values are processed as one sequence otherwise row by row.
+
+        :param function: function taking one value of this matrix and one of each other matrix
+        :param others: matrices of same width and height (optional)
+        :return: self (to allow continuous modifications)
+        """
+        for other in others:
+            if not isinstance(other, Matrix):
+                raise TypeError("instance of type Matrix expected, %s given" % type(other))
+            if not (self.width == other.width and self.height == other.height):
+                raise ValueError("matrix %dx%d expected, %dx%d given"
+                                 % (self.width, self.height, other.width, other.height))
+
+        self.decomposition = None
+        if self.typecode is not None and all(other.typecode is not None for other in others):
+            self.data[:] = array(self.typecode, map(function, self.data, *[other.data for other in others]))
+            return self
+
+        other_rows = [list(other.rows()) for other in others]
+        for row in self.rows():
+            row.set(list(map(function, row, *[rows[row.row] for rows in other_rows])))
+        return self
+
+    def map(self, function, *others):
+        """
+        Matrix with function(value, values of the other matrices at same location).
+
+        :param function: function taking one value of this matrix and one of each other matrix
+        :param others: matrices of same width and height (optional)
+        :return: new matrix (same storage as this one)
+        """
+        return self.clone().apply(function, *others)
+
     def __add__(self, other):
         """
         Sum of throw matrices.
 
         :param: other: another matrix
-        :return: sum of two matrices
+        :return: sum of two matrices (NotImplemented for other types; see SparseMatrix.__radd__)
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.map(operator.add, other)
+
+    def __iadd__(self, other):
+        """
+        Add another matrix to this one (in place).
+
+        :param: other: another matrix
+        :return: self
         """
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, Matrix):
             raise TypeError("instance of type Matrix expected, %s given" % type(other))
+        return self.apply(operator.add, other)
 
-        matrix = self.clone()
-        for column in range(self.width):
-            for row in range(self.height):
-                matrix[column, row] += other[column, row]
-        return matrix
+    def __isub__(self, other):
+        """
+        Subtract another matrix from this one (in place).
+
+        :param: other: another matrix
+        :return: self
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError("instance of type Matrix expected, %s given" % type(other))
+        return self.apply(operator.sub, other)
+
+    def __imul__(self, other):
+        """
+        Multiplicate this matrix with a factor (in place) or with another matrix.
+
+        :param other: factor (int or float) or another matrix
+        :return: self when multiplied by a factor otherwise the product
+        """
+        if isinstance(other, (int, float)):
+            if isinstance(other, float) and self.typecode not in (None, 'd', 'f'):
+                # an integer array can't store the products
+                self.data, self.typecode = self.to_array('d'), 'd'
+            return self.apply(lambda value: value * other)
+        if isinstance(other, Matrix):
+            return self * other
+        raise TypeError("int, float or Matrix expected, %s given" % type(other))
 
     def flip(self, vertical, horizontal):
         """
@@ -356,23 +866,251 @@ class Matrix(object):
         Multiplicate this matrix with another or an factor.
 
         :param other: if int or float then a matrix will be returned
-                      with each cell value multiplied by the given factor.
-        :return: matrix if valid otherwise None
+                      with each cell value multiplied by the given factor
+                      (stored as 'd' when an integer array is multiplied by a float).
+        :return: matrix if valid otherwise NotImplemented (see SparseMatrix.__rmul__)
         """
         if isinstance(other, int) or isinstance(other, float):
             matrix = self.clone()
-            for column in range(self.width):
-                for row in range(self.height):
-                    matrix[column, row] *= other
+            matrix *= other
             return matrix
 
         elif isinstance(other, Matrix):
-            matrix = Matrix(other.width, self.height)
-            for row in self.rows():
-                for column in other.columns():
-                    matrix[column.column, row.row] = \
-                        sum([a * b for a, b in zip([cell.get() for cell in row.cells()],
-                                                   [cell.get() for cell in column.cells()])])
+            if not self.width == other.height:
+                raise ValueError("matrix with height %d expected, %d given" % (self.width, other.height))
+            if numpy is not None and self.typecode in NUMPY_TYPECODES \
+                    and other.typecode in NUMPY_TYPECODES:
+                return self.multiply_numpy(other)
+            return self.multiply_blocked(other)
+
+        return NotImplemented
+
+    def product_typecode(self, other):
+        """
+        Storage for the product of this matrix with another.
+
+        :param other: another matrix
+        :return: None (list of rows) when this matrix is stored as list of rows, the typecode
+                 when both have the same otherwise 'd' (values of different types)
+        """
+        if self.typecode is None or self.typecode == other.typecode:
+            return self.typecode
+        return 'd'
+
+    def multiply_cells(self, other):
+        """
+        Multiplicate this matrix with another cell by cell (slow reference implementation).
+
+        :param other: another matrix
+        :return: product of both matrices
+        """
+        matrix = Matrix(other.width, self.height, self.product_typecode(other))
+        for row in self.rows():
+            for column in other.columns():
+                matrix[column.column, row.row] = \
+                    sum([a * b for a, b in zip([cell.get() for cell in row.cells()],
+                                               [cell.get() for cell in column.cells()])])
+        return matrix
+
+    def multiply_blocked(self, other, block_size=BLOCK_SIZE):
+        """
+        Multiplicate this matrix with another using the rows of both (the other one transposed).
+
+        The columns of the other matrix are copied once into sequences; each value of the
+        result is sum(map(operator.mul, row, column)). The result is calculated for
+        block_size columns at a time for all rows.
+
+        :param other: another matrix
+        :param block_size: number of columns of the result calculated together
+        :return: product of both matrices
+        """
+        if self.typecode is None:
+            rows = self.data
+        else:
+            rows = [self.data[row * self.width:(row + 1) * self.width] for row in range(self.height)]
+
+        if other.typecode is None:
+            columns = [list(values) for values in zip(*other.data)]
+        else:
+            columns = [other.data[column::other.width] for column in range(other.width)]
+
+        matrix = Matrix(other.width, self.height, self.product_typecode(other))
+        for first in range(0, other.width, block_size):
+            block = columns[first:first + block_size]
+            for row, values in enumerate(rows):
+                products = [sum(map(operator.mul, values, column)) for column in block]
+                if matrix.typecode is None:
+                    matrix.data[row][first:first + len(block)] = products
+                else:
+                    start = row * matrix.width + first
+                    matrix.data[start:start + len(block)] = array(matrix.typecode, products)
+        return matrix
+
+    def multiply_parallel(self, other, workers=None):
+        """
+        Multiplicate this matrix with another using processes (each for blocks of rows of the result).
+
+        Both matrices are copied once into shared memory (multiprocessing.shared_memory);
+        the worker processes get the names of the memory blocks only (the values are not pickled)
+        and write their rows directly into the shared memory of the result.
+
+        :param other: another matrix
+        :param workers: number of processes (default: number of CPUs)
+        :return: product of both matrices (see product_typecode; 'd' instead of list of rows)
+        """
+        from multiprocessing import shared_memory  # Python 3.8 and newer only
+        if not self.width == other.height:
+            raise ValueError("matrix with height %d expected, %d given" % (self.width, other.height))
+
+        typecode = self.product_typecode(other) or 'd'
+        workers = workers or os.cpu_count() or 1
+        operands = [matrix.data if matrix.typecode == typecode else matrix.to_array(typecode)
+                    for matrix in (self, other)]
+        itemsize = array(typecode).itemsize
+        size = other.width * self.height
+
+        memories = []
+        try:
+            for count in (len(operands[0]), len(operands[1]), size):
+                memories.append(shared_memory.SharedMemory(create=True, size=max(1, count) * itemsize))
+            for memory, values in zip(memories, operands):
+                with memoryview(values) as view:
+                    memory.buf[:len(values) * itemsize] = view.cast('B')
+
+            rows = max(1, -(-self.height // (workers * 4)))
+            blocks = [(first, min(first + rows, self.height)) for first in range(0, self.height, rows)]
+            pool = Pool(workers, init_multiply_worker,
+                        ([memory.name for memory in memories], self.width, other.width, typecode))
+            try:
+                pool.map(multiply_rows, blocks)
+            finally:
+                pool.close()
+                pool.join()
+
+            matrix = Matrix(other.width, self.height, typecode)
+            with memoryview(matrix.data) as view:
+                view.cast('B')[:] = memories[2].buf[:size * itemsize]
+            return matrix
+        finally:
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+    def multiply_numpy(self, other):
+        """
+        Multiplicate this matrix with another using numpy (when installed).
+
+        The values have to fit into the numpy type (int64 for integers).
+
+        :param other: another matrix
+        :return: product of both matrices
+        """
+        if numpy is None:
+            raise ImportError("numpy is required for multiply_numpy")
+
+        product = numpy.dot(numpy.asarray(self.data).reshape(self.height, self.width),
+                            numpy.asarray(other.data).reshape(other.height, other.width))
+        matrix = Matrix(other.width, self.height, self.product_typecode(other))
+        if matrix.typecode is None:
+            matrix.data = product.tolist()
+        else:
+            matrix.data = array(matrix.typecode, product.astype(matrix.typecode).tobytes())
+        return matrix
+
+    def lu_decomposition(self):
+        """
+        LU decomposition with partial pivoting (P * A = L * U) of a square matrix.
+
+        The decomposition is calculated once and kept until the matrix is changed
+        (changing matrix.data directly is not detected).
+
+        :return: tuple of rows (L below the diagonal without its ones, U on and above),
+                 permutation (row of this matrix for each row of the decomposition)
+                 and sign of the permutation (0 when the matrix is singular).
+        """
+        if self.decomposition is not None:
+            return self.decomposition
+        if not self.width == self.height:
+            raise ValueError("square matrix expected, %dx%d given" % (self.width, self.height))
+
+        rows = [[float(value) for value in row.get()] for row in self.rows()]
+        permutation = list(range(self.height))
+        sign = 1
+        # a pivot is zero relative to the biggest value of its row (badly scaled rows are fine)
+        tolerances = [SINGULAR_TOLERANCE * max([abs(value) for value in row] + [0.0]) for row in rows]
+
+        for column in range(self.height):
+            pivot = max(range(column, self.height), key=lambda row: abs(rows[row][column]))
+            if abs(rows[pivot][column]) <= tolerances[permutation[pivot]]:
+                sign = 0
+                continue
+            if not pivot == column:
+                rows[column], rows[pivot] = rows[pivot], rows[column]
+                permutation[column], permutation[pivot] = permutation[pivot], permutation[column]
+                sign = -sign
+
+            pivot_row = rows[column][column + 1:]
+            for row in rows[column + 1:]:
+                factor = row[column] / rows[column][column]
+                row[column] = factor
+                if not factor == 0.0:
+                    row[column + 1:] = [value - factor * pivot_value
+                                        for value, pivot_value in zip(row[column + 1:], pivot_row)]
+
+        self.decomposition = (rows, permutation, sign)
+        return self.decomposition
+
+    def determinant(self):
+        """
+        Determinant of a square matrix (using the LU decomposition).
+
+        :return: determinant (float)
+        """
+        rows, _, sign = self.lu_decomposition()
+        result = float(sign)
+        for index, row in enumerate(rows):
+            result *= row[index]
+        return result
+
+    def solve(self, values):
+        """
+        Solve A * x = b for x (using the LU decomposition; O(n^2) once it's calculated).
+
+        :param values: list of values b (height values) or a matrix with one b per column.
+        :return: list of values x or matrix with one x per column (when values is a matrix)
+        """
+        rows, permutation, sign = self.lu_decomposition()
+        if sign == 0:
+            raise ValueError("matrix is singular")
+
+        if isinstance(values, Matrix):
+            matrix = Matrix(values.width, self.height, None if values.typecode is None else 'd')
+            for column in values.columns():
+                matrix.Column(column.column, matrix).set(self.solve(column.get()))
             return matrix
 
-        return None
+        if not len(values) == self.height:
+            raise ValueError("%d values expected, %d given" % (self.height, len(values)))
+
+        # L * y = P * b (forward) and U * x = y (backward)
+        result = [float(values[index]) for index in permutation]
+        for index, row in enumerate(rows):
+            result[index] -= sum(map(operator.mul, row[:index], result[:index]))
+        for index in reversed(range(self.height)):
+            row = rows[index]
+            result[index] = (result[index] - sum(map(operator.mul, row[index + 1:], result[index + 1:]))) \
+                / row[index]
+        return result
+
+    def inverse(self):
+        """
+        Inverse of a square matrix (using the LU decomposition).
+
+        :return: matrix (typecode 'd' when this one has a typecode)
+        """
+        matrix = Matrix(self.width, self.height, None if self.typecode is None else 'd')
+        for column in range(self.width):
+            values = [0.0] * self.height
+            values[column] = 1.0
+            matrix.Column(column, matrix).set(self.solve(values))
+        return matrix
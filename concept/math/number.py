@@ -30,7 +30,14 @@
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 import math
+from array import array
 from concept.math.factorization import probe
+from concept.primes.wheel_sieve import wheel_sieve
+
+#: bit r is set when r is a square modulo 64 (12 of 64 residues, rejects 81% of the non squares).
+SQUARES_MOD_64 = sum(1 << residue for residue in {n * n % 64 for n in range(64)})
+#: bit r is set when r is a square modulo 63 (16 of 63 residues).
+SQUARES_MOD_63 = sum(1 << residue for residue in {n * n % 63 for n in range(63)})
 
 
 def is_square(value):
@@ -40,11 +47,33 @@ def is_square(value):
     :param value: value to be checked to be a square
     :returns: true when given value is a square.
 
+    The check is exact for integers of any size: most non squares are rejected by
+    looking up the residues modulo 64 and 63 in a bitmask, the rest is decided
+    by the integer square root.
+
     >>> [n for n in range(1, 100+1) if is_square(n)]
     [1, 4, 9, 16, 25, 36, 49, 64, 81, 100]
+    >>> is_square((2**60 + 1)**2), is_square((2**60 + 1)**2 + 1)
+    (True, False)
     """
-    square_root = math.sqrt(value)
-    return square_root == int(square_root)
+    if value < 0 or not (SQUARES_MOD_64 >> (value & 63)) & 1 \
+            or not (SQUARES_MOD_63 >> (value % 63)) & 1:
+        return False
+    square_root = math.isqrt(value)
+    return square_root * square_root == value
+
+
+def square(nth):
+    """
+    Providing n'th square number.
+
+    :param nth: index for n'th square
+    :returns: n'th square number
+
+    >>> square(3)
+    9
+    """
+    return nth * nth
 
 
 def triangle(nth):
@@ -108,8 +137,9 @@ def is_pentagonal(number):
     >>> is_pentagonal(13)
     False
     """
-    value = (math.sqrt(24 * number + 1) + 1) / 6.0
-    return value > 0.0 and value == int(value)
+    if number <= 0 or not is_square(24 * number + 1):
+        return False
+    return math.isqrt(24 * number + 1) % 6 == 5
 
 
 def hexagonal(nth):
@@ -141,14 +171,158 @@ def is_hexagonal(number):
     >>> is_hexagonal(14)
     False
     """
-    value = (math.sqrt(8 * number + 1) + 1) / 4.0
-    return value == int(value)
+    if number <= 0 or not is_square(8 * number + 1):
+        return False
+    return math.isqrt(8 * number + 1) % 4 == 3
+
+
+#: figurate kinds with the function for the n'th number and an estimate
+#: of the index for a given value (might be one too small or too large).
+FIGURATES = (
+    ("square", square, math.isqrt),
+    ("triangle", triangle, lambda value: (math.isqrt(8 * value + 1) - 1) // 2),
+    ("pentagonal", pentagonal, lambda value: (math.isqrt(24 * value + 1) + 1) // 6),
+    ("hexagonal", hexagonal, lambda value: (math.isqrt(8 * value + 1) + 1) // 4),
+)
+
+
+def figurates_between(nth_function, estimate, low, high):
+    """
+    Generating figurate numbers low <= n <= high (starting with index 1).
+
+    The first index is calculated by the integer square root; afterwards
+    only the members of the range are calculated.
+
+    :param nth_function: function providing the n'th figurate number (like triangle).
+    :param estimate: function providing an index near to the one for a value.
+    :param low: minimum value.
+    :param high: maximum value.
+    :returns: generator for the figurate numbers in ascending order.
+
+    >>> list(figurates_between(hexagonal, FIGURATES[3][2], 10, 100))
+    [15, 28, 45, 66, 91]
+    """
+    index = max(1, estimate(max(low, 0)))
+    while index > 1 and nth_function(index - 1) >= low:
+        index -= 1
+    while nth_function(index) < low:
+        index += 1
+
+    value = nth_function(index)
+    while value <= high:
+        yield value
+        index += 1
+        value = nth_function(index)
+
+
+def squares_between(low, high):
+    """
+    Generating square numbers low <= n <= high (1 is the first one).
+
+    >>> list(squares_between(10, 50))
+    [16, 25, 36, 49]
+    """
+    return figurates_between(square, math.isqrt, low, high)
+
+
+def squares_up_to(limit):
+    """
+    Generating square numbers 1 <= n <= limit.
+
+    >>> list(squares_up_to(30))
+    [1, 4, 9, 16, 25]
+    """
+    return squares_between(1, limit)
+
+
+def triangles_between(low, high):
+    """
+    Generating triangle numbers low <= n <= high (1 is the first one).
+
+    >>> list(triangles_between(10, 50))
+    [10, 15, 21, 28, 36, 45]
+    """
+    return figurates_between(triangle, FIGURATES[1][2], low, high)
+
+
+def triangles_up_to(limit):
+    """
+    Generating triangle numbers 1 <= n <= limit.
+
+    >>> list(triangles_up_to(20))
+    [1, 3, 6, 10, 15]
+    """
+    return triangles_between(1, limit)
+
+
+def pentagonals_between(low, high):
+    """
+    Generating pentagonal numbers low <= n <= high (1 is the first one).
+
+    >>> list(pentagonals_between(10, 100))
+    [12, 22, 35, 51, 70, 92]
+    """
+    return figurates_between(pentagonal, FIGURATES[2][2], low, high)
 
 
-def is_abundant(number):
+def pentagonals_up_to(limit):
+    """
+    Generating pentagonal numbers 1 <= n <= limit.
+
+    >>> list(pentagonals_up_to(40))
+    [1, 5, 12, 22, 35]
+    """
+    return pentagonals_between(1, limit)
+
+
+def hexagonals_between(low, high):
+    """
+    Generating hexagonal numbers low <= n <= high (1 is the first one).
+
+    >>> list(hexagonals_between(10, 100))
+    [15, 28, 45, 66, 91]
+    """
+    return figurates_between(hexagonal, FIGURATES[3][2], low, high)
+
+
+def hexagonals_up_to(limit):
+    """
+    Generating hexagonal numbers 1 <= n <= limit.
+
+    >>> list(hexagonals_up_to(50))
+    [1, 6, 15, 28, 45]
+    """
+    return hexagonals_between(1, limit)
+
+
+def classify_range(low, high):
+    """
+    All figurate memberships for the numbers low <= n <= high.
+
+    Instead of testing each number of the range the members of each kind are
+    generated (about sqrt(high) values per kind) and merged.
+
+    :param low: minimum value.
+    :param high: maximum value.
+    :returns: dictionary (ascending by number) of number to list of kinds
+              (square, triangle, pentagonal, hexagonal); other numbers are not contained.
+
+    >>> classify_range(1, 6)
+    {1: ['square', 'triangle', 'pentagonal', 'hexagonal'], 3: ['triangle'], \
+4: ['square'], 5: ['pentagonal'], 6: ['triangle', 'hexagonal']}
+    """
+    memberships = {}
+    for kind, nth_function, estimate in FIGURATES:
+        for value in figurates_between(nth_function, estimate, low, high):
+            memberships.setdefault(value, []).append(kind)
+    return dict(sorted(memberships.items()))
+
+
+def is_abundant(number, sieve=None):
     """
     Check number to be a abundant number; 12 is the first (1+2+3+4+6=16 which is greater than 12).
 
+    :param sieve: optional sieve for fast factorization (see probe).
     :returns: true when the sum of the divisors of the given number is greater as the number
     see http://en.wikipedia.org/wiki/Abundant_number
 
@@ -157,4 +331,128 @@ def is_abundant(number):
     >>> is_abundant(13)
     False
     """
-    return (sum(probe(number)) - number) > number
+    return (sum(probe(number, sieve)) - number) > number
+
+
+def primes_up_to(limit):
+    """
+    Primes required for the number tables.
+
+    :param limit: maximum value.
+    :returns: list of primes <= limit
+    """
+    sieve = wheel_sieve(max(limit, 0))
+    sieve.calculate()
+    return sieve.get_primes()
+
+
+def divisor_sum_table(limit):
+    """
+    Table of sigma(n) (sum of all divisors of n) for 0 <= n <= limit.
+
+    sigma is multiplicative; for each prime power p^k the multiples get the factor
+    1 + p + ... + p^k replacing the factor 1 + p + ... + p^(k-1) of the previous power.
+    That's O(limit log log limit) operations done with slices of the array.
+
+    :param limit: maximum value.
+    :returns: array of sigma(n) (sigma(0) is 0)
+
+    >>> list(divisor_sum_table(12))
+    [0, 1, 3, 4, 7, 6, 12, 8, 15, 13, 18, 12, 28]
+    """
+    table = array('q', [1]) * (limit + 1)
+    table[0] = 0
+    for prime in primes_up_to(limit):
+        power, previous, current = prime, 1, 1 + prime
+        while power <= limit:
+            table[power::power] = array('q', [value // previous * current
+                                              for value in table[power::power]])
+            power *= prime
+            previous, current = current, current * prime + 1
+    return table
+
+
+def divisor_count_table(limit):
+    """
+    Table of the number of divisors of n for 0 <= n <= limit.
+
+    :param limit: maximum value.
+    :returns: array of number of divisors (0 for n=0)
+
+    >>> list(divisor_count_table(12))
+    [0, 1, 2, 2, 3, 2, 4, 2, 4, 3, 4, 2, 6]
+    """
+    table = array('q', [1]) * (limit + 1)
+    table[0] = 0
+    for prime in primes_up_to(limit):
+        power, exponent = prime, 1
+        while power <= limit:
+            table[power::power] = array('q', [value // exponent * (exponent + 1)
+                                              for value in table[power::power]])
+            power *= prime
+            exponent += 1
+    return table
+
+
+def totient_table(limit):
+    """
+    Table of Euler's totient phi(n) for 0 <= n <= limit.
+
+    :param limit: maximum value.
+    :returns: array of phi(n) (phi(0) is 0)
+
+    >>> list(totient_table(12))
+    [0, 1, 1, 2, 2, 4, 2, 6, 4, 6, 4, 10, 4]
+    """
+    table = array('q', range(limit + 1))
+    for prime in primes_up_to(limit):
+        table[prime::prime] = array('q', [value - value // prime for value in table[prime::prime]])
+    return table
+
+
+def mobius_table(limit):
+    """
+    Table of the Moebius function mu(n) for 0 <= n <= limit.
+
+    :param limit: maximum value.
+    :returns: array of mu(n) being -1, 0 or 1 (mu(0) is 0)
+
+    >>> list(mobius_table(12))
+    [0, 1, -1, -1, 0, -1, 1, -1, 0, 0, 1, -1, 0]
+    """
+    table = array('b', [1]) * (limit + 1)
+    table[0] = 0
+    for prime in primes_up_to(limit):
+        table[prime::prime] = array('b', [-value for value in table[prime::prime]])
+        square = prime * prime
+        if square <= limit:
+            table[square::square] = array('b', [0]) * len(range(square, limit + 1, square))
+    return table
+
+
+def abundant_numbers(limit):
+    """
+    All abundant numbers up to limit (using divisor_sum_table).
+
+    :param limit: maximum value.
+    :returns: list of numbers n <= limit with sigma(n) > 2n
+
+    >>> abundant_numbers(40)
+    [12, 18, 20, 24, 30, 36, 40]
+    """
+    table = divisor_sum_table(limit)
+    return [number for number in range(1, limit + 1) if table[number] > 2 * number]
+
+
+def perfect_numbers(limit):
+    """
+    All perfect numbers up to limit (using divisor_sum_table).
+
+    :param limit: maximum value.
+    :returns: list of numbers n <= limit with sigma(n) == 2n
+
+    >>> perfect_numbers(10000)
+    [6, 28, 496, 8128]
+    """
+    table = divisor_sum_table(limit)
+    return [number for number in range(1, limit + 1) if table[number] == 2 * number]
@@ -29,7 +29,9 @@
    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
-from concept.math.vector import Vector2d
+import operator
+from array import array
+from concept.math.vector import Vector2d, Array2d, Vector2dArray
 from concept.errors.exceptions import UnsupportedOperation
 
 
@@ -80,3 +82,44 @@ class Point2d(object):
         if isinstance(other, Point2d):
             return abs(self.x - other.x) < 1e-10 and abs(self.y - other.y) < 1e-10
         return False
+
+
+class Point2dArray(Array2d):
+    """
+    Many 2d points stored as struct of arrays (see Array2d).
+
+    >>> points = Point2dArray([1, 2], [1, 3])
+    >>> points + Vector2d(1, 0)
+    Point2dArray([Point2d(x=2, y=1), Point2d(x=3, y=3)])
+    >>> points - Point2d(1, 1)
+    Vector2dArray([Vector2d(x=0, y=0), Vector2d(x=1, y=2)])
+    """
+
+    item_type = Point2d
+
+    def __sub__(self, other):
+        """:returns: vectors between the points (other: points) or translated points (other: vectors)."""
+        if isinstance(other, (Point2d, Point2dArray)):
+            vectors = Vector2dArray(array('d', self.x), array('d', self.y))
+            return vectors.combine(other, operator.isub)
+        if isinstance(other, (Vector2d, Vector2dArray)):
+            return self.clone().combine(other, operator.isub)
+        raise UnsupportedOperation("operation points-points or points-vectors allowed only")
+
+    def __isub__(self, other):
+        """Subtract 2d vectors (or one vector) to translate current points."""
+        if isinstance(other, (Vector2d, Vector2dArray)):
+            return self.combine(other, operator.isub)
+        raise UnsupportedOperation("operation points-=vectors allowed only")
+
+    def __add__(self, other):
+        """Add 2d vectors (or one vector) to get other points."""
+        if isinstance(other, (Vector2d, Vector2dArray)):
+            return self.clone().combine(other, operator.iadd)
+        raise UnsupportedOperation("operation points+vectors allowed only")
+
+    def __iadd__(self, other):
+        """Add 2d vectors (or one vector) to translate current points."""
+        if isinstance(other, (Vector2d, Vector2dArray)):
+            return self.combine(other, operator.iadd)
+        raise UnsupportedOperation("operation points+=vectors allowed only")
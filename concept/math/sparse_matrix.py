@@ -0,0 +1,413 @@
+"""
+   Representation of a sparse mathematical matrix.
+
+.. module:: sparse_matrix
+    :platform: Unix, Windows
+    :synopis: matrix storing the non zero values only
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+from array import array
+from concept.math.matrix import Matrix
+
+
+class SparseMatrix(object):
+    """
+    Matrix of dimensions w x h storing the non zero values only.
+
+    Values are changed in a dictionary of (column, row) to value (coordinate form);
+    for calculation compressed sparse rows (CSR) and compressed sparse columns (CSC)
+    are created on demand and kept until the next change.
+
+    >>> matrix = SparseMatrix(3, 2)
+    >>> matrix[2, 1] = 5
+    >>> [row.get() for row in matrix.rows()]
+    [[0, 0, 0], [0, 0, 5]]
+    """
+
+    class Row(object):
+        """represent one row of the sparse matrix."""
+
+        __slots__ = ("row", "matrix")
+
+        def __init__(self, row, matrix):
+            """initializing row location."""
+            self.row = row
+            self.matrix = matrix
+
+        def items(self):
+            """:return: list of (column, value) for the non zero values of the row."""
+            offsets, columns, values = self.matrix.csr()
+            first, last = offsets[self.row], offsets[self.row + 1]
+            return list(zip(columns[first:last], values[first:last]))
+
+        def get(self):
+            """:return: copy of the values of the row (including zeroes)."""
+            values = [0] * self.matrix.width
+            for column, value in self.items():
+                values[column] = value
+            return values
+
+        def set(self, values):
+            """changing values of the row."""
+            for column in range(self.matrix.width):
+                self.matrix[column, self.row] = values[column]
+
+        def cells(self):
+            """
+            Iterating over each cell of the row of the matrix.
+
+            :return: cell (by cell)
+            """
+            for column in range(self.matrix.width):
+                yield Matrix.Cell(column, self.row, self.matrix)
+
+    class Column(object):
+        """represent one column of the sparse matrix."""
+
+        __slots__ = ("column", "matrix")
+
+        def __init__(self, column, matrix):
+            """initializing column location."""
+            self.column = column
+            self.matrix = matrix
+
+        def items(self):
+            """:return: list of (row, value) for the non zero values of the column."""
+            offsets, rows, values = self.matrix.csc()
+            first, last = offsets[self.column], offsets[self.column + 1]
+            return list(zip(rows[first:last], values[first:last]))
+
+        def get(self):
+            """:return: copy of the values of the column (including zeroes)."""
+            values = [0] * self.matrix.height
+            for row, value in self.items():
+                values[row] = value
+            return values
+
+        def set(self, values):
+            """changing values of the column."""
+            for row in range(self.matrix.height):
+                self.matrix[self.column, row] = values[row]
+
+        def cells(self):
+            """
+            Iterating over each cell of the column of the matrix.
+
+            :return: cell (by cell)
+            """
+            for row in range(self.matrix.height):
+                yield Matrix.Cell(self.column, row, self.matrix)
+
+    def __init__(self, width, height):
+        """
+        Initializing a sparse matrix for given width and height (all values zero).
+
+        :param: width: width of matrix
+        :param: height: height of matrix
+        """
+        self.width = width
+        self.height = height
+        self.entries = {}
+        self.compressed_rows = None
+        self.compressed_columns = None
+
+    @staticmethod
+    def from_matrix(matrix):
+        """
+        Create sparse matrix from the non zero values of a (dense) matrix.
+
+        :param matrix: instance of Matrix
+        :return: sparse matrix
+        """
+        sparse = SparseMatrix(matrix.width, matrix.height)
+        for row in matrix.rows():
+            for column, value in enumerate(row.get()):
+                if value != 0:
+                    sparse.entries[column, row.row] = value
+        return sparse
+
+    def to_matrix(self, typecode=None):
+        """
+        Create (dense) matrix with the values of this one.
+
+        :param typecode: storage of the matrix (see Matrix)
+        :return: instance of Matrix
+        """
+        matrix = Matrix(self.width, self.height, typecode)
+        for (column, row), value in self.entries.items():
+            matrix[column, row] = value
+        return matrix
+
+    def __len__(self):
+        """:return: height of the matrix."""
+        return self.height
+
+    def __setitem__(self, key, value):
+        """
+        Change a value of a "cell" (zero removes the entry).
+
+        :param key: (column, row) pair
+        :param value: new value for cell
+        """
+        column, row = key
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            raise IndexError("cell (%d, %d) outside of matrix %dx%d" % (column, row, self.width, self.height))
+
+        if value == 0:
+            self.entries.pop((column, row), None)
+        else:
+            self.entries[column, row] = value
+        self.compressed_rows = None
+        self.compressed_columns = None
+
+    def __getitem__(self, key):
+        """
+        Retrieving value of a "cell".
+
+        :param key: (column, row) pair
+        :return: value of the cell (0 when not stored)
+        """
+        column, row = key
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            raise IndexError("cell (%d, %d) outside of matrix %dx%d" % (column, row, self.width, self.height))
+        return self.entries.get((column, row), 0)
+
+    def __delitem__(self, key):
+        """
+        Reset the cell value to "0".
+
+        :param key: (column, row) pair
+        """
+        self[key] = 0
+
+    def __repr__(self):
+        """:return: string representation of this class."""
+        return "SparseMatrix(%dx%d:" % (self.width, self.height) \
+               + ",".join("(%d,%d)=%s" % (column, row, self.entries[column, row])
+                          for row, column in sorted((row, column) for column, row in self.entries)) + ")"
+
+    def count_nonzero(self):
+        """:return: number of stored (non zero) values."""
+        return len(self.entries)
+
+    def csr(self):
+        """
+        Compressed sparse rows (created on demand).
+
+        :return: tuple of offsets (height + 1), columns and values where the values
+                 of row r are at offsets[r] <= index < offsets[r + 1].
+        """
+        if self.compressed_rows is None:
+            self.compressed_rows = self.compress(
+                (((row, column), value) for (column, row), value in self.entries.items()), self.height)
+        return self.compressed_rows
+
+    def csc(self):
+        """
+        Compressed sparse columns (created on demand).
+
+        :return: tuple of offsets (width + 1), rows and values where the values
+                 of column c are at offsets[c] <= index < offsets[c + 1].
+        """
+        if self.compressed_columns is None:
+            self.compressed_columns = self.compress(self.entries.items(), self.width)
+        return self.compressed_columns
+
+    @staticmethod
+    def compress(entries, size):
+        """
+        Sort entries by major and minor index and compress the major index.
+
+        :param entries: iterable of ((major, minor), value)
+        :param size: number of major indices (height for rows, width for columns)
+        :return: tuple of offsets (size + 1), minor indices and values
+
+        >>> SparseMatrix.compress([((1, 0), 5), ((0, 2), 7), ((1, 1), 6)], 3)
+        (array('q', [0, 1, 3, 3]), array('q', [2, 0, 1]), [7, 5, 6])
+        """
+        entries = sorted(entries)
+        offsets = [0] * (size + 1)
+        for (major, minor), value in entries:
+            offsets[major + 1] += 1
+        for index in range(size):
+            offsets[index + 1] += offsets[index]
+        return (array('q', offsets), array('q', [minor for (major, minor), value in entries]),
+                [value for key, value in entries])
+
+    def cells(self):
+        """
+        Iterating over each cell of the matrix.
+
+        :return: cell (by cell)
+        """
+        for column in range(self.width):
+            for row in range(self.height):
+                yield Matrix.Cell(column, row, self)
+
+    def rows(self):
+        """:return: using yield you can iterator over all rows."""
+        for row in range(self.height):
+            yield self.Row(row, self)
+
+    def columns(self):
+        """:return: using yield you can iterator over all columns."""
+        for column in range(self.width):
+            yield self.Column(column, self)
+
+    def __add__(self, other):
+        """
+        Sum of two matrices.
+
+        :param other: sparse matrix (result is sparse) or matrix (result is dense; see product_typecode)
+        :return: sum of both matrices (NotImplemented for other types)
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if not (self.width == other.width and self.height == other.height):
+            raise ValueError("matrix %dx%d expected, %dx%d given"
+                             % (self.width, self.height, other.width, other.height))
+
+        if isinstance(other, Matrix):
+            typecode = self.product_typecode(other)
+            if typecode == other.typecode:
+                matrix = other.clone()
+            else:
+                matrix = Matrix(other.width, other.height, typecode)
+                matrix.data = other.to_array(typecode)
+            for (column, row), value in self.entries.items():
+                matrix[column, row] += value
+            return matrix
+
+        matrix = SparseMatrix(self.width, self.height)
+        matrix.entries = dict(self.entries)
+        for key, value in other.entries.items():
+            total = matrix.entries.get(key, 0) + value
+            if total == 0:
+                matrix.entries.pop(key, None)
+            else:
+                matrix.entries[key] = total
+        return matrix
+
+    def __radd__(self, other):
+        """
+        Sum of a matrix with this one (like matrix + sparse matrix).
+
+        :param other: matrix
+        :return: sum of both matrices (dense) or NotImplemented for other types
+        """
+        if isinstance(other, Matrix):
+            return self + other
+        return NotImplemented
+
+    def product_typecode(self, other):
+        """
+        Storage for the product or the sum of this matrix with a dense one.
+
+        :param other: matrix
+        :return: typecode of the other matrix when it can store the results
+                 (list of rows, float values or all values of this matrix are integers)
+                 otherwise 'd'
+        """
+        if other.typecode in (None, 'd', 'f') \
+                or all(isinstance(value, int) for value in self.entries.values()):
+            return other.typecode
+        return 'd'
+
+    def __mul__(self, other):
+        """
+        Multiplicate this matrix with another or an factor.
+
+        Only the non zero values of this matrix (and of the other when sparse) are used.
+
+        :param other: factor (int or float), sparse matrix (result is sparse)
+                      or matrix (result is dense; see product_typecode).
+        :return: matrix if valid otherwise NotImplemented
+        """
+        if isinstance(other, (int, float)):
+            matrix = SparseMatrix(self.width, self.height)
+            if other != 0:
+                matrix.entries = {key: value * other for key, value in self.entries.items()}
+            return matrix
+
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if not self.width == other.height:
+            raise ValueError("matrix with height %d expected, %d given" % (self.width, other.height))
+
+        offsets, columns, values = self.csr()
+        if isinstance(other, Matrix):
+            other_rows = [row.get() for row in other.rows()]
+            matrix = Matrix(other.width, self.height, self.product_typecode(other))
+            for row in range(self.height):
+                if offsets[row] == offsets[row + 1]:
+                    continue
+                products = [0] * other.width
+                for index in range(offsets[row], offsets[row + 1]):
+                    factor, source = values[index], other_rows[columns[index]]
+                    products = [total + factor * value for total, value in zip(products, source)]
+                matrix.Row(row, matrix).set(products)
+            return matrix
+
+        other_offsets, other_columns, other_values = other.csr()
+        matrix = SparseMatrix(other.width, self.height)
+        for row in range(self.height):
+            products = {}
+            for index in range(offsets[row], offsets[row + 1]):
+                factor, middle = values[index], columns[index]
+                for other_index in range(other_offsets[middle], other_offsets[middle + 1]):
+                    column = other_columns[other_index]
+                    products[column] = products.get(column, 0) + factor * other_values[other_index]
+            for column, value in products.items():
+                if value != 0:
+                    matrix.entries[column, row] = value
+        return matrix
+
+    def __rmul__(self, other):
+        """
+        Multiplicate a factor or a matrix with this matrix (like 2 * matrix).
+
+        :param other: factor (int or float) or matrix (result is dense; see product_typecode)
+        :return: matrix if valid otherwise NotImplemented
+        """
+        if isinstance(other, (int, float)):
+            return self * other
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if not other.width == self.height:
+            raise ValueError("matrix with width %d expected, %d given" % (self.height, other.width))
+
+        # each value of a row of the other matrix times the row of this matrix
+        offsets, columns, values = self.csr()
+        matrix = Matrix(self.width, other.height, self.product_typecode(other))
+        for row in other.rows():
+            products = [0] * self.width
+            for middle, factor in enumerate(row):
+                if factor == 0:
+                    continue
+                for index in range(offsets[middle], offsets[middle + 1]):
+                    products[columns[index]] += factor * values[index]
+            matrix.Row(row.row, matrix).set(products)
+        return matrix
@@ -30,6 +30,14 @@
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 import math
+import operator
+from array import array
+from itertools import repeat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Vector2d(object):
@@ -192,3 +200,291 @@ class Vector2d(object):
         if isinstance(other, Vector2d):
             return self.scalar_product(other) == 0
         return False
+
+
+class Array2d(object):
+    """
+    Base of containers of many 2d items stored as struct of arrays.
+
+    The x and y values are stored in two columns (array of 'd' or a memoryview on it
+    for a slice) instead of one object per item. Bulk operations work on the columns
+    (with numpy when installed, without copying the values).
+    """
+
+    #: class of one item (created by __getitem__ and to_list).
+    item_type = Vector2d
+
+    def __init__(self, x=(), y=()):
+        """
+        Initialize container.
+
+        :param x: x values (a memoryview is used without copy)
+        :param y: y values (a memoryview is used without copy)
+        """
+        self.x = x if isinstance(x, memoryview) else array('d', x)
+        self.y = y if isinstance(y, memoryview) else array('d', y)
+        if not len(self.x) == len(self.y):
+            raise ValueError("same number of x and y values expected, %d and %d given"
+                             % (len(self.x), len(self.y)))
+
+    @classmethod
+    def from_list(cls, items):
+        """
+        Create container from items.
+
+        :param items: list of items (with x and y attribute)
+        :return: new container
+        """
+        return cls([item.x for item in items], [item.y for item in items])
+
+    def to_list(self):
+        """:return: list of items (see item_type)."""
+        return [self.item_type(x, y) for x, y in zip(self.x, self.y)]
+
+    def __len__(self):
+        """:return: number of items."""
+        return len(self.x)
+
+    def __iter__(self):
+        """:return: iterator over the items (see item_type)."""
+        return (self.item_type(x, y) for x, y in zip(self.x, self.y))
+
+    def __getitem__(self, index):
+        """
+        Get item or slice.
+
+        :param index: index or slice
+        :return: item (copy) or container of same type (view without copy)
+        """
+        if isinstance(index, slice):
+            return self.__class__(memoryview(self.x)[index], memoryview(self.y)[index])
+        return self.item_type(self.x[index], self.y[index])
+
+    def __setitem__(self, index, item):
+        """
+        Change one item or a slice.
+
+        A slice is written in place from the columns of the other container; when
+        those are the same values (like after ``items[1:3] += vector``) nothing is copied.
+
+        :param index: index of the item or slice
+        :param item: item with x and y attribute or container (slice)
+        """
+        if not isinstance(index, slice):
+            self.x[index], self.y[index] = item.x, item.y
+            return
+
+        if not isinstance(item, Array2d):
+            raise TypeError("instance of type Array2d expected, %s given" % type(item))
+        count = len(range(*index.indices(len(self))))
+        if not len(item) == count:
+            raise ValueError("%d items expected, %d given" % (count, len(item)))
+        for column, values in ((self.x, item.x), (self.y, item.y)):
+            target = memoryview(column)[index]
+            if not self.same_values(target, values):
+                target[:] = values if isinstance(values, memoryview) else memoryview(values)
+
+    @staticmethod
+    def same_values(target, values):
+        """
+        Check for two columns being the same memory.
+
+        :param target: memoryview of a column
+        :param values: memoryview or array of a column
+        :return: True when both start at the same address with the same step
+                 (known with numpy only; otherwise False)
+        """
+        if numpy is None:
+            return False
+        target_interface = numpy.asarray(target).__array_interface__
+        values_interface = numpy.asarray(values).__array_interface__
+        return all(target_interface[key] == values_interface[key] for key in ('data', 'shape', 'strides'))
+
+    def __repr__(self):
+        """:returns: String representation of the container."""
+        return "%s(%s)" % (self.__class__.__name__, self.to_list())
+
+    def __eq__(self, other):
+        """Comparing all items to be equal."""
+        if isinstance(other, self.__class__) and len(self) == len(other):
+            return all(abs(a - b) < 1e-10 for a, b in zip(self.x, other.x)) \
+                and all(abs(a - b) < 1e-10 for a, b in zip(self.y, other.y))
+        return False
+
+    def clone(self):
+        """:return: container of same type with a copy of the values."""
+        return self.__class__(array('d', self.x), array('d', self.y))
+
+    def columns(self, other):
+        """
+        Values of another container or of a single item (for each item of this container).
+
+        :param other: container with same number of items or item with x and y attribute
+        :return: tuple of x and y values (numpy arrays or floats when numpy is installed)
+        """
+        if isinstance(other, Array2d):
+            if not len(other) == len(self):
+                raise ValueError("%d items expected, %d given" % (len(self), len(other)))
+            if numpy is not None:
+                return numpy.asarray(other.x), numpy.asarray(other.y)
+            return other.x, other.y
+        if numpy is not None:
+            return other.x, other.y
+        return repeat(other.x), repeat(other.y)
+
+    def combine(self, other, function):
+        """
+        Change the values to function(value, value of other) in place.
+
+        :param other: container with same number of items or item with x and y attribute
+        :param function: in place operator like operator.iadd (for numpy arrays and floats)
+        :return: self
+        """
+        other_x, other_y = self.columns(other)
+        if numpy is not None:
+            function(numpy.asarray(self.x), other_x)
+            function(numpy.asarray(self.y), other_y)
+        else:
+            self.x[:] = array('d', map(function, self.x, other_x))
+            self.y[:] = array('d', map(function, self.y, other_y))
+        return self
+
+
+class Vector2dArray(Array2d):
+    """
+    Many 2d vectors stored as struct of arrays (see Array2d).
+
+    >>> vectors = Vector2dArray([3, 1], [4, 0])
+    >>> vectors + Vector2d(1, 1)
+    Vector2dArray([Vector2d(x=4, y=5), Vector2d(x=2, y=1)])
+    >>> vectors.length().tolist()
+    [5.0, 1.0]
+    >>> vectors.scalar_product(Vector2d(1, 2)).tolist()
+    [11.0, 1.0]
+    >>> vectors[1:].scaled(2)
+    Vector2dArray([Vector2d(x=2, y=0)])
+    """
+
+    def __add__(self, other):
+        """:return: new vectors with sum of vectors (other: vectors or one vector)."""
+        return self.clone().combine(other, operator.iadd)
+
+    def __iadd__(self, other):
+        """Add vectors (or one vector) to the vectors in place."""
+        return self.combine(other, operator.iadd)
+
+    def __sub__(self, other):
+        """:return: new vectors with difference of vectors (other: vectors or one vector)."""
+        return self.clone().combine(other, operator.isub)
+
+    def __isub__(self, other):
+        """Subtract vectors (or one vector) from the vectors in place."""
+        return self.combine(other, operator.isub)
+
+    def __neg__(self):
+        """:return: new vectors multiplicated with -1."""
+        return self.scaled(-1.0)
+
+    def scalar_product(self, other):
+        """
+        Scalar (dot) product of each vector.
+
+        :param other: vectors (same number) or one vector
+        :return: array of scalar products
+        """
+        other_x, other_y = self.columns(other)
+        if numpy is not None:
+            return array('d', (numpy.asarray(self.x) * other_x + numpy.asarray(self.y) * other_y).tobytes())
+        return array('d', map(lambda x, y, a, b: x * a + y * b, self.x, self.y, other_x, other_y))
+
+    def cross_product(self, other):
+        """
+        Cross product of each vector.
+
+        :param other: vectors (same number) or one vector
+        :return: array of cross products
+        """
+        other_x, other_y = self.columns(other)
+        if numpy is not None:
+            return array('d', (numpy.asarray(self.x) * other_y - numpy.asarray(self.y) * other_x).tobytes())
+        return array('d', map(lambda x, y, a, b: x * b - y * a, self.x, self.y, other_x, other_y))
+
+    def length(self):
+        """:returns: array of the length of each vector."""
+        if numpy is not None:
+            return array('d', numpy.hypot(numpy.asarray(self.x), numpy.asarray(self.y)).tobytes())
+        return array('d', map(math.hypot, self.x, self.y))
+
+    def scale(self, factor):
+        """
+        Scale the vectors in place.
+
+        :param factor: integer or float value expected
+        :return: self
+        """
+        if numpy is not None:
+            numpy.asarray(self.x)[:] *= factor
+            numpy.asarray(self.y)[:] *= factor
+        else:
+            self.x[:] = array('d', [x * factor for x in self.x])
+            self.y[:] = array('d', [y * factor for y in self.y])
+        return self
+
+    def scaled(self, factor):
+        """
+        Provide scaled vectors by given factor; current vectors will not be changed.
+
+        :param factor: integer or float value expected
+        :return: new vectors
+        """
+        return self.clone().scale(factor)
+
+    def normalize(self):
+        """
+        Change the vectors in place to a length of 1.
+
+        :return: self
+        """
+        lengths = self.length()
+        if not all(lengths):
+            raise ZeroDivisionError("vector of length 0 can't be normalized")
+        if numpy is not None:
+            numpy.asarray(self.x)[:] /= numpy.asarray(lengths)
+            numpy.asarray(self.y)[:] /= numpy.asarray(lengths)
+        else:
+            self.x[:] = array('d', map(operator.truediv, self.x, lengths))
+            self.y[:] = array('d', map(operator.truediv, self.y, lengths))
+        return self
+
+    def normalized(self):
+        """:return: new vectors with a length of 1."""
+        return self.clone().normalize()
+
+    def rotate(self, rotation_angle):
+        """
+        Rotate the vectors in place.
+
+        :param rotation_angle: angle to use for rotation (unit: rad)
+        :return: self
+        """
+        cos, sin = math.cos(rotation_angle), math.sin(rotation_angle)
+        if numpy is not None:
+            x, y = numpy.asarray(self.x), numpy.asarray(self.y)
+            rotated_x = x * cos - y * sin
+            y *= cos
+            y += x * sin
+            x[:] = rotated_x
+        else:
+            rotated_x = array('d', [x * cos - y * sin for x, y in zip(self.x, self.y)])
+            self.y[:] = array('d', [x * sin + y * cos for x, y in zip(self.x, self.y)])
+            self.x[:] = rotated_x
+        return self
+
+    def rotated(self, rotation_angle):
+        """
+        Provide vectors rotated by given angle.
+
+        :param rotation_angle: angle to use for rotation (unit: rad)
+        :returns: new vectors
+        """
+        return self.clone().rotate(rotation_angle)
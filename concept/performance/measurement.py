@@ -30,6 +30,7 @@
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 import time
+import tracemalloc
 
 
 def track_duration_of(function, *args, **kwargs):
@@ -44,3 +45,34 @@ def track_duration_of(function, *args, **kwargs):
     start = time.time()
     function(*args, **kwargs)
     return time.time() - start
+
+
+def track_durations_of(function, repeats=3, warmup=1):
+    """
+    Track execution time of a function several times.
+
+    :param function: function to measure (without parameters)
+    :param repeats: number of measured runs
+    :param warmup: number of runs before measuring (not measured)
+    :returns: list of durations in seconds (float)
+    """
+    for _ in range(warmup):
+        function()
+    return [track_duration_of(function) for _ in range(repeats)]
+
+
+def track_peak_memory_of(function, *args, **kwargs):
+    """
+    Track the peak of memory allocated (by Python) while executing a function.
+
+    :param function: function to measure
+    :param args: single value arguments
+    :param wkargs: key/value arguments
+    :returns: peak memory in bytes (int)
+    """
+    tracemalloc.start()
+    try:
+        function(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,152 @@
+"""
+   Benchmark for the prime sieves.
+
+.. module:: benchmark
+    :platform: Unix, Windows
+    :synopis: comparing sieves by time and memory (JSON results)
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import sys
+import json
+import platform
+from functools import partial
+from concept.performance.measurement import track_durations_of, track_peak_memory_of
+from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
+from concept.primes.sieve_of_eratosthenes_optimized import sieve_of_eratosthenes_optimized
+from concept.primes.segmented_sieve import segmented_sieve
+from concept.primes.wheel_sieve import wheel_sieve
+
+#: default sizes (maximum value of a sieve) for the benchmark.
+SIZES = tuple(10 ** exponent for exponent in range(4, 10))
+#: name, sieve class, function counting the primes of a calculated sieve and maximum size
+#: (bigger sizes are skipped for a sieve to avoid running out of memory).
+SIEVES = (("default", sieve_of_eratosthenes, lambda sieve: len(sieve.get_primes()), 10 ** 7),
+          ("optimized", sieve_of_eratosthenes_optimized,
+           lambda sieve: len(sieve.get_primes()), 10 ** 8),
+          ("segmented", segmented_sieve, lambda sieve: len(sieve.get_primes()), 10 ** 8),
+          ("wheel", wheel_sieve, lambda sieve: sieve.count_primes(), 10 ** 9))
+
+
+def create_sieve(sieve_class, size, keep):
+    """
+    Creating and calculating a sieve.
+
+    :param sieve_class: class of the sieve.
+    :param size: maximum value for the sieve.
+    :param keep: list where the calculated sieve is stored (former one is released first).
+    """
+    del keep[:]
+    sieve = sieve_class(size)
+    sieve.calculate()
+    keep.append(sieve)
+
+
+def run_benchmark(sizes=SIZES, sieves=SIEVES, repeats=3, warmup=1):
+    """
+    Running each sieve for each size.
+
+    Measured is the creation and the calculation of a sieve; the number of
+    primes is taken afterwards from the last run. The peak memory is measured
+    in an additional run (tracing memory allocations slows down the run).
+
+    :param sizes: list of maximum values for the sieves.
+    :param sieves: list of (name, sieve class, count function, maximum size).
+    :param repeats: number of measured runs per sieve and size.
+    :param warmup: number of runs before measuring.
+    :returns: dictionary with environment information and a list of results.
+    """
+    results = []
+    for name, sieve_class, count, max_size in sieves:
+        for size in sizes:
+            if size > max_size:
+                continue
+
+            keep = []
+            run = partial(create_sieve, sieve_class, size, keep)
+            durations = track_durations_of(run, repeats, warmup)
+            primes = count(keep.pop())
+            peak_memory = track_peak_memory_of(run)
+            del keep[:]
+
+            results.append({"sieve": name, "size": size, "primes": primes,
+                            "best": min(durations), "mean": sum(durations) / len(durations),
+                            "peak_memory": peak_memory,
+                            "primes_per_second": primes / max(min(durations), 1e-9)})
+
+    return {"python": sys.version.replace("\n", ""), "platform": platform.platform(),
+            "repeats": repeats, "warmup": warmup, "results": results}
+
+
+def save_results(path, results):
+    """
+    Saving benchmark results as JSON.
+
+    :param path: path and filename of JSON file.
+    :param results: results as provided by run_benchmark.
+    """
+    with open(path, "w") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """
+    Loading benchmark results from JSON.
+
+    :param path: path and filename of JSON file.
+    :returns: results as provided by run_benchmark.
+    """
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def compare_results(results, baseline, tolerance=0.1):
+    """
+    Comparing results with a baseline.
+
+    :param results: current results as provided by run_benchmark.
+    :param baseline: former results as provided by run_benchmark.
+    :param tolerance: accepted relative increase of best time and peak memory.
+    :returns: list of regressions (dictionaries with sieve, size, metric, baseline and current).
+
+    >>> baseline = {"results": [{"sieve": "wheel", "size": 10, "best": 1.0, "peak_memory": 100}]}
+    >>> current = {"results": [{"sieve": "wheel", "size": 10, "best": 1.5, "peak_memory": 105}]}
+    >>> compare_results(current, baseline) == [
+    ...     {"sieve": "wheel", "size": 10, "metric": "best", "baseline": 1.0, "current": 1.5}]
+    True
+    """
+    known = dict(((entry["sieve"], entry["size"]), entry) for entry in baseline["results"])
+    regressions = []
+    for entry in results["results"]:
+        former = known.get((entry["sieve"], entry["size"]))
+        if former is None:
+            continue
+
+        for metric in ("best", "peak_memory"):
+            if entry[metric] > former[metric] * (1.0 + tolerance):
+                regressions.append({"sieve": entry["sieve"], "size": entry["size"],
+                                    "metric": metric, "baseline": former[metric],
+                                    "current": entry[metric]})
+    return regressions
@@ -0,0 +1,142 @@
+"""
+   Prime sieve growing on demand.
+
+.. module:: extensible_sieve
+    :platform: Unix, Windows
+    :synopis: prime sieve remembering and extending its results
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import bisect
+import threading
+from array import array
+from concept.primes.range_sieve import range_sieve
+
+#: process wide sieve (created by first call of shared_sieve).
+SHARED_SIEVE = None
+#: lock for creating the process wide sieve once only.
+SHARED_SIEVE_LOCK = threading.Lock()
+
+
+class extensible_sieve(object):
+    """
+    Prime sieve which remembers its primes and extends itself when required.
+
+    Queries below the known maximum are lookups (binary search in the primes).
+    A query beyond sieves the new range only; the maximum is at least doubled
+    so slowly growing queries cause a logarithmic number of extensions.
+
+    >>> sieve = extensible_sieve(10)
+    >>> sieve.get_primes()
+    [2, 3, 5, 7]
+    >>> sieve.is_prime(97), sieve.max_n
+    (True, 97)
+    >>> sieve.get_primes(20)
+    [2, 3, 5, 7, 11, 13, 17, 19]
+    """
+
+    def __init__(self, max_n=1000):
+        """
+        Initialize sieve with primes up to given maximum.
+
+        :param max_n: initial maximum value.
+        """
+        self.max_n = 1
+        self.primes = array('Q')
+        self.window = range_sieve()
+        self.lock = threading.Lock()
+        self.extend(max_n)
+
+    def extend(self, max_n):
+        """
+        Sieving the range (max_n of the sieve, max_n] when not yet known.
+
+        :param max_n: required maximum value.
+        """
+        if max_n <= self.max_n:
+            return
+
+        with self.lock:
+            if max_n > self.max_n:
+                new_max_n = max(max_n, 2 * self.max_n)
+                self.primes.extend(self.window.primes_between(self.max_n + 1, new_max_n))
+                self.max_n = new_max_n
+
+    def calculate(self):
+        """Nothing to do; the sieve calculates on demand (for compatibility with other sieves)."""
+
+    def get_primes(self, max_n=None):
+        """
+        Get primes.
+
+        :param max_n: maximum value (default: maximum value known by the sieve).
+        :returns: list of primes <= max_n
+        """
+        if max_n is None:
+            return self.primes.tolist()
+
+        self.extend(max_n)
+        return self.primes[:bisect.bisect_right(self.primes, max_n)].tolist()
+
+    def count_primes(self, max_n):
+        """
+        Count primes.
+
+        :param max_n: maximum value.
+        :returns: number of primes <= max_n
+        """
+        self.extend(max_n)
+        return bisect.bisect_right(self.primes, max_n)
+
+    def is_prime(self, value):
+        """
+        Checking value to be a prime.
+
+        :param value: value to be checked to be a prime.
+        :returns: True when given number is a prime.
+        """
+        self.extend(value)
+        index = bisect.bisect_left(self.primes, value)
+        return index < len(self.primes) and self.primes[index] == value
+
+
+def shared_sieve(max_n=None):
+    """
+    Process wide extensible sieve (same instance for all calls).
+
+    :param max_n: maximum value the sieve is extended to (optional).
+    :returns: extensible sieve
+
+    >>> shared_sieve() is shared_sieve(5000)
+    True
+    """
+    global SHARED_SIEVE  # pylint: disable=global-statement
+    if SHARED_SIEVE is None:
+        with SHARED_SIEVE_LOCK:
+            if SHARED_SIEVE is None:
+                SHARED_SIEVE = extensible_sieve()
+    if max_n is not None:
+        SHARED_SIEVE.extend(max_n)
+    return SHARED_SIEVE
@@ -0,0 +1,134 @@
+"""
+   Smallest prime factor sieve.
+
+.. module:: factor_sieve
+    :platform: Unix, Windows
+    :synopis: table of smallest prime factors for fast factorization
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import math
+from array import array
+from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
+
+
+class factor_sieve(object):
+    """
+    Sieve providing the smallest prime factor for each value up to max_n.
+
+    The table is an array of unsigned integers (4 bytes per value). Once
+    calculated each value can be factorized in O(log n) by repeatedly
+    dividing by its smallest prime factor.
+
+    >>> sieve = factor_sieve(100)
+    >>> sieve.calculate()
+    >>> sieve.factorize(84)
+    {2: 2, 3: 1, 7: 1}
+    >>> [sieve.smallest_prime_factor(n) for n in (2, 9, 35, 97)]
+    [2, 3, 5, 97]
+    """
+
+    def __init__(self, max_n):
+        """
+        Initialize sieve with each value being its own smallest prime factor.
+
+        :param max_n: maximum value for the table.
+        """
+        self.max_n = max_n
+        self.table = array('I', range(max_n + 1))
+
+    def calculate(self):
+        """
+        Calculate the smallest prime factors.
+
+        Unlike a linear (Euler) sieve which visits each value in a Python loop
+        the multiples of each prime p (starting at p*p) are assigned with one slice
+        assignment. The primes are processed in descending order so the smallest
+        prime factor is the one written last.
+        """
+        limit = math.isqrt(self.max_n)
+        sieve = sieve_of_eratosthenes(max(limit, 2))
+        sieve.calculate()
+        for prime in reversed([prime for prime in sieve.get_primes() if prime <= limit]):
+            start = prime * prime
+            self.table[start::prime] = array('I', [prime]) * len(range(start, self.max_n + 1, prime))
+
+    def get_primes(self):
+        """
+        Get all primes.
+
+        :returns: list of primes
+        """
+        return [value for value in range(2, self.max_n + 1) if self.table[value] == value]
+
+    def is_prime(self, value):
+        """
+        Checking table for value.
+
+        :param value: value to be checked to be a prime.
+        :returns: True when given number is a prime.
+        """
+        return value >= 2 and self.table[value] == value
+
+    def smallest_prime_factor(self, value):
+        """
+        Smallest prime factor of value.
+
+        :param value: value >= 2 (and <= max_n).
+        :returns: smallest prime factor
+        """
+        return self.table[value]
+
+    def factorize(self, value):
+        """
+        Prime factorization of a value.
+
+        :param value: value >= 1 (and <= max_n).
+        :returns: dictionary with prime as key and exponent as value (ascending primes).
+        """
+        factors = {}
+        while value > 1:
+            prime = self.table[value]
+            exponent = 0
+            while value % prime == 0:
+                value //= prime
+                exponent += 1
+            factors[prime] = exponent
+        return factors
+
+    def factorize_many(self, values):
+        """
+        Prime factorization of many values.
+
+        :param values: iterable of values (like a range).
+        :returns: list of dictionaries with prime as key and exponent as value.
+
+        >>> sieve = factor_sieve(20)
+        >>> sieve.calculate()
+        >>> sieve.factorize_many(range(10, 13))
+        [{2: 1, 5: 1}, {11: 1}, {2: 2, 3: 1}]
+        """
+        factorize = self.factorize
+        return [factorize(value) for value in values]
@@ -30,14 +30,70 @@
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 import math
+from concept.primes.wheel_sieve import wheel_sieve
+
+#: primes used for trial division before running the probable prime tests.
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67,
+                71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139,
+                149, 151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223,
+                227, 229, 233, 239, 241, 251)
+#: values below this limit are primes when not divisible by one of the small primes.
+SMALL_LIMIT = 257 * 257
+#: (limit, witnesses): Miller-Rabin with those witnesses is deterministic for values < limit.
+WITNESSES = ((2047, (2,)),
+             (1373653, (2, 3)),
+             (25326001, (2, 3, 5)),
+             (3215031751, (2, 3, 5, 7)),
+             (3474749660383, (2, 3, 5, 7, 11, 13)),
+             (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+             (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+             (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)))
+#: is_prime_many uses a sieve when the largest value is not above this limit.
+SIEVE_LIMIT = 1 << 24
 
 
 def is_prime(value):
     """
     A number is a prime when it is divisible only by itself and 1.
 
+    Trial division by small primes is done first; then Miller-Rabin with fixed
+    witnesses (deterministic below 3.18 * 10^23 which covers all 64 bit values)
+    or the Baillie-PSW test for bigger values.
+
+    :param value: any number to be checked to be a prime.
+    :returns: True when given number is a prime.
+
+    >>> [n for n in range(20) if is_prime(n)]
+    [2, 3, 5, 7, 11, 13, 17, 19]
+    >>> is_prime(2 ** 61 - 1), is_prime(2 ** 89 - 1), is_prime(2 ** 89 + 1)
+    (True, True, False)
+    """
+    if value < 2:
+        return False
+
+    for prime in SMALL_PRIMES:
+        if value % prime == 0:
+            return value == prime
+
+    if value < SMALL_LIMIT:
+        return True
+
+    for limit, witnesses in WITNESSES:
+        if value < limit:
+            return miller_rabin(value, witnesses)
+
+    return miller_rabin(value, (2,)) and is_strong_lucas_probable_prime(value)
+
+
+def is_prime_trial_division(value):
+    """
+    Checking for a prime by trial division with odd divisors up to the square root.
+
     :param value: any number to be checked to be a prime.
     :returns: True when given number is a prime.
+
+    >>> [n for n in range(20) if is_prime_trial_division(n)]
+    [2, 3, 5, 7, 11, 13, 17, 19]
     """
     if value < 2:
         return False
@@ -45,9 +101,139 @@ def is_prime(value):
     if value % 2 == 0:
         return value == 2
 
-    limit = int(math.sqrt(value)) + 1
-    for divisor in range(3, limit + 1, 2):
+    for divisor in range(3, math.isqrt(value) + 1, 2):
         if value % divisor == 0:
             return False
 
     return True
+
+
+def is_prime_many(values):
+    """
+    Checking many values to be a prime.
+
+    When all values are small enough one sieve up to the largest value
+    is calculated and all values are looked up; otherwise each value
+    is checked with is_prime.
+
+    :param values: iterable of numbers to be checked to be a prime.
+    :returns: list of booleans (True for a prime) in the order of the values.
+
+    >>> is_prime_many([1, 2, 9, 97, 2 ** 61 - 1])
+    [False, True, False, True, True]
+    """
+    values = list(values)
+    # negative values are no primes (and no sieve is required for them)
+    maximum = max(max(values) if values else 0, 0)
+    if maximum <= SIEVE_LIMIT and len(values) > math.isqrt(maximum):
+        sieve = wheel_sieve(maximum)
+        sieve.calculate()
+        return [value >= 0 and sieve.is_prime(value) for value in values]
+    return [is_prime(value) for value in values]
+
+
+def miller_rabin(value, witnesses):
+    """
+    Strong probable prime test (Miller-Rabin) for given witnesses.
+
+    :param value: odd number > 2 to be checked.
+    :param witnesses: bases for the test.
+    :returns: False when value is composite, True when value is a strong
+              probable prime for all witnesses.
+
+    >>> miller_rabin(2047, (2,)), miller_rabin(2047, (3,))
+    (True, False)
+    """
+    exponent, shift = value - 1, 0
+    while exponent % 2 == 0:
+        exponent //= 2
+        shift += 1
+
+    for witness in witnesses:
+        witness %= value
+        if witness == 0:
+            continue
+
+        power = pow(witness, exponent, value)
+        if power == 1 or power == value - 1:
+            continue
+
+        for _ in range(shift - 1):
+            power = power * power % value
+            if power == value - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def is_strong_lucas_probable_prime(value):
+    """
+    Strong Lucas probable prime test with parameters chosen by Selfridge (method A).
+
+    :param value: odd number > 2 (not a square) to be checked.
+    :returns: False when value is composite otherwise True.
+
+    >>> is_strong_lucas_probable_prime(5459), is_strong_lucas_probable_prime(5461)
+    (True, False)
+    """
+    if math.isqrt(value) ** 2 == value:
+        return False
+
+    discriminant = 5
+    while jacobi(discriminant, value) != -1:
+        if jacobi(discriminant, value) == 0 and abs(discriminant) != value:
+            return False
+        discriminant = -discriminant - 2 if discriminant > 0 else -discriminant + 2
+    q_value = (1 - discriminant) // 4
+
+    exponent, shift = value + 1, 0
+    while exponent % 2 == 0:
+        exponent //= 2
+        shift += 1
+
+    # binary Lucas chain calculating U(exponent), V(exponent) and Q^exponent
+    u_value, v_value, q_power = 1, 1, q_value % value
+    for bit in bin(exponent)[3:]:
+        u_value, v_value = u_value * v_value % value, (v_value * v_value - 2 * q_power) % value
+        q_power = q_power * q_power % value
+        if bit == "1":
+            u_value, v_value = u_value + v_value, discriminant * u_value + v_value
+            u_value = (u_value + value if u_value % 2 else u_value) // 2 % value
+            v_value = (v_value + value if v_value % 2 else v_value) // 2 % value
+            q_power = q_power * q_value % value
+
+    if u_value == 0 or v_value == 0:
+        return True
+
+    for _ in range(shift - 1):
+        v_value = (v_value * v_value - 2 * q_power) % value
+        q_power = q_power * q_power % value
+        if v_value == 0:
+            return True
+
+    return False
+
+
+def jacobi(numerator, denominator):
+    """
+    Jacobi symbol (numerator/denominator) for odd positive denominator.
+
+    :returns: -1, 0 or 1
+
+    >>> jacobi(5, 21), jacobi(2, 7), jacobi(3, 9)
+    (1, 1, 0)
+    """
+    numerator %= denominator
+    result = 1
+    while numerator != 0:
+        while numerator % 2 == 0:
+            numerator //= 2
+            if denominator % 8 in (3, 5):
+                result = -result
+        numerator, denominator = denominator, numerator
+        if numerator % 4 == 3 and denominator % 4 == 3:
+            result = -result
+        numerator %= denominator
+    return result if denominator == 1 else 0
@@ -0,0 +1,83 @@
+"""
+   Counting primes without enumerating them.
+
+.. module:: prime_count
+    :platform: Unix, Windows
+    :synopis: sublinear prime counting function pi(x)
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import math
+from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
+
+
+def prime_count(value):
+    """
+    Number of primes <= value (pi(x)) using the algorithm of Lucy_Hedgehog.
+
+    For each v of the form value // i the count S(v) of numbers in [2, v] not
+    being struck out is maintained. Sieving by prime p (p*p <= v) changes it by
+    S(v) -= S(v // p) - S(p - 1). Only the 2*sqrt(value) different values of
+    value // i are required which results in O(value^(3/4)) operations and
+    O(sqrt(value)) memory. The primes up to the square root are taken from
+    a sieve of eratosthenes.
+
+    :param value: maximum value for counting primes.
+    :returns: number of primes <= value.
+
+    >>> [prime_count(n) for n in range(11)]
+    [0, 0, 1, 2, 2, 3, 3, 4, 4, 4, 4]
+    >>> prime_count(10 ** 9)
+    50847534
+    """
+    if value < 2:
+        return 0
+
+    root = math.isqrt(value)
+    # small[v] = S(v) for v <= root and large[i] = S(value // i) for i <= root
+    small = [max(number - 1, 0) for number in range(root + 1)]
+    large = [0] + [value // index - 1 for index in range(1, root + 1)]
+
+    sieve = sieve_of_eratosthenes(max(root, 2))
+    sieve.calculate()
+    for prime in sieve.get_primes():
+        if prime > root:
+            break
+
+        count = small[prime - 1]
+        square = prime * prime
+        limit = min(root, value // square)
+        border = min(limit, root // prime)
+
+        # value // (index * prime) is in large for index * prime <= root, else in small
+        large[1:border + 1] = [number - other + count for number, other in
+                               zip(large[1:border + 1], large[prime:border * prime + 1:prime])]
+        quotient = value // prime
+        large[border + 1:limit + 1] = [large[index] - small[quotient // index] + count
+                                       for index in range(border + 1, limit + 1)]
+        small[square:] = [small[number] - small[number // prime] + count
+                          for number in range(square, root + 1)]
+
+    return large[1]
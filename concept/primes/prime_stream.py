@@ -0,0 +1,101 @@
+"""
+   Compact binary format for primes.
+
+.. module:: prime_stream
+    :platform: Unix, Windows
+    :synopis: writing and reading primes as delta encoded varints
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+#: file identification (and format version).
+MAGIC = b"PRIMVAR1"
+#: number of bytes written or read at once.
+CHUNK_SIZE = 1 << 16
+
+
+def write_primes_binary(stream, primes, chunk_size=CHUNK_SIZE):
+    """
+    Writing primes as differences to the previous prime (varint encoded).
+
+    Each difference is stored with 7 bits per byte (least significant first);
+    the highest bit is set when more bytes follow. Most differences fit into one byte.
+
+    :param stream: binary stream (file opened with "wb" or sys.stdout.buffer).
+    :param primes: iterable of primes in ascending order.
+    :param chunk_size: number of bytes collected before writing them.
+    :returns: number of written primes.
+    """
+    stream.write(MAGIC)
+    buffer = bytearray()
+    previous, count = 0, 0
+    for prime in primes:
+        delta = prime - previous
+        while delta >= 0x80:
+            buffer.append(0x80 | (delta & 0x7f))
+            delta >>= 7
+        buffer.append(delta)
+        previous = prime
+        count += 1
+        if len(buffer) >= chunk_size:
+            stream.write(buffer)
+            del buffer[:]
+    stream.write(buffer)
+    return count
+
+
+def read_primes_binary(stream, chunk_size=CHUNK_SIZE):
+    """
+    Reading primes written by write_primes_binary.
+
+    :param stream: binary stream (file opened with "rb" or sys.stdin.buffer).
+    :param chunk_size: number of bytes read at once.
+    :returns: generator providing the primes.
+
+    >>> import io
+    >>> stream = io.BytesIO()
+    >>> write_primes_binary(stream, [2, 3, 5, 7, 1000003])
+    5
+    >>> list(read_primes_binary(io.BytesIO(stream.getvalue())))
+    [2, 3, 5, 7, 1000003]
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("stream does not contain primes in binary format")
+
+    previous, delta, shift = 0, 0, 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        for value in bytearray(chunk):
+            delta |= (value & 0x7f) << shift
+            if value & 0x80:
+                shift += 7
+                continue
+            previous += delta
+            delta, shift = 0, 0
+            yield previous
+
+    if shift > 0:
+        raise ValueError("stream with primes in binary format is truncated")
@@ -0,0 +1,184 @@
+"""
+   Persistent prime table (memory mapped).
+
+.. module:: prime_table
+    :platform: Unix, Windows
+    :synopis: storing a sieve in a file for fast prime queries
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import sys
+import bisect
+import mmap
+import struct
+from concept.primes.wheel_sieve import WHEEL, WHEEL_BIT, WHEEL_OFFSETS, POPCOUNT
+
+#: file identification (and format version).
+MAGIC = b"PRIMTBL1"
+#: header: magic, maximum value, block size (bytes), number of blocks.
+HEADER = struct.Struct("<8sQQQ")
+#: default number of sieve bytes (30 integers each) per block of the count index.
+BLOCK_SIZE = 4096
+#: for each residue modulo 30 the bits of the wheel residues <= that residue.
+WHEEL_MASK = tuple(sum(1 << bit for bit in range(8) if WHEEL[bit] <= residue)
+                   for residue in range(30))
+
+
+def write_prime_table(path, sieve, block_size=BLOCK_SIZE):
+    """
+    Writing a calculated wheel sieve into a file.
+
+    The file contains a header, the cumulative count of the primes (> 5)
+    before each block (little endian 64 bit) and then the sieve bytes.
+
+    :param path: path and filename of the prime table.
+    :param sieve: calculated instance of wheel_sieve.
+    :param block_size: number of sieve bytes per entry in the count index.
+    """
+    blocks = (len(sieve.sieve) + block_size - 1) // block_size
+    counts, count = [0], 0
+    for block in range(blocks):
+        count += sum(sieve.sieve[block * block_size:(block + 1) * block_size].translate(POPCOUNT))
+        counts.append(count)
+
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, sieve.max_n, block_size, blocks))
+        handle.write(struct.pack("<%dQ" % len(counts), *counts))
+        handle.write(sieve.sieve)
+
+
+class prime_table(object):
+    """
+    Prime queries on a file written by write_prime_table.
+
+    The file is memory mapped (read only); the operating system pages in the
+    parts being used and shares them between processes reading the same file.
+    """
+
+    def __init__(self, path):
+        """
+        Open prime table.
+
+        :param path: path and filename of the prime table.
+        """
+        with open(path, "rb") as handle:
+            self.mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.max_n, self.block_size, self.blocks = HEADER.unpack_from(self.mapping)
+        if magic != MAGIC:
+            self.mapping.close()
+            raise ValueError("%s is not a prime table" % path)
+
+        offset = HEADER.size
+        self.offset = offset + 8 * (self.blocks + 1)
+        # memoryviews on the mapping (released on close)
+        self.views = []
+        if sys.byteorder == 'little':
+            # view on the count index in the mapping (not copied into each process)
+            mapping_view = memoryview(self.mapping)
+            index_view = mapping_view[offset:self.offset]
+            self.counts = index_view.cast('Q')
+            self.views = [self.counts, index_view, mapping_view]
+        else:
+            self.counts = struct.unpack_from("<%dQ" % (self.blocks + 1), self.mapping, offset)
+
+    def __enter__(self):
+        """:returns: the prime table itself."""
+        return self
+
+    def __exit__(self, *args):
+        """Closing the prime table."""
+        self.close()
+
+    def close(self):
+        """Closing the memory mapping (without reference counting all views must be released first)."""
+        for view in self.views:
+            view.release()
+        self.mapping.close()
+
+    def check(self, value):
+        """
+        Ensure that value is covered by the prime table.
+
+        :param value: value to be checked.
+        """
+        if value > self.max_n:
+            raise ValueError("%d exceeds maximum %d of prime table" % (value, self.max_n))
+
+    def is_prime(self, value):
+        """
+        Checking a value to be a prime in O(1).
+
+        :param value: value to be checked (<= max_n).
+        :returns: True when given number is a prime.
+        """
+        self.check(value)
+        if value < 7:
+            return value in (2, 3, 5)
+
+        bit = WHEEL_BIT[value % 30]
+        return bit >= 0 and (self.mapping[self.offset + value // 30] >> bit) & 1 == 1
+
+    def prime_count(self, value):
+        """
+        Number of primes <= value (pi(x)) reading one block at most.
+
+        :param value: value (<= max_n).
+        :returns: number of primes <= value.
+        """
+        self.check(value)
+        if value < 7:
+            return sum(1 for prime in (2, 3, 5) if prime <= value)
+
+        index = value // 30
+        block = index // self.block_size
+        start = self.offset + block * self.block_size
+        count = 3 + self.counts[block] + sum(
+            self.mapping[start:self.offset + index].translate(POPCOUNT))
+        return count + POPCOUNT[self.mapping[self.offset + index] & WHEEL_MASK[value % 30]]
+
+    def nth_prime(self, nth):
+        """
+        Providing the n'th prime (binary search in the block index).
+
+        :param nth: index of prime (1 for the first prime which is 2).
+        :returns: n'th prime.
+        """
+        if nth < 1 or nth > self.prime_count(self.max_n):
+            raise ValueError("there is no %d. prime in prime table" % nth)
+
+        if nth <= 3:
+            return (2, 3, 5)[nth - 1]
+
+        nth -= 3
+        block = bisect.bisect_left(self.counts, nth) - 1
+        remaining = nth - self.counts[block]
+        index = block * self.block_size
+        while True:
+            value = self.mapping[self.offset + index]
+            if POPCOUNT[value] >= remaining:
+                return 30 * index + WHEEL_OFFSETS[value][remaining - 1]
+            remaining -= POPCOUNT[value]
+            index += 1
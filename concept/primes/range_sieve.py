@@ -0,0 +1,126 @@
+"""
+   Sieving primes in an arbitrary window.
+
+.. module:: range_sieve
+    :platform: Unix, Windows
+    :synopis: sieving primes in [low, high] only
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import math
+from itertools import compress
+from concept.primes.segmented_sieve import SEGMENT_SIZE, base_primes, iter_segments
+
+
+class range_sieve(object):
+    """
+    Prime sieve for windows [low, high] at any offset.
+
+    Only the window itself is sieved (using the base primes up to the square root
+    of high) so the costs depend on the window width and not on high. The base primes
+    and the window buffer are kept for further queries.
+
+    >>> sieve = range_sieve()
+    >>> sieve.primes_between(10 ** 12, 10 ** 12 + 100)
+    [1000000000039, 1000000000061, 1000000000063, 1000000000091]
+    >>> sieve.count_between(100, 200)
+    21
+    """
+
+    def __init__(self, window_size=SEGMENT_SIZE):
+        """
+        Initialize range sieve.
+
+        :param window_size: number of odd values sieved at once (size of reused buffer).
+        """
+        self.window = bytearray(window_size)
+        self.primes = []
+        self.limit = 1
+
+    def get_base_primes(self, high):
+        """
+        Providing odd base primes up to (at least) square root of high.
+
+        The base primes are calculated for twice the required limit
+        so a slowly growing high does not recalculate them each time.
+
+        :param high: maximum value of a window.
+        :returns: list of odd primes.
+        """
+        root = math.isqrt(max(high, 0))
+        if root > self.limit:
+            self.limit = 2 * root
+            self.primes = base_primes(self.limit)
+        return self.primes
+
+    def iter_segments(self, low, high):
+        """
+        Sieving the window in segments of the reused window buffer.
+
+        :param low: minimum value (inclusive).
+        :param high: maximum value (inclusive).
+        :returns: generator of (first, size, segment) as provided by segmented_sieve.iter_segments.
+        """
+        return iter_segments(low, high, self.get_base_primes(high), len(self.window), self.window)
+
+    def primes_between(self, low, high):
+        """
+        Providing primes of a window.
+
+        :param low: minimum value (inclusive).
+        :param high: maximum value (inclusive).
+        :returns: list of primes in [low, high]
+        """
+        primes = [2] if low <= 2 <= high else []
+        for first, size, segment in self.iter_segments(low, high):
+            primes.extend(compress(range(first, first + 2 * size, 2), segment))
+        return primes
+
+    def count_between(self, low, high):
+        """
+        Counting primes of a window.
+
+        :param low: minimum value (inclusive).
+        :param high: maximum value (inclusive).
+        :returns: number of primes in [low, high]
+        """
+        count = 1 if low <= 2 <= high else 0
+        for _, size, segment in self.iter_segments(low, high):
+            count += segment.count(1, 0, size)
+        return count
+
+
+def primes_between(low, high):
+    """
+    Providing primes of a window [low, high].
+
+    :param low: minimum value (inclusive).
+    :param high: maximum value (inclusive).
+    :returns: list of primes in [low, high]
+
+    >>> primes_between(90, 110)
+    [97, 101, 103, 107, 109]
+    """
+    return range_sieve().primes_between(low, high)
@@ -30,53 +30,257 @@
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 import math
+from array import array
+from itertools import compress
+from multiprocessing import Pool
 from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
 
+#: default number of odd values per segment (32 KiB bytearray fits into the L1/L2 cache).
+SEGMENT_SIZE = 1 << 15
+
+
+def base_primes(limit):
+    """
+    Odd primes up to given limit used for striking out the segments.
+
+    :param limit: maximum value for the base primes (usually the square root of the maximum).
+    :returns: list of odd primes <= limit
+
+    >>> base_primes(20)
+    [3, 5, 7, 11, 13, 17, 19]
+    """
+    sieve = sieve_of_eratosthenes(max(limit, 2))
+    sieve.calculate()
+    return [prime for prime in sieve.get_primes()[1:] if prime <= limit]
+
+
+def iter_primes(low, high, segment_size=SEGMENT_SIZE):
+    """
+    Generating primes in [low, high] lazily segment by segment.
+
+    The base primes (up to square root of high) are calculated first.
+
+    :param low: minimum value (inclusive).
+    :param high: maximum value (inclusive).
+    :param segment_size: number of odd values sieved at once.
+    :returns: generator providing the primes in ascending order.
+
+    >>> list(iter_primes(90, 130))
+    [97, 101, 103, 107, 109, 113, 127]
+    >>> list(iter_primes(0, 10, segment_size=2))
+    [2, 3, 5, 7]
+    """
+    return sieve_range(low, high, base_primes(math.isqrt(max(high, 0))), segment_size)
+
+
+def sieve_range(low, high, primes, segment_size=SEGMENT_SIZE):
+    """
+    Generating primes in [low, high] lazily using already known base primes.
+
+    :param low: minimum value (inclusive).
+    :param high: maximum value (inclusive).
+    :param primes: odd primes in ascending order up to (at least) square root of high.
+    :param segment_size: number of odd values sieved at once.
+    :returns: generator providing the primes in ascending order.
+    """
+    if low <= 2 <= high:
+        yield 2
+
+    for first, size, segment in iter_segments(low, high, primes, segment_size):
+        for prime in compress(range(first, first + 2 * size, 2), segment):
+            yield prime
+
+
+def count_range(low, high, primes, segment_size=SEGMENT_SIZE):
+    """
+    Counting primes in [low, high] using already known base primes.
+
+    :param low: minimum value (inclusive).
+    :param high: maximum value (inclusive).
+    :param primes: odd primes in ascending order up to (at least) square root of high.
+    :param segment_size: number of odd values sieved at once.
+    :returns: number of primes in [low, high]
+
+    >>> count_range(0, 100, base_primes(10))
+    25
+    """
+    count = 1 if low <= 2 <= high else 0
+    for _, size, segment in iter_segments(low, high, primes, segment_size):
+        count += segment.count(1, 0, size)
+    return count
+
+
+def iter_segments(low, high, primes, segment_size=SEGMENT_SIZE, segment=None):
+    """
+    Sieving the odd values >= 3 in [low, high] segment by segment.
+
+    One bytearray (one byte per odd value) is reused for all segments. Each base
+    prime remembers the offset of its next odd multiple so no division is required
+    when moving to the next segment. Base primes being larger than the segment
+    hit a segment once at most; they are kept in buckets per segment and visited
+    only for the segments they really hit.
+
+    :param low: minimum value (inclusive).
+    :param high: maximum value (inclusive).
+    :param primes: odd primes in ascending order up to (at least) square root of high.
+    :param segment_size: number of odd values sieved at once.
+    :param segment: optional bytearray (of segment_size bytes) to be used for the segments.
+    :returns: generator providing (first, size, segment) where segment[i] is 1 when
+              first + 2 * i is a prime (for i < size); the segment is reused.
+    """
+    first = max(3, low) | 1
+    if first > high:
+        return
+
+    small_primes, small_offsets, buckets = [], [], {}
+    for prime in primes:
+        if prime * prime > high:
+            break
+        multiple = max(prime * prime, (first + prime - 1) // prime * prime)
+        if multiple % 2 == 0:
+            multiple += prime
+        offset = (multiple - first) // 2
+        if prime < segment_size:
+            small_primes.append(prime)
+            small_offsets.append(offset)
+        else:
+            buckets.setdefault(offset // segment_size, []).append((prime, offset % segment_size))
+
+    ones = b"\x01" * segment_size
+    zeros = memoryview(bytes(segment_size))
+    segment = bytearray(segment_size) if segment is None else segment
+    index = 0
+    while first <= high:
+        segment[:] = ones
+        for position, prime in enumerate(small_primes):
+            offset = small_offsets[position]
+            if offset < segment_size:
+                count = (segment_size - 1 - offset) // prime + 1
+                segment[offset::prime] = zeros[:count]
+                offset += count * prime
+            small_offsets[position] = offset - segment_size
+
+        for prime, offset in buckets.pop(index, ()):
+            segment[offset] = 0
+            offset += prime
+            buckets.setdefault(index + offset // segment_size, []).append(
+                (prime, offset % segment_size))
+
+        yield first, min(segment_size, (high - first) // 2 + 1), segment
+        first += 2 * segment_size
+        index += 1
+
+
+#: base primes of a worker process (see init_worker).
+WORKER_PRIMES = []
+#: segment size of a worker process (see init_worker).
+WORKER_SEGMENT_SIZE = SEGMENT_SIZE
+
+
+def init_worker(primes, segment_size):
+    """
+    Initializing a worker process with the base primes (transferred once per process).
+
+    :param primes: odd base primes.
+    :param segment_size: number of odd values sieved at once.
+    """
+    global WORKER_PRIMES, WORKER_SEGMENT_SIZE  # pylint: disable=global-statement
+    WORKER_PRIMES = primes
+    WORKER_SEGMENT_SIZE = segment_size
+
+
+def sieve_block(block):
+    """
+    Sieving one block in a worker process.
+
+    :param block: tuple (low, high) with inclusive limits.
+    :returns: array of primes in the block
+    """
+    low, high = block
+    return array('Q', sieve_range(low, high, WORKER_PRIMES, WORKER_SEGMENT_SIZE))
+
+
+def count_block(block):
+    """
+    Counting primes of one block in a worker process.
+
+    :param block: tuple (low, high) with inclusive limits.
+    :returns: number of primes in the block
+    """
+    low, high = block
+    return count_range(low, high, WORKER_PRIMES, WORKER_SEGMENT_SIZE)
+
 
 class segmented_sieve(object):
     """Segmented prime sieve."""
 
-    def __init__(self, max_n):
-        """initializing sieve for given maximum value."""
+    def __init__(self, max_n, segment_size=SEGMENT_SIZE, workers=1):
+        """
+        initializing sieve for given maximum value.
+
+        :param max_n: maximum value to be checked to be a prime.
+        :param segment_size: number of odd values sieved at once.
+        :param workers: number of processes (1: sieving in current process).
+        """
         self.max_n = max_n
-        self.initial_limit = int(math.sqrt(max_n))
-        self.sieve = sieve_of_eratosthenes(self.initial_limit)
+        self.segment_size = segment_size
+        self.workers = workers
         self.primes = []
 
+    def get_blocks(self):
+        """
+        Splitting [2, max_n] into blocks of whole segments for the worker processes.
+
+        :returns: list of (low, high) tuples with inclusive limits.
+        """
+        span = 2 * self.segment_size
+        block_size = max(1, self.max_n // (span * self.workers * 4)) * span
+        return [(low, min(low + block_size - 1, self.max_n))
+                for low in range(0, self.max_n + 1, block_size)]
+
+    def run_parallel(self, function):
+        """
+        Running a block function in a process pool with base primes computed once.
+
+        :param function: module function taking a block (sieve_block or count_block).
+        :returns: results per block in the order of the blocks.
+        """
+        primes = base_primes(math.isqrt(self.max_n))
+        pool = Pool(self.workers, init_worker, (primes, self.segment_size))
+        try:
+            return pool.map(function, self.get_blocks())
+        finally:
+            pool.close()
+            pool.join()
+
     def calculate(self):
-        """calculating all primes."""
-        # calculating primes up to to square root of maximum number
-        self.sieve.calculate()
-        self.primes = [2] + [n for n in range(3, self.initial_limit + 1, 2) if self.sieve.is_prime(n)]
-
-        segment_size = max(10, (self.max_n - self.initial_limit) // 10)
-        other_primes = []
-
-        low = self.initial_limit
-        high = min(low + segment_size, self.max_n)
-        current = low
-
-        while low < high:
-            # TODO: the creation of the segment ... can this be done before loop?
-            # (compare creation vs. initialization performance!!!)
-            segment = [True] * (high - low + 1)
-            for prime in self.primes:
-                current = low
-                remainder = current % prime
-                if remainder > 0:
-                    current = low - remainder + prime
-                while current <= high:
-                    # TODO: -low .... can be improved by doing it before loop?
-                    segment[current - low] = False
-                    current += prime
-
-            # TODO: question: is a loop better than using range? (check performance!!!)
-            other_primes += [n for n in range(low, high + 1) if segment[n - low]]
-
-            low = high + 1
-            high = min(low + segment_size, self.max_n)
-
-        self.primes.extend(other_primes)
+        """calculating all primes (segment by segment)."""
+        if self.workers > 1 and self.max_n >= 2:
+            self.primes = []
+            for primes in self.run_parallel(sieve_block):
+                self.primes.extend(primes)
+        else:
+            self.primes = list(iter_primes(2, self.max_n, self.segment_size))
+
+    def count_primes(self):
+        """
+        Counting primes without storing them.
+
+        :returns: number of primes <= max_n
+        """
+        if self.workers > 1 and self.max_n >= 2:
+            return sum(self.run_parallel(count_block))
+        return count_range(2, self.max_n, base_primes(math.isqrt(max(self.max_n, 0))),
+                           self.segment_size)
+
+    def iter_primes(self, low=2):
+        """
+        Generating primes lazily without keeping them.
+
+        :param low: minimum value (inclusive).
+        :returns: generator providing primes in [low, max_n]
+        """
+        return iter_primes(low, self.max_n, self.segment_size)
 
     def get_primes(self):
         """
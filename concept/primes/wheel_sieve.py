@@ -0,0 +1,138 @@
+"""
+   Creating prime sieve (bit-packed mod-30 wheel).
+
+.. module:: wheel_sieve
+    :platform: Unix, Windows
+    :synopis: creating prime sieve with low memory footprint
+
+.. moduleauthor:: Thomas Lehmann <thomas.lehmann.private@googlemail.com>
+
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import math
+from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
+
+#: the eight residues modulo 30 which are not divisible by 2, 3 or 5.
+WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+#: bit position of a residue modulo 30 (-1 when divisible by 2, 3 or 5).
+WHEEL_BIT = tuple(WHEEL.index(n) if n in WHEEL else -1 for n in range(30))
+#: for each possible byte value the residues of the bits being set.
+WHEEL_OFFSETS = tuple(tuple(WHEEL[bit] for bit in range(8) if value & (1 << bit))
+                      for value in range(256))
+#: for each possible byte value the number of bits being set.
+POPCOUNT = bytes(bin(value).count("1") for value in range(256))
+
+
+class wheel_sieve(object):
+    """
+    Prime sieve storing 30 integers in one byte.
+
+    Each byte represents the numbers 30*i + r for the eight residues r
+    being coprime to 30; all other numbers are known to be divisible by 2, 3 or 5.
+    Multiples of a prime are struck out per residue class with slice assignment
+    on a byte per candidate (one segment at a time) and then packed into the bits.
+
+    >>> sieve = wheel_sieve(50)
+    >>> sieve.calculate()
+    >>> sieve.get_primes()
+    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    """
+
+    def __init__(self, max_n, segment_size=1 << 18):
+        """
+        Initialize sieve.
+
+        :param max_n: maximum value to be checked to be a prime.
+        :param segment_size: number of bytes (30 integers each) sieved at once.
+        """
+        self.max_n = max_n
+        self.segment_size = segment_size
+        self.sieve = bytearray(max_n // 30 + 1)
+
+    def calculate(self):
+        """Strike out all multiples of a prime as none prime."""
+        limit = int(math.sqrt(self.max_n))
+        base_sieve = sieve_of_eratosthenes(max(limit, 2))
+        base_sieve.calculate()
+        primes = [prime for prime in base_sieve.get_primes() if 7 <= prime <= limit]
+        # for each prime and each bit the residue of the cofactor q with p*q in that bit
+        cofactors = [(prime, [(WHEEL[bit] * pow(prime, -1, 30)) % 30 for bit in range(8)])
+                     for prime in primes]
+
+        zeros = memoryview(bytes(self.segment_size))
+        total = len(self.sieve)
+        low = 0
+        while low < total:
+            size = min(self.segment_size, total - low)
+            packed = 0
+            for bit in range(8):
+                plane = bytearray(b"\x01") * size
+                for prime, residues in cofactors:
+                    minimum = max(prime, -(-(30 * low + WHEEL[bit]) // prime))
+                    cofactor = minimum + (residues[bit] - minimum) % 30
+                    index = (prime * cofactor) // 30 - low
+                    if index < size:
+                        plane[index::prime] = zeros[:(size - 1 - index) // prime + 1]
+                packed |= int.from_bytes(plane, "little") << bit
+            self.sieve[low:low + size] = packed.to_bytes(size, "little")
+            low += size
+
+        # 1 is not a prime and the last byte might cover values beyond max_n
+        self.sieve[0] &= 0xfe
+        for bit in range(8):
+            if 30 * (total - 1) + WHEEL[bit] > self.max_n:
+                self.sieve[total - 1] &= ~(1 << bit) & 0xff
+
+    def get_primes(self):
+        """
+        Get all primes.
+
+        :returns: list of primes
+        """
+        primes = [prime for prime in (2, 3, 5) if prime <= self.max_n]
+        primes.extend(30 * index + offset
+                      for index, value in enumerate(self.sieve) if value
+                      for offset in WHEEL_OFFSETS[value])
+        return primes
+
+    def count_primes(self):
+        """
+        Count all primes without creating them.
+
+        :returns: number of primes <= max_n
+        """
+        return sum(1 for prime in (2, 3, 5) if prime <= self.max_n) \
+            + sum(self.sieve.translate(POPCOUNT))
+
+    def is_prime(self, value):
+        """
+        Checking sieve for value.
+
+        :param value: value to be checked to be a prime (0 <= value <= max_n).
+        :returns: True when given number is a prime.
+        """
+        if value < 7:
+            return value in (2, 3, 5)
+
+        bit = WHEEL_BIT[value % 30]
+        return bit >= 0 and (self.sieve[value // 30] >> bit) & 1 == 1
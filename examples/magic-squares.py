@@ -25,7 +25,9 @@ WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 import sys
+import time
 from concept.math.matrix import Matrix
+from concept.math.magic_square import MagicSquareSearch
 import itertools
 
 
@@ -33,6 +35,8 @@ def findall_3x3():
     """
     Very simple but expensive search algorithm (not advisable for bigger matrices).
 
+    See concept.math.magic_square.MagicSquareSearch for those.
+
     A good place to read about that topic: http://en.wikipedia.org/wiki/Magic_square
 
     :rtype: all magic squares for a 3x3 matrix
@@ -60,3 +64,10 @@ if __name__ == "__main__":
     print(sys.version.replace("\n", ""))
     for matrix in findall_3x3():
         print(matrix)
+
+    start = time.time()
+    squares = MagicSquareSearch(4).findall(workers=None)
+    print("found %d magic squares 4x4 in %f seconds" % (len(squares), time.time() - start))
+    matrix = Matrix(4, 4)
+    matrix.set(squares[0])
+    print(matrix)
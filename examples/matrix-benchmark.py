@@ -0,0 +1,89 @@
+#!/usr/bin/python
+"""
+Matrix multiplication benchmark tool.
+
+=======
+License
+=======
+Copyright (c) 2015 Thomas Lehmann
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this
+software and associated documentation files (the "Software"), to deal in the Software
+without restriction, including without limitation the rights to use, copy, modify, merge,
+publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+"""
+import sys
+import random
+import platform
+import click
+from concept.math.matrix import Matrix
+from concept.math import matrix as matrix_module
+from concept.performance.measurement import track_durations_of
+from concept import VERSION
+
+
+def create_random_matrix(size, typecode):
+    """
+    Create a square matrix with random values.
+
+    :param size: width and height of the matrix.
+    :param typecode: None for list of rows otherwise typecode of the array.
+    :returns: matrix instance
+    """
+    matrix = Matrix(size, size, typecode)
+    matrix.set([random.random() for _ in range(size * size)])
+    return matrix
+
+
+@click.command()
+@click.option("--sizes", default="50,100,200,300",
+              help="comma separated matrix sizes (default: 50,100,200,300)")
+@click.option("--max-cells-size", default=150, help="maximum size for the cell by cell multiplication")
+@click.option("--typecode", default="d", help="typecode of the matrix storage; 'list' for list of rows")
+@click.option("--repeats", default=3, help="number of measured runs (default: 3)")
+@click.option("--workers", default=0, help="processes for the parallel multiplication (default: CPUs)")
+def main(sizes="50,100,200,300", max_cells_size=150, typecode="d", repeats=3, workers=0):
+    """
+    Matrix multiplication benchmark tool.
+
+    :param sizes: comma separated sizes of the square matrices.
+    :param max_cells_size: the cell by cell multiplication is very slow; not done for bigger sizes.
+    :param typecode: typecode of the matrix storage ('list' for list of rows).
+    :param repeats: number of measured runs.
+    :param workers: processes for the parallel multiplication (0: number of CPUs).
+    """
+    print("matrix multiplication benchmark tool (version %s)" % VERSION)
+    print(" ... Python %s" % sys.version.replace("\n", ""))
+    print(" ... Platform %s" % platform.platform())
+    print(" ... numpy %s" % ("not installed" if matrix_module.numpy is None
+                             else matrix_module.numpy.__version__))
+
+    typecode = None if typecode == "list" else typecode
+    for size in [int(size) for size in sizes.split(",")]:
+        matrix = create_random_matrix(size, typecode)
+        methods = [("blocked", matrix.multiply_blocked),
+                   ("parallel", lambda other: matrix.multiply_parallel(other, workers or None))]
+        if size <= max_cells_size:
+            methods.insert(0, ("cells", matrix.multiply_cells))
+        if matrix_module.numpy is not None:
+            methods.append(("numpy", matrix.multiply_numpy))
+
+        for name, method in methods:
+            durations = track_durations_of(lambda: method(matrix), repeats=repeats,
+                                           warmup=0 if name == "cells" else 1)
+            print(" ... %-8s %5dx%-5d: %10.6f seconds (best)" % (name, size, size, min(durations)))
+
+
+if __name__ == "__main__":
+    main()
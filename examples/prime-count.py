@@ -0,0 +1,82 @@
+#!/usr/bin/python
+"""
+Prime counting benchmark tool.
+
+=======
+License
+=======
+Copyright (c) 2015 Thomas Lehmann
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this
+software and associated documentation files (the "Software"), to deal in the Software
+without restriction, including without limitation the rights to use, copy, modify, merge,
+publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import sys
+import platform
+import click
+from concept.primes.prime_count import prime_count
+from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
+from concept.primes.wheel_sieve import wheel_sieve
+from concept.performance.measurement import track_duration_of
+from concept import VERSION
+
+
+def count_by_enumeration(sieve_class, max_number):
+    """
+    Counting primes the classic way: calculating the sieve and taking the length of all primes.
+
+    :param sieve_class: sieve class providing calculate and get_primes.
+    :param max_number: maximum value for counting primes.
+    :returns: number of primes <= max_number
+    """
+    sieve = sieve_class(max_number)
+    sieve.calculate()
+    return len(sieve.get_primes())
+
+
+@click.command()
+@click.option("--max-number", default=10 ** 7, help="maximum number for counting (default: 10^7)")
+@click.option("--enumerate-up-to", default=10 ** 7,
+              help="skip enumerating sieves for larger numbers (default: 10^7)")
+def main(max_number=10 ** 7, enumerate_up_to=10 ** 7):
+    """
+    Prime counting benchmark tool comparing pi(x) with counting the primes of a sieve.
+
+    :param max_number: counting primes up to this number (10, 100, ... up to this number).
+    :param enumerate_up_to: maximum number for which the sieves are used.
+    """
+    print("prime counting benchmark tool (version %s)" % VERSION)
+    print(" ... Python %s" % sys.version.replace("\n", ""))
+    print(" ... Platform %s" % platform.platform())
+
+    algorithms = [("prime_count", prime_count, None),
+                  ("wheel sieve", lambda value: count_by_enumeration(wheel_sieve, value), enumerate_up_to),
+                  ("eratosthenes", lambda value: count_by_enumeration(sieve_of_eratosthenes, value),
+                   enumerate_up_to)]
+
+    value = 10
+    while value <= max_number:
+        for name, function, limit in algorithms:
+            if limit is not None and value > limit:
+                continue
+            result = []
+            duration = track_duration_of(lambda: result.append(function(value)))
+            print(" ... pi(%d) = %d with %-12s took %f seconds" % (value, result[0], name, duration))
+        value *= 10
+
+
+if __name__ == "__main__":
+    main()
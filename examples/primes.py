@@ -31,63 +31,157 @@ import click
 from concept.primes.sieve_of_eratosthenes import sieve_of_eratosthenes
 from concept.primes.sieve_of_eratosthenes_optimized import sieve_of_eratosthenes_optimized
 from concept.primes.segmented_sieve import segmented_sieve
+from concept.primes.wheel_sieve import wheel_sieve
+from concept.primes.prime_stream import write_primes_binary
 from concept.performance.measurement import track_duration_of
 from concept import VERSION
 
+#: number of lines collected before writing them.
+LINES_PER_CHUNK = 1024
 
-def print_primes(primes, columns):
+
+def print_primes(primes, columns, stream=None, width=0):
     """
     Print out primes aligned in a grid/columns.
 
-    :param primes: list of primes
+    The lines are written in chunks so the primes can be any iterable
+    (like a generator) and the text is never created as a whole.
+
+    :param primes: list or iterable of primes
     :param columns: number of prime columns (-1: auto)
+    :param stream: text stream to write to (default: stdout)
+    :param width: width of a column (default for a list: digits of the last prime plus one;
+                  required for other iterables)
+    :returns: number of printed primes
     """
-    width = len("%d" % primes[-1]) + 1
+    stream = stream or sys.stdout
+    if width <= 0:
+        if not isinstance(primes, (list, tuple)):
+            raise ValueError("width required when primes are not a list")
+        width = len("%d" % primes[-1]) + 1 if primes else 2
     if columns == -1:
         columns = 80 // width
 
     prime_format = "%%%dd" % width
-    text = ""
-    column = 0
+    lines, line, count = [], [], 0
     for prime in primes:
-        text += prime_format % prime
-        column += 1
-        if column % columns == 0:
-            text += "\n"
-    text += "\n"
-    print(text)
+        line.append(prime_format % prime)
+        count += 1
+        if len(line) == columns:
+            lines.append("".join(line))
+            line = []
+            if len(lines) == LINES_PER_CHUNK:
+                stream.write("\n".join(lines) + "\n")
+                lines = []
+    if line:
+        lines.append("".join(line))
+    lines.append("")
+    stream.write("\n".join(lines) + "\n")
+    return count
+
+
+def write_primes(primes, output, output_format, columns, width=0):
+    """
+    Write primes as text grid or in binary format to a file or to stdout.
+
+    :param primes: list or iterable of primes
+    :param output: filename or "-" for stdout
+    :param output_format: "text" or "binary"
+    :param columns: number of prime columns (text only)
+    :param width: width of a column (text only)
+    :returns: number of written primes
+    """
+    if output_format == "binary":
+        if output == "-":
+            return write_primes_binary(getattr(sys.stdout, "buffer", sys.stdout), primes)
+        with open(output, "wb") as handle:
+            return write_primes_binary(handle, primes)
+
+    if output == "-":
+        return print_primes(primes, columns, sys.stdout, width)
+    with open(output, "w") as handle:
+        return print_primes(primes, columns, handle, width)
+
+
+def count_primes_of(sieve_algorithm):
+    """
+    Count primes without writing them (cheapest way for given sieve).
+
+    :param sieve_algorithm: sieve instance (not yet calculated)
+    :returns: number of primes
+    """
+    if isinstance(sieve_algorithm, segmented_sieve):
+        return sieve_algorithm.count_primes()
+
+    sieve_algorithm.calculate()
+    if isinstance(sieve_algorithm, wheel_sieve):
+        return sieve_algorithm.count_primes()
+    return len(sieve_algorithm.get_primes())
 
 
 @click.command()
 @click.option("--max-number", default=1000, help="maximum number for sieve (default: 1000)")
-@click.option("--sieve", default="default", help="sieve algorithm (default: standard eratosthenes)")
+@click.option("--sieve", default="default",
+              type=click.Choice(["default", "optimized", "segmented", "wheel"]),
+              help="sieve algorithm (default: standard eratosthenes)")
 @click.option("--columns", default=20, help="number of columns per line (default: 10)")
-def main(max_number=1000, sieve="default", columns=20):
+@click.option("--workers", default=1, help="number of processes for segmented sieve (default: 1)")
+@click.option("--output", default="-", help="file for the primes (default: - for stdout)")
+@click.option("--format", "output_format", default="text", type=click.Choice(["text", "binary"]),
+              help="output format: text or binary (delta encoded varints; default: text)")
+@click.option("--count-only", is_flag=True, default=False, help="count primes only (no output of primes)")
+def main(max_number=1000, sieve="default", columns=20, workers=1,
+         output="-", output_format="text", count_only=False):
     """
     Prime generator tool.
 
     :param max_number: creating a sieve up to this number
-    :param sieve: sieve algorithms ("default" or "optimized")
+    :param sieve: sieve algorithms ("default", "optimized", "segmented" or "wheel")
     :param columns: number of prime columns
+    :param workers: number of processes (segmented sieve only)
+    :param output: filename for the primes ("-" for stdout)
+    :param output_format: "text" or "binary"
+    :param count_only: when true then the primes are counted only
     """
-    print("prime tool (version %s)" % VERSION)
-    print(" ... Python %s" % sys.version.replace("\n", ""))
-    print(" ... Platform %s" % platform.platform())
+    # binary primes on stdout should not be mixed with messages
+    info = sys.stderr if output == "-" and output_format == "binary" else sys.stdout
+    print("prime tool (version %s)" % VERSION, file=info)
+    print(" ... Python %s" % sys.version.replace("\n", ""), file=info)
+    print(" ... Platform %s" % platform.platform(), file=info)
 
     if max_number < 2:
-        print(" ... no primes for max. number %d" % max_number)
+        print(" ... no primes for max. number %d" % max_number, file=info)
         sys.exit(1)
 
-    sieve_algorithm = None
     if sieve == "default":
         sieve_algorithm = sieve_of_eratosthenes(max_number)
     elif sieve == "optimized":
         sieve_algorithm = sieve_of_eratosthenes_optimized(max_number)
     elif sieve == "segmented":
-        sieve_algorithm = segmented_sieve(max_number)
-
-    print(" ... using algorithm \"%s\"" % sieve)
-    print(" ... searching primes <= %d\n" % max_number)
+        sieve_algorithm = segmented_sieve(max_number, workers=workers)
+    else:
+        sieve_algorithm = wheel_sieve(max_number)
+
+    print(" ... using algorithm \"%s\"" % sieve, file=info)
+    if sieve == "segmented" and workers > 1:
+        print(" ... using %d worker processes" % workers, file=info)
+    print(" ... searching primes <= %d\n" % max_number, file=info)
+
+    count = []
+    if count_only:
+        duration = track_duration_of(lambda: count.append(count_primes_of(sieve_algorithm)))
+        print(" ... %d primes found." % count[0], file=info)
+        print(" ... counting took %f seconds" % duration, file=info)
+        return
+
+    width = len("%d" % max_number) + 1
+    if sieve == "segmented" and workers == 1:
+        # the primes are generated while writing them (no list of all primes)
+        output_duration = track_duration_of(lambda: count.append(write_primes(
+            sieve_algorithm.iter_primes(), output, output_format, columns, width)))
+        print(" ... %d primes found." % count[0], file=info)
+        print(" ... sieve calculation and output took %f seconds" % output_duration, file=info)
+        return
 
     sieve_duration = track_duration_of(sieve_algorithm.calculate)
 
@@ -95,10 +189,12 @@ def main(max_number=1000, sieve="default", columns=20):
     primes_duration = track_duration_of(
         lambda: primes.extend(sieve_algorithm.get_primes()))
 
-    print_primes(primes, columns)
-    print(" ... %d primes found." % len(primes))
-    print(" ... sieve calculation took %f seconds" % sieve_duration)
-    print(" ... prime calculation took %f seconds" % primes_duration)
+    output_duration = track_duration_of(lambda: count.append(write_primes(
+        primes, output, output_format, columns)))
+    print(" ... %d primes found." % count[0], file=info)
+    print(" ... sieve calculation took %f seconds" % sieve_duration, file=info)
+    print(" ... prime calculation took %f seconds" % primes_duration, file=info)
+    print(" ... output took %f seconds" % output_duration, file=info)
 
 
 if __name__ == "__main__":
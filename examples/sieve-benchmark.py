@@ -0,0 +1,76 @@
+#!/usr/bin/python
+"""
+Sieve benchmark tool.
+
+=======
+License
+=======
+Copyright (c) 2015 Thomas Lehmann
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this
+software and associated documentation files (the "Software"), to deal in the Software
+without restriction, including without limitation the rights to use, copy, modify, merge,
+publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import sys
+import platform
+import click
+from concept.primes.benchmark import SIZES, run_benchmark, save_results, load_results, compare_results
+from concept import VERSION
+
+
+@click.command()
+@click.option("--max-size", default=10 ** 9, help="maximum sieve size of 10^4, 10^5, ... (default: 10^9)")
+@click.option("--repeats", default=3, help="number of measured runs (default: 3)")
+@click.option("--warmup", default=1, help="number of runs before measuring (default: 1)")
+@click.option("--output", default="", help="JSON file for the results (default: none)")
+@click.option("--baseline", default="", help="JSON file with former results to compare with")
+@click.option("--tolerance", default=0.1, help="accepted relative regression (default: 0.1)")
+def main(max_size=10 ** 9, repeats=3, warmup=1, output="", baseline="", tolerance=0.1):
+    """
+    Sieve benchmark tool.
+
+    :param max_size: maximum size for the sieves.
+    :param repeats: number of measured runs.
+    :param warmup: number of runs before measuring.
+    :param output: when not empty the results are written as JSON.
+    :param baseline: when not empty the results are compared with those results.
+    :param tolerance: accepted relative increase of time and memory.
+    """
+    print("sieve benchmark tool (version %s)" % VERSION)
+    print(" ... Python %s" % sys.version.replace("\n", ""))
+    print(" ... Platform %s" % platform.platform())
+
+    results = run_benchmark([size for size in SIZES if size <= max_size], repeats=repeats, warmup=warmup)
+    for entry in results["results"]:
+        print(" ... %(sieve)-10s %(size)12d: %(best)10.6f seconds (best), %(peak_memory)12d bytes,"
+              " %(primes_per_second)14.0f primes/second" % entry)
+
+    if output:
+        save_results(output, results)
+        print(" ... results written to %s" % output)
+
+    if baseline:
+        regressions = compare_results(results, load_results(baseline), tolerance)
+        for regression in regressions:
+            print(" ... regression %(sieve)s %(size)d %(metric)s: %(baseline)s -> %(current)s"
+                  % regression)
+        if regressions:
+            sys.exit(1)
+        print(" ... no regressions compared with %s" % baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,102 +5,33 @@
 # - http://doc.pypy.org/en/latest/install.html
 PROMPT="run_python.sh :: "
 
-## @fn init_py27
-## Installation of Python 2.7.x from the devtoolset.
-function init_py27() {
-    yum -y install centos-release-scl yum-utils
-    yum-config-manager --enable rhel-server-rhscl-7-rpms
-    yum -y install python27
-    scl enable python27 "bash -c \"pip install setuptools --upgrade\""
-    scl enable python27 "bash -c \"pip install tox\""
-    scl enable python27 "bash -c \"/docker/scripts/run_python.sh RUN\""
-}
-
-## @fn init_py33
-## Installation of Python 3.3.x from the devtoolset.
-function init_py33() {
-    yum -y install centos-release-scl yum-utils
-    yum-config-manager --enable rhel-server-rhscl-7-rpms
-    yum -y install python33
-    scl enable python33 "bash -c \"easy_install pip\""
-    scl enable python33 "bash -c \"pip install pip --upgrade\""
-    scl enable python33 "bash -c \"pip install setuptools --upgrade\""
-    scl enable python33 "bash -c \"pip install tox\""
-    scl enable python33 "bash -c \"/docker/scripts/run_python.sh RUN\""
-}
-
-## @fn init_py34
-## Installation of Python 3.4.x from the devtoolset.
-function init_py34() {
-    yum -y install centos-release-scl yum-utils
-    yum-config-manager --enable rhel-server-rhscl-7-rpms
-    yum -y install rh-python34
-    scl enable rh-python34 "bash -c \"pip install pip --upgrade\""
-    scl enable rh-python34 "bash -c \"pip install setuptools --upgrade\""
-    scl enable rh-python34 "bash -c \"pip install tox\""
-    scl enable rh-python34 "bash -c \"/docker/scripts/run_python.sh RUN\""
-}
-
-## @fn init_py35
-## Installation of Python 3.5.x from the devtoolset.
-function init_py35() {
-    yum -y install centos-release-scl yum-utils
-    yum-config-manager --enable rhel-server-rhscl-7-rpms
-    yum -y install rh-python35
-    scl enable rh-python35 "bash -c \"pip install pip --upgrade\""
-    scl enable rh-python35 "bash -c \"pip install setuptools --upgrade\""
-    scl enable rh-python35 "bash -c \"pip install tox\""
-    scl enable rh-python35 "bash -c \"/docker/scripts/run_python.sh RUN\""
-}
-
-## @fn init_py36
-## Installation of Python 3.6.x; here we require a build since there has been no devtoolset available.
-function init_py36() {
-    yum -y install wget gcc make openssl-devel
-    wget -q https://www.python.org/ftp/python/3.6.1/Python-3.6.1.tar.xz
+## @fn init_python_source
+## Installation of Python from source (no devtoolset available for Python 3.8 and newer).
+## @param $1 version like 3.8.18
+function init_python_source() {
+    yum -y install wget gcc make openssl-devel libffi-devel zlib-devel
+    wget -q https://www.python.org/ftp/python/$1/Python-$1.tar.xz
     tar -xf $(ls Python*.tar.xz)
     cd Python*
     ./configure
     make && make altinstall
-    ln -s /usr/local/bin/pip3.6 /usr/local/bin/pip
-    pip install pip --upgrade
-    pip install setuptools --upgrade
-    pip install tox
-    $0 RUN
-}
-
-
-## @fn init_pypy
-## Installation of PyPy with Python 2.7.x compatible version.
-function init_pypy() {
-    yum -y install wget bzip2
-    echo "${PROMPT}Downloading pypy (Python 2.7 compatible) ..."
-    wget -q https://bitbucket.org/squeaky/portable-pypy/downloads/pypy-5.7.1-linux_x86_64-portable.tar.bz2
-    echo "${PROMPT}unpacking pypy (Python 2.7 compatible) to /opt ..."
-    tar -xvjf $(ls pypy*.tar.bz2) -C /opt > /dev/null
-    ln -s /opt/$(ls /opt|grep pypy) /opt/pypy
-    ln -s /opt/pypy/bin/pypy /usr/local/bin/pypy
-    ln -s /opt/pypy/bin/virtualenv-pypy /usr/local/bin/virtualenv
-    pypy -m ensurepip
-    ln -s /opt/pypy/bin/pip2 /usr/local/bin/pip
+    ln -s /usr/local/bin/pip${1%.*} /usr/local/bin/pip
     pip install pip --upgrade
     pip install setuptools --upgrade
     pip install tox
-    ln -s /opt/pypy/bin/tox /usr/local/bin/tox
     $0 RUN
 }
 
 ## @fn init_pypy3
-## Installation of PyPy with Python 3.5 compatible version.
+## Installation of PyPy with Python 3.8 compatible version.
 function init_pypy3() {
     yum -y install wget bzip2
-    echo "${PROMPT}Downloading pypy (Python 3.5 compatible) ..."
-    wget -q https://bitbucket.org/squeaky/portable-pypy/downloads/pypy3.5-5.8-beta-linux_x86_64-portable.tar.bz2
-    echo "${PROMPT}unpacking pypy (Python 3.5 compatible) to /opt ..."
+    echo "${PROMPT}Downloading pypy (Python 3.8 compatible) ..."
+    wget -q https://downloads.python.org/pypy/pypy3.8-v7.3.11-linux64.tar.bz2
+    echo "${PROMPT}unpacking pypy (Python 3.8 compatible) to /opt ..."
     tar -xvjf $(ls pypy3*.tar.bz2) -C /opt > /dev/null
     ln -s /opt/$(ls /opt|grep pypy) /opt/pypy
     ln -s /opt/pypy/bin/pypy /usr/local/bin/pypy
-    ln -s /opt/pypy/bin/virtualenv-pypy /usr/local/bin/virtualenv
     pypy -m ensurepip
     ln -s /opt/pypy/bin/pip3 /usr/local/bin/pip
     pip install pip --upgrade
@@ -125,23 +56,11 @@ else
         INIT)
             echo "${PROMPT} Init phase ..."
             case ${PYTHON_VERSION} in
-                py27)
-                    init_py27;
-                    ;;
-                py33)
-                    init_py33;
-                    ;;
-                py34)
-                    init_py34
-                    ;;
-                py35)
-                    init_py35;
-                    ;;
-                py36)
-                    init_py36;
+                py38)
+                    init_python_source 3.8.18;
                     ;;
-                pypy)
-                    init_pypy;
+                py39)
+                    init_python_source 3.9.18;
                     ;;
                 pypy3)
                     init_pypy3;
@@ -167,7 +86,7 @@ else
                 echo "${PROMPT} Run phase ..."
                 if [ -e /usr/local/bin/pypy ]; then
                     pypy -V
-                    tox -e pypy
+                    tox -e pypy3
                 else
                     python -V
                     tox -e ${PYTHON_VERSION}
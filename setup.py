@@ -40,11 +40,15 @@ setup(name='concept-py',
       author_email='thomas.lehmann.private@googlemail.com',
       license="MIT",
       install_requires=["click", "jsonpickle"],
+      python_requires=">=3.8",
       packages=['concept', 'concept.primes', 'concept.math',
                 'concept.performance', 'concept.query',
                 'concept.graph.gnuplot', 'concept.tools'],
       data_files=[('concept', ['README.md',
                                'examples/primes.py',
+                               'examples/prime-count.py',
+                               'examples/sieve-benchmark.py',
+                               'examples/matrix-benchmark.py',
                                'examples/learn.py',
                                'examples/easy-mail.py',
                                'examples/easy-mail.yml',
@@ -54,10 +58,9 @@ setup(name='concept-py',
       keywords="concepts ideas",
       url="https://github.com/Nachtfeuer/concept-py",
       classifiers=[
-          "Programming Language :: Python :: 2.7",
-          "Programming Language :: Python :: 3.2",
-          "Programming Language :: Python :: 3.3",
-          "Programming Language :: Python :: 3.4",
+          "Programming Language :: Python :: 3 :: Only",
+          "Programming Language :: Python :: 3.8",
+          "Programming Language :: Python :: 3.9",
           "Programming Language :: Python :: Implementation :: PyPy",
           "Topic :: Software Development :: Libraries :: Python Modules",
           "Development Status :: 5 - Production/Stable",
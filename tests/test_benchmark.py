@@ -0,0 +1,76 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import os
+import tempfile
+import unittest
+from hamcrest import assert_that, equal_to
+from concept.primes.benchmark import run_benchmark, save_results, load_results, compare_results
+from concept.primes.benchmark import create_sieve
+from concept.primes.wheel_sieve import wheel_sieve
+
+
+class TestBenchmark(unittest.TestCase):
+    """Testing sieve benchmark."""
+
+    def test_run_benchmark(self):
+        """Testing results of all sieves (sizes beyond the maximum of a sieve are skipped)."""
+        sieves = (("wheel", wheel_sieve, lambda sieve: sieve.count_primes(), 10 ** 3),)
+        results = run_benchmark(sizes=(100, 1000, 10000), sieves=sieves, repeats=2, warmup=0)
+        assert_that([entry["size"] for entry in results["results"]], equal_to([100, 1000]))
+        assert_that([entry["primes"] for entry in results["results"]], equal_to([25, 168]))
+        assert_that(results["repeats"], equal_to(2))
+        assert_that(all(entry["peak_memory"] > 0 for entry in results["results"]), equal_to(True))
+
+        results = run_benchmark(sizes=(1000,), repeats=1, warmup=0)
+        assert_that([entry["sieve"] for entry in results["results"]],
+                    equal_to(["default", "optimized", "segmented", "wheel"]))
+        assert_that(set(entry["primes"] for entry in results["results"]), equal_to(set([168])))
+
+    def test_create_sieve(self):
+        """Testing creation of a calculated sieve."""
+        keep = [None]
+        create_sieve(wheel_sieve, 100, keep)
+        assert_that(len(keep), equal_to(1))
+        assert_that(keep[0].count_primes(), equal_to(25))
+
+    def test_save_and_load_results(self):
+        """Testing JSON file with results."""
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        results = {"results": [{"sieve": "wheel", "size": 10, "best": 0.5, "peak_memory": 10}]}
+        save_results(path, results)
+        assert_that(load_results(path), equal_to(results))
+        os.remove(path)
+
+    def test_compare_results(self):
+        """Testing comparing results with a baseline."""
+        baseline = {"results": [{"sieve": "wheel", "size": 10, "best": 1.0, "peak_memory": 100},
+                                {"sieve": "wheel", "size": 20, "best": 1.0, "peak_memory": 100}]}
+        current = {"results": [{"sieve": "wheel", "size": 10, "best": 1.05, "peak_memory": 200},
+                               {"sieve": "wheel", "size": 30, "best": 9.0, "peak_memory": 900}]}
+        assert_that(compare_results(current, baseline),
+                    equal_to([{"sieve": "wheel", "size": 10, "metric": "peak_memory",
+                               "baseline": 100, "current": 200}]))
+        assert_that(compare_results(current, baseline, tolerance=1.0), equal_to([]))
@@ -23,8 +23,12 @@
 """
 # pylint: disable=R0201
 import unittest
-from hamcrest import assert_that, equal_to
+from hamcrest import assert_that, equal_to, calling, raises
 from concept.math.digits import sum_digits, count_digits, is_pandigital, is_palindrome
+from concept.math.digits import chunk_powers, digit_chunks, digit_string
+from concept.math.digits import palindromes, palindromes_up_to, count_palindromes
+from concept.math.digits import pandigital_digits, pandigitals, count_pandigitals
+from concept.math.digits import sum_digits_many, count_digits_many, is_pandigital_many, is_palindrome_many
 
 
 class TestDigits(unittest.TestCase):
@@ -36,6 +40,8 @@ class TestDigits(unittest.TestCase):
         assert_that(sum_digits(1024), equal_to(7))
         assert_that(sum_digits(1234567890), equal_to(45))
         assert_that(sum_digits(-1234567890), equal_to(45))
+        assert_that(sum_digits(0), equal_to(0))
+        assert_that(sum_digits(10 ** 5000 - 1), equal_to(9 * 5000))
 
     def test_count_digits(self):
         """ Testing count_digits function. """
@@ -43,6 +49,9 @@ class TestDigits(unittest.TestCase):
         assert_that(count_digits(1024), equal_to(4))
         assert_that(count_digits(1234567890), equal_to(10))
         assert_that(count_digits(-1234567890), equal_to(10))
+        for exponent in range(1, 300):
+            assert_that(count_digits(10 ** exponent - 1), equal_to(exponent))
+            assert_that(count_digits(10 ** exponent), equal_to(exponent + 1))
 
     def test_is_pandigital(self):
         """ Testing is_pandigital function. """
@@ -51,6 +60,7 @@ class TestDigits(unittest.TestCase):
         assert_that(is_pandigital(1024), equal_to(True))
         assert_that(is_pandigital(10240), equal_to(False))
         assert_that(is_pandigital(1223), equal_to(False))
+        assert_that(is_pandigital(10 ** 20 + 1234567890), equal_to(False))
 
     def test_is_palindrome(self):
         """ Testing is_palindrome function. """
@@ -60,3 +70,105 @@ class TestDigits(unittest.TestCase):
         assert_that(is_palindrome(-22), equal_to(True))
         assert_that(is_palindrome(1231), equal_to(False))
         assert_that(is_palindrome(1321), equal_to(False))
+        assert_that(is_palindrome(10 ** 5000 + 1), equal_to(True))
+        assert_that(is_palindrome(10 ** 5000 + 10), equal_to(False))
+
+    def test_chunk_powers(self):
+        """ Testing chunk_powers function. """
+        assert_that(chunk_powers(0), equal_to([10 ** 4]))
+        assert_that(chunk_powers(10 ** 4), equal_to([10 ** 4, 10 ** 8]))
+        assert_that(chunk_powers(10 ** 8), equal_to([10 ** 4, 10 ** 8, 10 ** 16]))
+
+    def test_digit_chunks(self):
+        """ Testing digit_chunks function. """
+        assert_that(digit_chunks(0), equal_to([0]))
+        assert_that(digit_chunks(-9999), equal_to([9999]))
+        assert_that(digit_chunks(10000), equal_to([1, 0]))
+        assert_that(digit_chunks(10 ** 16), equal_to([1, 0, 0, 0, 0]))
+        assert_that(digit_chunks(12345678901234567), equal_to([1, 2345, 6789, 123, 4567]))
+        # powers for a bigger value can be reused
+        assert_that(digit_chunks(10203, chunk_powers(10 ** 100)), equal_to([1, 203]))
+
+    def test_digit_string(self):
+        """ Testing digit_string function. """
+        assert_that(digit_string(0), equal_to("0"))
+        assert_that(digit_string(-100020003), equal_to("100020003"))
+        for value in (3 ** 1000, 7 ** 777, 10 ** 64, 10 ** 64 - 1):
+            assert_that(digit_string(value), equal_to(str(value)))
+
+    def test_sum_digits_many(self):
+        """ Testing sum_digits_many function. """
+        assert_that(sum_digits_many([1024, -99, 0, 3 ** 500]),
+                    equal_to([7, 18, 0, sum(int(digit) for digit in str(3 ** 500))]))
+        assert_that(sum_digits_many([]), equal_to([]))
+
+    def test_count_digits_many(self):
+        """ Testing count_digits_many function. """
+        assert_that(count_digits_many(iter([0, 9, 10, -12345, 10 ** 100])),
+                    equal_to([1, 1, 2, 5, 101]))
+
+    def test_is_pandigital_many(self):
+        """ Testing is_pandigital_many function. """
+        assert_that(is_pandigital_many([1234567890, 1223, 0]), equal_to([True, False, True]))
+
+    def test_is_palindrome_many(self):
+        """ Testing is_palindrome_many function. """
+        assert_that(is_palindrome_many([161, 2332, 1231, 10 ** 300 + 1]),
+                    equal_to([True, True, False, True]))
+        assert_that(is_palindrome_many([]), equal_to([]))
+
+    def test_palindromes(self):
+        """ Testing palindromes function. """
+        assert_that(list(palindromes(2)), equal_to([11, 22, 33, 44, 55, 66, 77, 88, 99]))
+        for length in range(1, 6):
+            expected = [value for value in range(10 ** (length - 1), 10 ** length)
+                        if is_palindrome(value)]
+            assert_that(list(palindromes(length)), equal_to(expected))
+
+    def test_palindromes_up_to(self):
+        """ Testing palindromes_up_to function. """
+        assert_that(list(palindromes_up_to(0)), equal_to([]))
+        assert_that(list(palindromes_up_to(121)), equal_to(list(range(1, 10)) +
+                                                           list(range(11, 100, 11)) + [101, 111, 121]))
+
+    def test_count_palindromes(self):
+        """ Testing count_palindromes function. """
+        assert_that(count_palindromes(-5), equal_to(0))
+        assert_that(count_palindromes(9), equal_to(9))
+        assert_that(count_palindromes(10), equal_to(9))
+        for limit in (100, 999, 1000, 1001, 12321, 12320, 54000, 99999):
+            expected = sum(1 for value in range(1, limit + 1) if is_palindrome(value))
+            assert_that(count_palindromes(limit), equal_to(expected))
+        # beyond the digit limit of str() (sys.set_int_max_str_digits)
+        assert_that(count_palindromes(10 ** 6000), equal_to(2 * (10 ** 3000 - 1)))
+        assert_that(count_palindromes(10 ** 6000 - 1), equal_to(2 * (10 ** 3000 - 1)))
+        assert_that(count_palindromes(10 ** 6000 + 1), equal_to(2 * (10 ** 3000 - 1) + 1))
+
+    def test_pandigital_digits(self):
+        """ Testing pandigital_digits function. """
+        assert_that(pandigital_digits(9), equal_to("123456789"))
+        assert_that(pandigital_digits(10, zero=True), equal_to("0123456789"))
+        assert_that(calling(pandigital_digits).with_args(10), raises(ValueError))
+        assert_that(calling(pandigital_digits).with_args(0), raises(ValueError))
+
+    def test_pandigitals(self):
+        """ Testing pandigitals function. """
+        assert_that(list(pandigitals(1)), equal_to([1]))
+        assert_that(list(pandigitals(2, zero=True)), equal_to([10]))
+        given = list(pandigitals(5))
+        assert_that(len(given), equal_to(120))
+        assert_that(given, equal_to(sorted(given)))
+        assert_that(all(sorted(str(value)) == list("12345") for value in given), equal_to(True))
+        given = list(pandigitals(4, zero=True))
+        assert_that(given, equal_to([value for value in range(1000, 10000)
+                                     if sorted(str(value)) == list("0123")]))
+
+    def test_count_pandigitals(self):
+        """ Testing count_pandigitals function. """
+        assert_that(count_pandigitals(122, 3), equal_to(0))
+        assert_that(count_pandigitals(123, 3), equal_to(1))
+        assert_that(count_pandigitals(10 ** 9, 9), equal_to(362880))
+        assert_that(count_pandigitals(12345678, 9), equal_to(0))
+        for limit in range(0, 6000, 7):
+            expected = sum(1 for value in pandigitals(4, zero=True) if value <= limit)
+            assert_that(count_pandigitals(limit, 4, zero=True), equal_to(expected))
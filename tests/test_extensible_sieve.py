@@ -0,0 +1,79 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to
+from concept.primes.is_prime import is_prime
+from concept.primes.extensible_sieve import extensible_sieve, shared_sieve
+
+
+class TestExtensibleSieve(unittest.TestCase):
+    """Testing extensible prime sieve."""
+
+    def test_init(self):
+        """Testing initial calculation."""
+        sieve = extensible_sieve(20)
+        assert_that(sieve.max_n, equal_to(20))
+        assert_that(sieve.get_primes(), equal_to([2, 3, 5, 7, 11, 13, 17, 19]))
+
+    def test_extend(self):
+        """Testing that the maximum is (at least) doubled."""
+        sieve = extensible_sieve(100)
+        sieve.extend(50)
+        assert_that(sieve.max_n, equal_to(100))
+        sieve.extend(101)
+        assert_that(sieve.max_n, equal_to(200))
+        sieve.extend(1000)
+        assert_that(sieve.max_n, equal_to(1000))
+        assert_that(sieve.get_primes(), equal_to([n for n in range(1000 + 1) if is_prime(n)]))
+
+    def test_is_prime(self):
+        """Testing prime check extending the sieve step by step."""
+        sieve = extensible_sieve(2)
+        given = [n for n in range(3000) if sieve.is_prime(n)]
+        assert_that(given, equal_to([n for n in range(3000) if is_prime(n)]))
+
+    def test_get_primes(self):
+        """Testing primes up to a given maximum."""
+        sieve = extensible_sieve(1000)
+        assert_that(sieve.get_primes(10), equal_to([2, 3, 5, 7]))
+        assert_that(sieve.get_primes(2000)[-1], equal_to(1999))
+
+    def test_count_primes(self):
+        """Testing counting primes."""
+        sieve = extensible_sieve()
+        sieve.calculate()
+        assert_that(sieve.count_primes(100), equal_to(25))
+        assert_that(sieve.count_primes(10000), equal_to(1229))
+
+    def test_shared_sieve(self):
+        """Testing process wide sieve."""
+        sieve = shared_sieve()
+        sieve.extend(5000)
+        assert_that(shared_sieve() is sieve, equal_to(True))
+        assert_that(shared_sieve().max_n >= 5000, equal_to(True))
+        # same instance for any maximum (extended when required)
+        assert_that(shared_sieve(20000) is sieve, equal_to(True))
+        assert_that(sieve.max_n >= 20000, equal_to(True))
+        assert_that(isinstance(sieve, extensible_sieve), equal_to(True))
@@ -0,0 +1,67 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to
+from concept.primes.is_prime import is_prime
+from concept.primes.factor_sieve import factor_sieve
+
+
+class TestFactorSieve(unittest.TestCase):
+    """Testing smallest prime factor sieve."""
+
+    def setUp(self):
+        """Calculating the table for all tests."""
+        self.sieve = factor_sieve(10000)
+        self.sieve.calculate()
+
+    def test_smallest_prime_factor(self):
+        """Testing smallest prime factors comparing with trial division."""
+        for value in range(2, 10000 + 1):
+            expected = next(n for n in range(2, value + 1) if value % n == 0)
+            assert_that(self.sieve.smallest_prime_factor(value), equal_to(expected))
+
+    def test_get_primes(self):
+        """Testing prime generation."""
+        assert_that(self.sieve.get_primes(), equal_to([n for n in range(10000 + 1) if is_prime(n)]))
+
+    def test_is_prime(self):
+        """Testing prime check."""
+        given = [n for n in range(10000 + 1) if self.sieve.is_prime(n)]
+        assert_that(given, equal_to([n for n in range(10000 + 1) if is_prime(n)]))
+
+    def test_factorize(self):
+        """Testing prime factorization."""
+        assert_that(self.sieve.factorize(1), equal_to({}))
+        assert_that(self.sieve.factorize(9973), equal_to({9973: 1}))
+        assert_that(list(self.sieve.factorize(9240).items()),
+                    equal_to([(2, 3), (3, 1), (5, 1), (7, 1), (11, 1)]))
+
+    def test_factorize_many(self):
+        """Testing prime factorization of a range."""
+        for value, factors in zip(range(1, 10001), self.sieve.factorize_many(range(1, 10001))):
+            product = 1
+            for prime, exponent in factors.items():
+                product *= prime ** exponent
+            assert_that(product, equal_to(value))
@@ -23,8 +23,9 @@
 """
 # pylint: disable=R0201
 import unittest
-from hamcrest import assert_that, equal_to
-from concept.math.factorization import probe
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.math.factorization import probe, divisors_from_factors, divisors, factorize, pollard_brent
+from concept.primes.factor_sieve import factor_sieve
 
 
 class TestFactorization(unittest.TestCase):
@@ -35,3 +36,48 @@ class TestFactorization(unittest.TestCase):
         """ Testing probe function. """
         assert_that(probe(12), equal_to([1, 2, 3, 4, 6, 12]))
         assert_that(probe(-12), equal_to([1, 2, 3, 4, 6, 12]))
+
+    def test_probe_with_sieve(self):
+        """ Testing probe function using a smallest prime factor sieve. """
+        sieve = factor_sieve(1000)
+        sieve.calculate()
+        for value in range(-10, 1200):
+            assert_that(probe(value, sieve), equal_to(probe(value)))
+
+    def test_divisors_from_factors(self):
+        """ Testing divisors for a given prime factorization. """
+        assert_that(divisors_from_factors({}), equal_to([1]))
+        assert_that(divisors_from_factors({2: 3}), equal_to([1, 2, 4, 8]))
+        assert_that(divisors_from_factors({2: 1, 3: 1, 5: 1}), equal_to([1, 2, 3, 5, 6, 10, 15, 30]))
+
+    def test_probe_big_value(self):
+        """ Testing probe function for a value which is too big for trial division. """
+        value = 1000000007 * 1000000009
+        assert_that(probe(value), equal_to([1, 1000000007, 1000000009, value]))
+        assert_that(probe(0), equal_to([1, 0]))
+
+    def test_factorize(self):
+        """ Testing prime factorization. """
+        assert_that(factorize(1), equal_to({}))
+        assert_that(factorize(-12), equal_to({2: 2, 3: 1}))
+        assert_that(factorize(2 ** 64 - 1), equal_to({3: 1, 5: 1, 17: 1, 257: 1, 641: 1,
+                                                      65537: 1, 6700417: 1}))
+        assert_that(factorize(1000003 ** 2 * (2 ** 61 - 1)), equal_to({1000003: 2, 2 ** 61 - 1: 1}))
+        assert_that(calling(factorize).with_args(0), raises(ValueError))
+        for value in range(1, 2000):
+            product = 1
+            for prime, exponent in factorize(value).items():
+                product *= prime ** exponent
+            assert_that(product, equal_to(value))
+
+    def test_pollard_brent(self):
+        """ Testing search for a factor of a composite value. """
+        assert_that(pollard_brent(8051) in (83, 97), equal_to(True))
+        assert_that(pollard_brent(1000003 * 1000033) in (1000003, 1000033), equal_to(True))
+        assert_that(pollard_brent(1024), equal_to(2))
+
+    def test_divisors(self):
+        """ Testing divisors derived from prime factorization. """
+        assert_that(divisors(1), equal_to([1]))
+        assert_that(divisors(28), equal_to([1, 2, 4, 7, 14, 28]))
+        assert_that(len(divisors(963761198400)), equal_to(6720))
@@ -24,7 +24,8 @@
 # pylint: disable=R0201
 import unittest
 from hamcrest import assert_that, equal_to
-from concept.primes.is_prime import is_prime
+from concept.primes.is_prime import is_prime, is_prime_many, is_prime_trial_division
+from concept.primes.is_prime import miller_rabin, is_strong_lucas_probable_prime, jacobi
 
 
 class TestIsPrime(unittest.TestCase):
@@ -35,3 +36,47 @@ class TestIsPrime(unittest.TestCase):
         """ Testing prime generation. """
         primes = [n for n in range(20) if is_prime(n)]
         assert_that([2, 3, 5, 7, 11, 13, 17, 19], equal_to(primes))
+
+    def test_is_prime_compared_with_trial_division(self):
+        """ Testing prime check for the range of trial division and Miller-Rabin. """
+        given = [n for n in range(100000) if is_prime(n)]
+        expected = [n for n in range(100000) if is_prime_trial_division(n)]
+        assert_that(given, equal_to(expected))
+
+    def test_is_prime_big_values(self):
+        """ Testing prime check for 64 bit values and for bigger ones (BPSW). """
+        assert_that(is_prime(18446744073709551557), equal_to(True))
+        assert_that(is_prime(3825123056546413051), equal_to(False))
+        assert_that(is_prime(2 ** 127 - 1), equal_to(True))
+        assert_that(is_prime((2 ** 89 - 1) * (2 ** 61 - 1)), equal_to(False))
+        assert_that(is_prime(318665857834031151167461), equal_to(False))
+
+    def test_is_prime_many(self):
+        """ Testing batch prime check (via sieve and via single checks). """
+        values = list(range(-2, 1000))
+        expected = [is_prime(n) for n in values]
+        assert_that(is_prime_many(values), equal_to(expected))
+        assert_that(is_prime_many(iter([2 ** 61 - 1, 2 ** 61 + 1])), equal_to([True, False]))
+        assert_that(is_prime_many([]), equal_to([]))
+        # negative values only
+        assert_that(is_prime_many([-1]), equal_to([False]))
+        assert_that(is_prime_many([-7, -2, -1]), equal_to([False, False, False]))
+
+    def test_miller_rabin(self):
+        """ Testing strong probable prime test (2047 is a strong pseudo prime to base 2). """
+        assert_that(miller_rabin(2047, (2,)), equal_to(True))
+        assert_that(miller_rabin(2047, (2, 3)), equal_to(False))
+        assert_that(miller_rabin(2039, (2, 3)), equal_to(True))
+
+    def test_is_strong_lucas_probable_prime(self):
+        """ Testing strong Lucas test (5459 is the first strong Lucas pseudo prime). """
+        assert_that(is_strong_lucas_probable_prime(5459), equal_to(True))
+        assert_that(is_strong_lucas_probable_prime(5461), equal_to(False))
+        assert_that(is_strong_lucas_probable_prime(5477), equal_to(True))
+        assert_that(is_strong_lucas_probable_prime(5479 ** 2), equal_to(False))
+
+    def test_jacobi(self):
+        """ Testing Jacobi symbol. """
+        assert_that([jacobi(n, 7) for n in range(7)], equal_to([0, 1, 1, -1, 1, -1, -1]))
+        assert_that(jacobi(-1, 5), equal_to(1))
+        assert_that(jacobi(-1, 7), equal_to(-1))
@@ -0,0 +1,138 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.math.magic_square import MagicSquareSearch, search_magic_squares
+from concept.tools.decorator import validate_test_responsibility_for
+
+
+def is_magic(square):
+    """
+    Check square to be magic.
+
+    :param square: values row by row
+    :returns: True when all rows, columns and both diagonals have the same sum
+    """
+    size = int(len(square) ** 0.5 + 0.5)
+    sums = set(sum(square[row * size:(row + 1) * size]) for row in range(size))
+    sums.update(sum(square[column::size]) for column in range(size))
+    sums.add(sum(square[index * size + index] for index in range(size)))
+    sums.add(sum(square[index * size + size - 1 - index] for index in range(size)))
+    return len(sums) == 1 and sorted(square) == list(range(1, size * size + 1))
+
+
+@validate_test_responsibility_for(MagicSquareSearch)
+class TestMagicSquareSearch(unittest.TestCase):
+    """ Testing of class concept.math.magic_square.MagicSquareSearch. """
+
+    def test_init(self):
+        """ Testing of MagicSquareSearch.__init__ method. """
+        search = MagicSquareSearch(4)
+        assert_that(search.size, equal_to(4))
+        assert_that(search.magic_constant, equal_to(34))
+        assert_that(len(search.steps), equal_to(16))
+        assert_that(calling(MagicSquareSearch).with_args(0), raises(ValueError))
+
+    def test_create_order(self):
+        """ Testing of MagicSquareSearch.create_order static method. """
+        assert_that(MagicSquareSearch.create_order(1), equal_to([0]))
+        # first row, first column, other diagonal, ...
+        assert_that(MagicSquareSearch.create_order(4),
+                    equal_to([0, 1, 2, 3, 4, 8, 12, 6, 9, 5, 7, 13, 10, 11, 14, 15]))
+        assert_that(sorted(MagicSquareSearch.create_order(5)), equal_to(list(range(25))))
+
+    def test_lines(self):
+        """ Testing of MagicSquareSearch.lines method. """
+        search = MagicSquareSearch(4)
+        assert_that(search.lines(0), equal_to([0, 4, 8]))
+        assert_that(search.lines(6), equal_to([1, 6, 9]))
+        assert_that(search.lines(7), equal_to([1, 7]))
+
+    def test_create_steps(self):
+        """ Testing of MagicSquareSearch.create_steps method. """
+        steps = MagicSquareSearch(4).create_steps()
+        # top left corner: no line completed, three cells left in row, column and diagonal
+        # (smaller than the other three corners)
+        assert_that(steps[0], equal_to((0, [0, 4, 8], None, [], [(0, 3, 3), (4, 3, 3), (8, 3, 3)],
+                                        [], [], 1, 13)))
+        # top right corner: calculated from the row, bigger than top left corner
+        assert_that(steps[3][:3], equal_to((3, [0, 7, 9], 0)))
+        assert_that(steps[3][5], equal_to([0]))
+        # bottom right corner: three lines completed
+        assert_that(steps[15][2:5], equal_to((3, [7, 8], [])))
+
+    def test_search(self):
+        """ Testing of MagicSquareSearch.search method. """
+        assert_that(MagicSquareSearch(1).search(), equal_to([(1,)]))
+        assert_that(MagicSquareSearch(2).search(), equal_to([]))
+        assert_that(MagicSquareSearch(3).search(), equal_to([(2, 9, 4, 7, 5, 3, 6, 1, 8)]))
+
+        squares = MagicSquareSearch(4).search((1, 15))
+        assert_that(len(squares) > 0, equal_to(True))
+        assert_that(all(is_magic(square) and square[:2] == (1, 15) for square in squares), equal_to(True))
+
+    def test_prefixes(self):
+        """ Testing of MagicSquareSearch.prefixes method. """
+        prefixes = MagicSquareSearch(4).prefixes(2)
+        assert_that(len(prefixes), equal_to(len(set(prefixes))))
+        # top left corner has to be the smallest corner
+        assert_that(max(prefix[0] for prefix in prefixes) <= 13, equal_to(True))
+        assert_that(MagicSquareSearch(3).prefixes(1), equal_to([(1,), (2,), (3,), (4,), (5,), (6,)]))
+
+    def test_explore(self):
+        """ Testing of MagicSquareSearch.explore method. """
+        search = MagicSquareSearch(3)
+        assert_that(search.explore((), 9), equal_to(search.search()))
+        assert_that(search.explore((4,), 9), equal_to([]))
+        # top right corner calculated from the row and has to be bigger than top left corner
+        assert_that(search.explore((6, 1), 3), equal_to([(6, 1, 8)]))
+        assert_that(search.explore((6, 7), 3), equal_to([]))
+
+    def test_symmetries(self):
+        """ Testing of MagicSquareSearch.symmetries static method. """
+        squares = MagicSquareSearch.symmetries((2, 9, 4, 7, 5, 3, 6, 1, 8))
+        assert_that(len(set(squares)), equal_to(8))
+        assert_that(all(is_magic(square) for square in squares), equal_to(True))
+        assert_that(squares[1], equal_to((6, 7, 2, 1, 5, 9, 8, 3, 4)))
+        assert_that(squares[4], equal_to((4, 9, 2, 3, 5, 7, 8, 1, 6)))
+
+    def test_findall(self):
+        """ Testing of MagicSquareSearch.findall method. """
+        squares = MagicSquareSearch(3).findall()
+        assert_that(len(squares), equal_to(8))
+        assert_that(squares, equal_to(sorted(squares)))
+        assert_that(MagicSquareSearch(3).findall(workers=2), equal_to(squares))
+
+        squares = MagicSquareSearch(4).findall(workers=2)
+        assert_that(len(squares), equal_to(7040))
+        assert_that(all(is_magic(square) for square in squares), equal_to(True))
+
+        assert_that(MagicSquareSearch(1).findall(), equal_to([(1,)]))
+        assert_that(MagicSquareSearch(1).findall(workers=2, depth=1), equal_to([(1,)]))
+
+    def test_search_magic_squares(self):
+        """ Testing of search_magic_squares function. """
+        assert_that(search_magic_squares((3, (2,))), equal_to(MagicSquareSearch(3).search()))
+        assert_that(search_magic_squares((3, (4,))), equal_to([]))
@@ -22,22 +22,29 @@
    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 # pylint: disable=R0201
+import os
+import operator
+import struct
+import tempfile
 import unittest
-from hamcrest import assert_that, equal_to
+from array import array
+from hamcrest import assert_that, equal_to, calling, raises, close_to
 from concept.math.matrix import Matrix
+from concept.math import matrix as matrix_module
 from concept.tools.decorator import validate_test_responsibility_for
 
 
-def create_matrix(width, height, start=1):
+def create_matrix(width, height, start=1, typecode=None):
     """
     Create a test matrix.
 
     :param width: number of columns for matrix
     :param height:  number of rows for matrix
     :param start: let value start with given value (default: 1)
+    :param typecode: storage of the matrix (default: list of rows)
     :returns: matrix instance
     """
-    matrix = Matrix(width, height)
+    matrix = Matrix(width, height, typecode)
     value = start
     for row in range(height):
         for column in range(width):
@@ -51,6 +58,8 @@ def create_matrix(width, height, start=1):
 @validate_test_responsibility_for(Matrix.Row, True)
 @validate_test_responsibility_for(Matrix.Column, True)
 @validate_test_responsibility_for(Matrix.Diagonal, True)
+@validate_test_responsibility_for(Matrix.View, True)
+@validate_test_responsibility_for(Matrix.Transposed, True)
 class TestMatrix(unittest.TestCase):
 
     """ Testing of class concept.math.matrix.Matrix. """
@@ -60,17 +69,27 @@ class TestMatrix(unittest.TestCase):
         matrix = Matrix(2, 3)
         assert_that(len(matrix.data), equal_to(3))
         assert_that(len(matrix.data[0]), equal_to(2))
+        assert_that(matrix.typecode, equal_to(None))
+        # row-major array storage
+        matrix = Matrix(2, 3, 'd')
+        assert_that(matrix.data, equal_to(array('d', [0.0] * 6)))
+        assert_that(matrix.typecode, equal_to('d'))
+        assert_that(matrix.width, equal_to(2))
+        assert_that(matrix.height, equal_to(3))
 
     def test_len(self):
         """ Testing of Matrix.height method. """
         matrix = Matrix(2, 3)
         assert_that(len(matrix), equal_to(3))
+        assert_that(len(Matrix(2, 3, 'q')), equal_to(3))
 
     def test_setitem(self):
         """ Testing of Matrix.__setitem__ method. """
         matrix = create_matrix(2, 2)
         assert_that(matrix.data[0], equal_to([1, 2]))
         assert_that(matrix.data[1], equal_to([3, 4]))
+        matrix = create_matrix(2, 2, typecode='q')
+        assert_that(matrix.data, equal_to(array('q', [1, 2, 3, 4])))
 
     def test_getitem(self):
         """ Testing of Matrix.__getitem__ method. """
@@ -79,6 +98,9 @@ class TestMatrix(unittest.TestCase):
         assert_that(matrix[1, 0], equal_to(2))
         assert_that(matrix[0, 1], equal_to(3))
         assert_that(matrix[1, 1], equal_to(4))
+        matrix = create_matrix(3, 2, typecode='d')
+        assert_that(matrix[2, 0], equal_to(3.0))
+        assert_that(matrix[0, 1], equal_to(4.0))
 
     def test_delitem(self):
         """ Testing of Matrix.__delitem__ method. """
@@ -89,10 +111,19 @@ class TestMatrix(unittest.TestCase):
         assert_that(matrix[1, 0], equal_to(0))
         assert_that(matrix[0, 1], equal_to(0))
 
+        matrix = create_matrix(2, 2, typecode='q')
+        del matrix[1, 0]
+        assert_that(matrix.data, equal_to(array('q', [1, 0, 3, 4])))
+
     def test_create_data(self):
         """ Testing of Matrix.create_data static method """
         assert_that(Matrix.create_data(3, 2), equal_to([[0, 0, 0], [0, 0, 0]]))
 
+    def test_create_flat_data(self):
+        """ Testing of Matrix.create_flat_data static method """
+        assert_that(Matrix.create_flat_data(3, 2, 'q'), equal_to(array('q', [0] * 6)))
+        assert_that(Matrix.create_flat_data(2, 2, 'd').itemsize, equal_to(8))
+
     def test_set(self):
         """ Testing of Matrix.set method """
         matrix = create_matrix(2, 2)
@@ -103,11 +134,17 @@ class TestMatrix(unittest.TestCase):
         success = matrix.set([1, 2, 3, 4, 5])
         assert_that(success, equal_to(False))
 
+        matrix = create_matrix(2, 2, typecode='q')
+        assert_that(matrix.set([99, 88, 77, 66]), equal_to(True))
+        assert_that([cell.get() for cell in matrix.cells()], equal_to([99, 77, 88, 66]))
+        assert_that(matrix.set([1, 2, 3, 4, 5]), equal_to(False))
+
     def test_repr(self):
         """ Testing of Matrix.__repr__ method """
         matrix = create_matrix(3, 2)
         expected = "Matrix(3x2:1,4,2,5,3,6)"
         assert_that(str(matrix), equal_to(expected))
+        assert_that(str(create_matrix(3, 2, typecode='q')), equal_to(expected))
 
     def test_rows(self):
         """ Testing of Matrix.rows method """
@@ -141,12 +178,131 @@ class TestMatrix(unittest.TestCase):
         values = [cell.get() for cell in matrix.cells()]
         self.assertEqual([1, 3, 2, 4], values)
 
+    def test_to_array(self):
+        """ Testing of Matrix.to_array method. """
+        assert_that(create_matrix(2, 2).to_array(), equal_to(array('d', [1, 2, 3, 4])))
+        assert_that(create_matrix(2, 2).to_array('q'), equal_to(array('q', [1, 2, 3, 4])))
+        matrix = create_matrix(2, 2, typecode='q')
+        assert_that(matrix.to_array(), equal_to(array('q', [1, 2, 3, 4])))
+        assert_that(matrix.to_array() is matrix.data, equal_to(False))
+        assert_that(matrix.to_array('d'), equal_to(array('d', [1, 2, 3, 4])))
+
+    def test_transpose(self):
+        """ Testing of Matrix.transpose method. """
+        matrix = create_matrix(3, 2)
+        view = matrix.transpose()
+        assert_that(isinstance(view, Matrix.Transposed), equal_to(True))
+        assert_that(view.matrix is matrix, equal_to(True))
+
+    def test_apply(self):
+        """ Testing of Matrix.apply method. """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(2, 2, typecode=typecode)
+            data = matrix.data
+            assert_that(matrix.apply(lambda value: value * value) is matrix, equal_to(True))
+            assert_that([row.get() for row in matrix.rows()], equal_to([[1, 4], [9, 16]]))
+            # values changed in place
+            assert_that(matrix.data is data, equal_to(True))
+            # with values of other matrices (of any storage)
+            matrix.apply(lambda a, b, c: a - b * c, create_matrix(2, 2, typecode='q'), create_matrix(2, 2))
+            assert_that([row.get() for row in matrix.rows()], equal_to([[0, 0], [0, 0]]))
+
+        matrix = create_matrix(2, 2)
+        matrix.lu_decomposition()
+        matrix.apply(abs)
+        assert_that(matrix.decomposition, equal_to(None))
+        assert_that(calling(matrix.apply).with_args(abs, 1), raises(TypeError))
+        assert_that(calling(matrix.apply).with_args(max, create_matrix(2, 3)), raises(ValueError))
+
+    def test_map(self):
+        """ Testing of Matrix.map method. """
+        matrix = create_matrix(2, 2, typecode='d')
+        result = matrix.map(lambda a, b: a / b, create_matrix(2, 2, start=2))
+        assert_that(result.data, equal_to(array('d', [0.5, 2.0 / 3.0, 0.75, 0.8])))
+        assert_that(matrix.data, equal_to(array('d', [1, 2, 3, 4])))
+
     def test_clone(self):
         """ Testing of Matrix.clone method """
         matrix_a = create_matrix(2, 2)
         matrix_b = matrix_a.clone()
         self.assertEqual(matrix_a.data, matrix_b.data)
 
+        matrix_a = create_matrix(3, 2, typecode='d')
+        matrix_b = matrix_a.clone()
+        assert_that(matrix_b.typecode, equal_to('d'))
+        assert_that((matrix_b.width, matrix_b.height), equal_to((3, 2)))
+        assert_that(matrix_b.data, equal_to(matrix_a.data))
+        matrix_b[0, 0] = 99
+        assert_that(matrix_a[0, 0], equal_to(1.0))
+
+    def test_save(self):
+        """ Testing of Matrix.save method. """
+        handle, path = tempfile.mkstemp(suffix=".npy")
+        os.close(handle)
+        try:
+            create_matrix(3, 2, typecode='q').save(path)
+            with open(path, 'rb') as stream:
+                content = stream.read()
+            assert_that(content[:10], equal_to(b"\x93NUMPY\x01\x00\x76\x00"))
+            assert_that(content[10:74].rstrip(), equal_to(
+                b"{'descr': '<i8', 'fortran_order': False, 'shape': (2, 3), }"))
+            assert_that(content[127:128], equal_to(b"\n"))
+            assert_that(content[128:], equal_to(struct.pack("<6q", 1, 2, 3, 4, 5, 6)))
+
+            # list of rows stored as 'd' by default
+            create_matrix(3, 2).save(path)
+            assert_that(Matrix.load(path).typecode, equal_to('d'))
+            create_matrix(3, 2).save(path, 'B')
+            assert_that(Matrix.load(path).data.tolist(), equal_to([1, 2, 3, 4, 5, 6]))
+            assert_that(calling(create_matrix(2, 2).save).with_args(path, 'u'), raises(ValueError))
+
+            if matrix_module.numpy is not None:
+                create_matrix(3, 2, typecode='d').save(path)
+                assert_that(matrix_module.numpy.load(path).tolist(), equal_to([[1, 2, 3], [4, 5, 6]]))
+        finally:
+            os.remove(path)
+
+    def test_load(self):
+        """ Testing of Matrix.load method. """
+        handle, path = tempfile.mkstemp(suffix=".npy")
+        os.close(handle)
+        try:
+            create_matrix(3, 2, typecode='d').save(path)
+            for mmap in (True, False):
+                matrix = Matrix.load(path, mmap)
+                assert_that((matrix.width, matrix.height, matrix.typecode), equal_to((3, 2, 'd')))
+                assert_that([row.get() for row in matrix.rows()], equal_to([[1, 2, 3], [4, 5, 6]]))
+                assert_that(isinstance(matrix.data, memoryview), equal_to(mmap))
+                # changes are not written to the file
+                matrix[0, 0] = 9
+                matrix.Row(0, matrix).swap(matrix.Row(1, matrix))
+                matrix.Column(0, matrix).swap(matrix.Column(2, matrix))
+                assert_that([row.get() for row in matrix.rows()], equal_to([[6, 5, 4], [3, 2, 9]]))
+                assert_that(matrix.clone().data, equal_to(array('d', [6, 5, 4, 3, 2, 9])))
+
+            assert_that(Matrix.load(path).data.tolist(), equal_to([1, 2, 3, 4, 5, 6]))
+
+            # values stored big-endian
+            with open(path, 'wb') as stream:
+                header = "{'descr': '>i4', 'fortran_order': False, 'shape': (1, 2), }"
+                stream.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode())
+                stream.write(struct.pack(">2i", 1, -2))
+            assert_that(Matrix.load(path).data, equal_to(array('i', [1, -2])))
+
+            with open(path, 'wb') as stream:
+                stream.write(b"not a NPY file")
+            assert_that(calling(Matrix.load).with_args(path), raises(ValueError))
+
+            if matrix_module.numpy is not None:
+                matrix_module.numpy.save(path, matrix_module.numpy.arange(6).reshape(3, 2))
+                matrix = Matrix.load(path)
+                assert_that((matrix.width, matrix.height), equal_to((2, 3)))
+                assert_that(matrix.Column(1, matrix).get(), equal_to([1, 3, 5]))
+                matrix_module.numpy.save(path, matrix_module.numpy.arange(6))
+                assert_that(calling(Matrix.load).with_args(path), raises(ValueError))
+        finally:
+            os.remove(path)
+
     def test_add(self):
         """ Testing of Matrix.__add__ method. """
         matrix_a = create_matrix(2, 2, start=1)
@@ -157,7 +313,43 @@ class TestMatrix(unittest.TestCase):
             self.assertEqual(expected, given)
 
         # you cannot say: "matrix + 1234"
-        self.assertRaises(TypeError, matrix_a.__add__, 1234)
+        self.assertRaises(TypeError, operator.add, matrix_a, 1234)
+        assert_that(matrix_a.__add__(1234), equal_to(NotImplemented))
+
+    def test_iadd(self):
+        """ Testing of Matrix.__iadd__ method. """
+        matrix = create_matrix(2, 2, typecode='q')
+        data = matrix.data
+        matrix += create_matrix(2, 2, start=10)
+        assert_that(matrix.data is data, equal_to(True))
+        assert_that(matrix.data, equal_to(array('q', [11, 13, 15, 17])))
+        assert_that(calling(matrix.__iadd__).with_args(1), raises(TypeError))
+
+    def test_isub(self):
+        """ Testing of Matrix.__isub__ method. """
+        matrix = create_matrix(2, 2)
+        matrix -= create_matrix(2, 2, start=10, typecode='q')
+        assert_that(matrix.data, equal_to([[-9, -9], [-9, -9]]))
+        assert_that(calling(matrix.__isub__).with_args(1), raises(TypeError))
+
+    def test_imul(self):
+        """ Testing of Matrix.__imul__ method. """
+        matrix = create_matrix(2, 2)
+        same = matrix
+        matrix *= 3
+        assert_that(matrix is same, equal_to(True))
+        assert_that(matrix.data, equal_to([[3, 6], [9, 12]]))
+        matrix *= create_matrix(1, 2)
+        assert_that(matrix.data, equal_to([[15], [33]]))
+        assert_that(calling(matrix.__imul__).with_args("text"), raises(TypeError))
+
+        matrix = create_matrix(2, 2, typecode='q')
+        matrix *= 2.5
+        assert_that(matrix.typecode, equal_to('d'))
+        assert_that(matrix.data, equal_to(array('d', [2.5, 5.0, 7.5, 10.0])))
+        matrix = create_matrix(2, 2, typecode='q')
+        matrix *= 2
+        assert_that(matrix.data, equal_to(array('q', [2, 4, 6, 8])))
 
     def test_flip(self):
         """ Testing of Matrix.flip method """
@@ -237,12 +429,56 @@ class TestMatrix(unittest.TestCase):
         # wrong type to swap with
         self.assertRaises(TypeError, cell_a.swap, 1234)
 
+    def test_view_position(self):
+        """ Testing of Matrix.View.position method. """
+        row = Matrix.Row(0, create_matrix(3, 2))
+        assert_that([row.position(index) for index in (0, 2, -1, -3)], equal_to([0, 2, 2, 0]))
+        assert_that(calling(row.position).with_args(3), raises(IndexError))
+        assert_that(calling(row.position).with_args(-4), raises(IndexError))
+
+    def test_view_getitem(self):
+        """ Testing of Matrix.View.__getitem__ method. """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(3, 2, typecode=typecode)
+            assert_that(Matrix.Row(1, matrix)[-1], equal_to(6))
+            assert_that(Matrix.Column(1, matrix)[1], equal_to(5))
+            assert_that(Matrix.Diagonal(0, 1, 1, -1, matrix)[1], equal_to(2))
+            assert_that(Matrix.Row(1, matrix)[1:], equal_to([5, 6]))
+            assert_that(Matrix.Column(2, matrix)[::-1], equal_to([6, 3]))
+
+    def test_view_setitem(self):
+        """ Testing of Matrix.View.__setitem__ method. """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(3, 2, typecode=typecode)
+            Matrix.Row(1, matrix)[0] = 40
+            Matrix.Column(2, matrix)[-2] = 30
+            Matrix.Diagonal(0, 0, 1, 1, matrix)[1] = 50
+            assert_that([row.get() for row in matrix.rows()], equal_to([[1, 2, 30], [40, 50, 6]]))
+            Matrix.Row(0, matrix)[:2] = [10, 20]
+            assert_that(Matrix.Row(0, matrix).get(), equal_to([10, 20, 30]))
+            assert_that(calling(Matrix.Row(0, matrix).__setitem__).with_args(slice(0, 2), [1]),
+                        raises(ValueError))
+
     def test_row_init(self):
         """ Testing of Matrix.Row.__init__ method """
         instance = Matrix.Row(1, None)
         self.assertEqual(1, instance.row)
         self.assertEqual(None, instance.matrix)
 
+    def test_row_len(self):
+        """ Testing of Matrix.Row.__len__ method """
+        assert_that(len(Matrix.Row(0, create_matrix(3, 2, typecode='q'))), equal_to(3))
+
+    def test_row_iter(self):
+        """ Testing of Matrix.Row.__iter__ method """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(3, 2, typecode=typecode)
+            assert_that([list(row) for row in matrix.rows()], equal_to([[1, 2, 3], [4, 5, 6]]))
+
+    def test_row_location(self):
+        """ Testing of Matrix.Row.location method """
+        assert_that(Matrix.Row(1, create_matrix(3, 2)).location(-1), equal_to((2, 1)))
+
     def test_row_set(self):
         """ Testing of Matrix.Row.set method """
         matrix = create_matrix(2, 2)
@@ -253,6 +489,13 @@ class TestMatrix(unittest.TestCase):
         values = [cell.get() for cell in matrix.cells()]
         self.assertEqual([1, 5, 2, 6], values)
 
+        matrix = create_matrix(3, 2, typecode='q')
+        list(matrix.rows())[0].set([7, 8, 9])
+        assert_that(matrix.data, equal_to(array('q', [7, 8, 9, 4, 5, 6])))
+        # another row view as source of the values
+        list(matrix.rows())[1].set(list(matrix.rows())[0])
+        assert_that(matrix.data, equal_to(array('q', [7, 8, 9, 7, 8, 9])))
+
     def test_row_get(self):
         """ Testing of Matrix.Row.get method """
         matrix = create_matrix(2, 2)
@@ -262,6 +505,8 @@ class TestMatrix(unittest.TestCase):
         # last row:
         row = list(matrix.rows())[-1]
         self.assertEqual([3, 4], row.get())
+        matrix = create_matrix(3, 2, typecode='q')
+        assert_that([row.get() for row in matrix.rows()], equal_to([[1, 2, 3], [4, 5, 6]]))
 
     def test_row_swap(self):
         """ Testing of Matrix.Row.swap method """
@@ -275,6 +520,15 @@ class TestMatrix(unittest.TestCase):
         # wrong type to swap with
         self.assertRaises(TypeError, row_a.swap, 1234)
 
+        matrix = create_matrix(3, 2, typecode='q')
+        list(matrix.rows())[0].swap(list(matrix.rows())[1])
+        assert_that(matrix.data, equal_to(array('q', [4, 5, 6, 1, 2, 3])))
+        # rows of different matrices
+        other = create_matrix(3, 2, start=7)
+        Matrix.Row(0, matrix).swap(Matrix.Row(1, other))
+        assert_that(matrix.data, equal_to(array('q', [10, 11, 12, 1, 2, 3])))
+        assert_that(other.data, equal_to([[7, 8, 9], [4, 5, 6]]))
+
     def test_row_cells(self):
         """ Testing of Matrix.Row.cells method """
         matrix = create_matrix(2, 2)
@@ -287,6 +541,20 @@ class TestMatrix(unittest.TestCase):
         self.assertEqual(1, instance.column)
         self.assertEqual(None, instance.matrix)
 
+    def test_column_len(self):
+        """ Testing of Matrix.Column.__len__ method """
+        assert_that(len(Matrix.Column(0, create_matrix(3, 2, typecode='q'))), equal_to(2))
+
+    def test_column_iter(self):
+        """ Testing of Matrix.Column.__iter__ method """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(3, 2, typecode=typecode)
+            assert_that([list(column) for column in matrix.columns()], equal_to([[1, 4], [2, 5], [3, 6]]))
+
+    def test_column_location(self):
+        """ Testing of Matrix.Column.location method """
+        assert_that(Matrix.Column(2, create_matrix(3, 2)).location(1), equal_to((2, 1)))
+
     def test_column_get(self):
         """ Testing of Matrix.Row.get method """
         matrix = create_matrix(2, 2)
@@ -296,6 +564,9 @@ class TestMatrix(unittest.TestCase):
         # last row:
         column = list(matrix.columns())[-1]
         self.assertEqual([2, 4], column.get())
+        matrix = create_matrix(3, 2, typecode='q')
+        assert_that([column.get() for column in matrix.columns()],
+                    equal_to([[1, 4], [2, 5], [3, 6]]))
 
     def test_column_set(self):
         """ Testing of Matrix.Row.set method """
@@ -307,6 +578,10 @@ class TestMatrix(unittest.TestCase):
         values = [cell.get() for cell in matrix.cells()]
         self.assertEqual([1, 3, 5, 6], values)
 
+        matrix = create_matrix(3, 2, typecode='q')
+        list(matrix.columns())[1].set([8, 9])
+        assert_that(matrix.data, equal_to(array('q', [1, 8, 3, 4, 9, 6])))
+
     def test_column_swap(self):
         """ Testing of Matrix.Column.swap method """
         matrix = create_matrix(2, 2)
@@ -319,6 +594,10 @@ class TestMatrix(unittest.TestCase):
         # wrong type to swap with
         self.assertRaises(TypeError, column_a.swap, 1234)
 
+        matrix = create_matrix(3, 2, typecode='q')
+        Matrix.Column(0, matrix).swap(Matrix.Column(2, matrix))
+        assert_that(matrix.data, equal_to(array('q', [3, 2, 1, 6, 5, 4])))
+
     def test_column_cells(self):
         """ Testing of Matrix.Column.cells method """
         matrix = create_matrix(2, 2)
@@ -334,6 +613,25 @@ class TestMatrix(unittest.TestCase):
         self.assertEqual(3, instance.step_row)
         self.assertEqual(None, instance.matrix)
 
+    def test_diagonal_len(self):
+        """ Testing of Matrix.Diagonal.__len__ method """
+        matrix = create_matrix(3, 2)
+        assert_that([len(diagonal) for diagonal in matrix.diagonals()], equal_to([1, 2, 2, 1]))
+        assert_that(len(Matrix.Diagonal(3, 0, 1, 1, matrix)), equal_to(0))
+
+    def test_diagonal_iter(self):
+        """ Testing of Matrix.Diagonal.__iter__ method """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(3, 2, typecode=typecode)
+            assert_that([list(diagonal) for diagonal in matrix.diagonals()],
+                        equal_to([[1], [4, 2], [5, 3], [6]]))
+
+    def test_diagonal_location(self):
+        """ Testing of Matrix.Diagonal.location method """
+        diagonal = Matrix.Diagonal(0, 1, 1, -1, create_matrix(3, 2))
+        assert_that([diagonal.location(index) for index in range(2)], equal_to([(0, 1), (1, 0)]))
+        assert_that(calling(diagonal.location).with_args(2), raises(IndexError))
+
     def test_diagonal_get(self):
         """ Testing of Matrix.Diagonal.get method """
         matrix = create_matrix(2, 2)
@@ -343,6 +641,14 @@ class TestMatrix(unittest.TestCase):
         self.assertEqual([3, 2], diagonals[1].get())
         self.assertEqual([4], diagonals[2].get())
 
+        for width, height in ((1, 1), (3, 2), (2, 3), (4, 4)):
+            matrix_a = create_matrix(width, height)
+            matrix_b = create_matrix(width, height, typecode='q')
+            assert_that([diagonal.get() for diagonal in matrix_b.diagonals()],
+                        equal_to([diagonal.get() for diagonal in matrix_a.diagonals()]))
+            assert_that([diagonal.get() for diagonal in matrix_b.main_diagonals()],
+                        equal_to([diagonal.get() for diagonal in matrix_a.main_diagonals()]))
+
     def test_diagonal_cells(self):
         """ Testing of Matrix.Diagonal.cells method. """
         matrix = create_matrix(2, 2)
@@ -359,6 +665,22 @@ class TestMatrix(unittest.TestCase):
         values = [cell.get() for cell in matrix.cells()]
         self.assertEqual([1, 8, 9, 4], values)
 
+        matrix = create_matrix(3, 3, typecode='q')
+        list(matrix.main_diagonals())[1].set([70, 50, 30])
+        assert_that(matrix.data, equal_to(array('q', [1, 2, 30, 4, 50, 6, 70, 8, 9])))
+
+    def test_diagonal_flat_slice(self):
+        """ Testing of Matrix.Diagonal.flat_slice method. """
+        matrix = create_matrix(3, 2, typecode='q')
+        assert_that(Matrix.Diagonal(0, 0, 1, 1, matrix).flat_slice(), equal_to(slice(0, 8, 4)))
+        # reaching the first value of the storage (end of slice must not be -1)
+        assert_that(Matrix.Diagonal(0, 1, 1, -1, matrix).flat_slice(), equal_to(slice(3, None, -2)))
+        assert_that(Matrix.Diagonal(1, 1, -1, -1, matrix).flat_slice(), equal_to(slice(4, None, -4)))
+        assert_that(Matrix.Diagonal(2, 1, 0, 0, matrix).flat_slice(), equal_to(slice(5, 6)))
+        assert_that(Matrix.Diagonal(3, 0, 1, 1, matrix).flat_slice(), equal_to(slice(0, 0)))
+        matrix = create_matrix(3, 3, typecode='q')
+        assert_that(Matrix.Diagonal(0, 2, 1, -1, matrix).flat_slice(), equal_to(slice(6, 0, -2)))
+
     def test_mul(self):
         """ Testing of Matrix.__mul__ method """
         self.sub_test_mul_factor()
@@ -372,6 +694,13 @@ class TestMatrix(unittest.TestCase):
         values = [cell.get() for cell in matrix_b.cells()]
         self.assertEqual([10, 30, 20, 40], values)
 
+        # float factor on integer storage
+        matrix_a = create_matrix(2, 2, typecode='q')
+        matrix_b = matrix_a * 2.5
+        assert_that(matrix_b.typecode, equal_to('d'))
+        assert_that(matrix_b.data, equal_to(array('d', [2.5, 5.0, 7.5, 10.0])))
+        assert_that(matrix_a.data, equal_to(array('q', [1, 2, 3, 4])))
+
     def sub_test_mul_matrix_matrix(self):
         """ Testing of Matrix.__mul__ method of two matrices """
         matrix_a = create_matrix(3, 4)
@@ -384,7 +713,198 @@ class TestMatrix(unittest.TestCase):
         for expected, given in zip(expected_rows, [row.get() for row in matrix_c.rows()]):
             self.assertEqual(expected, given)
 
+        matrix_c = create_matrix(3, 4, typecode='q') * create_matrix(2, 3, typecode='q')
+        assert_that(matrix_c.typecode, equal_to('q'))
+        assert_that([row.get() for row in matrix_c.rows()], equal_to(expected_rows))
+
     def sub_test_mul_bad(self):
         """ Testing of Matrix.__mul__ method of a matrix with an unsupported object. """
         matrix = create_matrix(2, 2)
-        assert_that(matrix * "text", equal_to(None))
+        assert_that(matrix.__mul__("text"), equal_to(NotImplemented))
+        assert_that(calling(operator.mul).with_args(matrix, "text"), raises(TypeError))
+        # width of first matrix has to be the height of the second one
+        assert_that(calling(matrix.__mul__).with_args(create_matrix(2, 3)), raises(ValueError))
+
+    def test_product_typecode(self):
+        """ Testing of Matrix.product_typecode method. """
+        assert_that(Matrix(1, 1).product_typecode(Matrix(1, 1, 'q')), equal_to(None))
+        assert_that(Matrix(1, 1, 'q').product_typecode(Matrix(1, 1, 'q')), equal_to('q'))
+        assert_that(Matrix(1, 1, 'q').product_typecode(Matrix(1, 1, 'd')), equal_to('d'))
+        assert_that(Matrix(1, 1, 'q').product_typecode(Matrix(1, 1)), equal_to('d'))
+        matrix = create_matrix(2, 2, typecode='q') * create_matrix(2, 2, start=0.5, typecode='d')
+        assert_that(matrix.data, equal_to(array('d', [5.5, 8.5, 11.5, 18.5])))
+
+    def test_multiply_cells(self):
+        """ Testing of Matrix.multiply_cells method. """
+        matrix_c = create_matrix(3, 4).multiply_cells(create_matrix(2, 3))
+        assert_that([row.get() for row in matrix_c.rows()],
+                    equal_to([[22, 28], [49, 64], [76, 100], [103, 136]]))
+
+    def test_multiply_blocked(self):
+        """ Testing of Matrix.multiply_blocked method. """
+        for typecode_a, typecode_b in ((None, None), ('q', 'q'), ('d', None), (None, 'q'), ('q', 'd')):
+            matrix_a = create_matrix(5, 4, typecode=typecode_a)
+            matrix_b = create_matrix(7, 5, start=-10, typecode=typecode_b)
+            expected = [row.get() for row in matrix_a.multiply_cells(matrix_b).rows()]
+            for block_size in (1, 3, 64):
+                matrix_c = matrix_a.multiply_blocked(matrix_b, block_size)
+                assert_that(matrix_c.typecode, equal_to(matrix_a.product_typecode(matrix_b)))
+                assert_that((matrix_c.width, matrix_c.height), equal_to((7, 4)))
+                assert_that([row.get() for row in matrix_c.rows()], equal_to(expected))
+
+    def test_multiply_parallel(self):
+        """ Testing of Matrix.multiply_parallel method. """
+        for typecode_a, typecode_b in ((None, None), ('q', 'q'), ('d', 'd'), ('q', 'd')):
+            matrix_a = create_matrix(5, 9, typecode=typecode_a)
+            matrix_b = create_matrix(7, 5, start=-10, typecode=typecode_b)
+            expected = [row.get() for row in matrix_a.multiply_cells(matrix_b).rows()]
+            for workers in (1, 2):
+                matrix_c = matrix_a.multiply_parallel(matrix_b, workers)
+                assert_that(matrix_c.typecode, equal_to(matrix_a.product_typecode(matrix_b) or 'd'))
+                assert_that((matrix_c.width, matrix_c.height), equal_to((7, 9)))
+                assert_that([row.get() for row in matrix_c.rows()], equal_to(expected))
+
+        assert_that(calling(create_matrix(2, 2).multiply_parallel).with_args(create_matrix(2, 3)),
+                    raises(ValueError))
+
+    def test_multiply_numpy(self):
+        """ Testing of Matrix.multiply_numpy method. """
+        if matrix_module.numpy is None:
+            matrix = create_matrix(2, 2)
+            assert_that(calling(matrix.multiply_numpy).with_args(matrix), raises(ImportError))
+            return
+
+        for typecode_a, typecode_b in ((None, None), ('q', 'q'), ('d', 'd'), ('d', None), ('q', 'd')):
+            matrix_a = create_matrix(5, 4, typecode=typecode_a)
+            matrix_b = create_matrix(7, 5, start=-10, typecode=typecode_b)
+            matrix_c = matrix_a.multiply_numpy(matrix_b)
+            assert_that(matrix_c.typecode, equal_to(matrix_a.product_typecode(matrix_b)))
+            assert_that([row.get() for row in matrix_c.rows()],
+                        equal_to([row.get() for row in matrix_a.multiply_cells(matrix_b).rows()]))
+
+    def test_lu_decomposition(self):
+        """ Testing of Matrix.lu_decomposition method. """
+        matrix = create_matrix(2, 2)
+        rows, permutation, sign = matrix.lu_decomposition()
+        # pivot 3 (second row) first: [3, 4] and 1/3 * [3, 4] + [0, 2 - 4/3]
+        assert_that(permutation, equal_to([1, 0]))
+        assert_that(sign, equal_to(-1))
+        assert_that(rows[0], equal_to([3.0, 4.0]))
+        assert_that(rows[1][0], close_to(1.0 / 3.0, 1e-12))
+        assert_that(rows[1][1], close_to(2.0 / 3.0, 1e-12))
+        # calculated once
+        assert_that(matrix.lu_decomposition() is matrix.lu_decomposition(), equal_to(True))
+        # reset by any change
+        for change in (lambda: matrix.__setitem__((0, 0), 5), lambda: matrix.set([1, 2, 3, 4]),
+                       lambda: list(matrix.rows())[0].set([1, 2]),
+                       lambda: list(matrix.columns())[0].set([1, 3]),
+                       lambda: list(matrix.main_diagonals())[0].set([1, 4]),
+                       lambda: matrix.flip(True, False)):
+            matrix.lu_decomposition()
+            change()
+            assert_that(matrix.decomposition, equal_to(None))
+
+        assert_that(create_matrix(2, 2, typecode='q').lu_decomposition()[0], equal_to(rows))
+        assert_that(calling(create_matrix(3, 2).lu_decomposition), raises(ValueError))
+
+    def test_determinant(self):
+        """ Testing of Matrix.determinant method. """
+        assert_that(create_matrix(2, 2).determinant(), close_to(-2.0, 1e-12))
+        # linear dependent rows
+        assert_that(create_matrix(3, 3).determinant(), equal_to(0.0))
+        matrix = Matrix(3, 3, 'd')
+        matrix.set([2, 0, 1, 1, 3, 2, 1, 1, 2])
+        assert_that(matrix.determinant(), close_to(6.0, 1e-12))
+        matrix[0, 0] = 3
+        assert_that(matrix.determinant(), close_to(10.0, 1e-12))
+        # badly scaled but invertible
+        matrix = Matrix(2, 2, 'd')
+        matrix.set([1e13, 0, 0, 1])
+        assert_that(matrix.determinant(), close_to(1e13, 1e-3))
+        matrix = Matrix(3, 3, 'd')
+        matrix.set([1e6, 0, 0, 0, 1e-7, 0, 0, 0, 1])
+        assert_that(matrix.determinant(), close_to(0.1, 1e-12))
+        matrix.set([1e6, 2e6, 0, 1e-7, 1e-7, 0, 0, 0, 1])
+        assert_that(matrix.determinant(), close_to(-0.1, 1e-12))
+        # linear dependent rows with rounding errors
+        matrix.set([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+        assert_that(matrix.determinant(), equal_to(0.0))
+
+    def test_solve(self):
+        """ Testing of Matrix.solve method. """
+        matrix = Matrix(3, 3)
+        matrix.set([2, 1, -1, -3, -1, 2, -2, 1, 2])
+        for given, expected in zip(matrix.solve([8, -11, -3]), [2.0, 3.0, -1.0]):
+            assert_that(given, close_to(expected, 1e-12))
+
+        # one solution per column
+        values = create_matrix(2, 3, typecode='q')
+        solution = matrix.solve(values)
+        assert_that(solution.typecode, equal_to('d'))
+        for expected, given in zip([row.get() for row in values.rows()],
+                                   [row.get() for row in (matrix * solution).rows()]):
+            for expected_value, given_value in zip(expected, given):
+                assert_that(given_value, close_to(expected_value, 1e-12))
+
+        assert_that(calling(matrix.solve).with_args([1, 2]), raises(ValueError))
+        assert_that(calling(create_matrix(3, 3).solve).with_args([1, 2, 3]), raises(ValueError))
+
+    def test_inverse(self):
+        """ Testing of Matrix.inverse method. """
+        matrix = Matrix(2, 2, 'q')
+        matrix.set([4, 7, 2, 6])
+        inverse = matrix.inverse()
+        assert_that(inverse.typecode, equal_to('d'))
+        for given, expected in zip(inverse.data, [0.6, -0.7, -0.2, 0.4]):
+            assert_that(given, close_to(expected, 1e-12))
+        assert_that(create_matrix(2, 2).inverse().typecode, equal_to(None))
+        assert_that(calling(create_matrix(3, 3).inverse), raises(ValueError))
+        # badly scaled but invertible
+        matrix = Matrix(2, 2, 'd')
+        matrix.set([1e13, 0, 0, 1])
+        assert_that(matrix.inverse().data, equal_to(array('d', [1e-13, 0, 0, 1])))
+
+    def test_transposed_init(self):
+        """ Testing of Matrix.Transposed.__init__ method. """
+        matrix = create_matrix(3, 2)
+        view = Matrix.Transposed(matrix)
+        assert_that(view.matrix is matrix, equal_to(True))
+        assert_that((view.width, view.height), equal_to((2, 3)))
+
+    def test_transposed_len(self):
+        """ Testing of Matrix.Transposed.__len__ method. """
+        assert_that(len(create_matrix(3, 2).transpose()), equal_to(3))
+
+    def test_transposed_getitem(self):
+        """ Testing of Matrix.Transposed.__getitem__ method. """
+        view = create_matrix(3, 2, typecode='q').transpose()
+        assert_that([view[column, 2] for column in range(2)], equal_to([3, 6]))
+
+    def test_transposed_setitem(self):
+        """ Testing of Matrix.Transposed.__setitem__ method. """
+        matrix = create_matrix(3, 2)
+        matrix.transpose()[1, 2] = 60
+        assert_that(matrix[2, 1], equal_to(60))
+
+    def test_transposed_rows(self):
+        """ Testing of Matrix.Transposed.rows method. """
+        view = create_matrix(3, 2).transpose()
+        assert_that([list(row) for row in view.rows()], equal_to([[1, 4], [2, 5], [3, 6]]))
+
+    def test_transposed_columns(self):
+        """ Testing of Matrix.Transposed.columns method. """
+        view = create_matrix(3, 2).transpose()
+        assert_that([list(column) for column in view.columns()], equal_to([[1, 2, 3], [4, 5, 6]]))
+
+    def test_transposed_transpose(self):
+        """ Testing of Matrix.Transposed.transpose method. """
+        matrix = create_matrix(3, 2)
+        assert_that(matrix.transpose().transpose() is matrix, equal_to(True))
+
+    def test_transposed_clone(self):
+        """ Testing of Matrix.Transposed.clone method. """
+        for typecode in (None, 'd'):
+            matrix = create_matrix(3, 2, typecode=typecode).transpose().clone()
+            assert_that(matrix.typecode, equal_to(typecode))
+            assert_that((matrix.width, matrix.height), equal_to((2, 3)))
+            assert_that([row.get() for row in matrix.rows()], equal_to([[1, 4], [2, 5], [3, 6]]))
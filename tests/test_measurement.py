@@ -24,8 +24,9 @@
 # pylint: disable=R0201
 import unittest
 import time
-from hamcrest import assert_that, greater_than_or_equal_to
-from concept.performance.measurement import track_duration_of
+from hamcrest import assert_that, greater_than_or_equal_to, equal_to, less_than
+from concept.performance.measurement import track_duration_of, track_durations_of
+from concept.performance.measurement import track_peak_memory_of
 
 
 class TestMeasurement(unittest.TestCase):
@@ -38,3 +39,17 @@ class TestMeasurement(unittest.TestCase):
         assert_that(duration, greater_than_or_equal_to(0.25))
         duration = track_duration_of(lambda: time.sleep(0.5))
         assert_that(duration, greater_than_or_equal_to(0.5))
+
+    def test_track_durations_of(self):
+        """ Testing measurement with repeats and warmup. """
+        calls = []
+        durations = track_durations_of(lambda: calls.append(time.sleep(0.01)), repeats=2, warmup=1)
+        assert_that(len(durations), equal_to(2))
+        assert_that(len(calls), equal_to(3))
+        assert_that(min(durations), greater_than_or_equal_to(0.01))
+
+    def test_track_peak_memory_of(self):
+        """ Testing measurement of peak memory. """
+        peak = track_peak_memory_of(lambda size: len(bytearray(size)), 10 ** 6)
+        assert_that(peak, greater_than_or_equal_to(10 ** 6))
+        assert_that(peak, less_than(2 * 10 ** 6))
@@ -28,6 +28,13 @@ import unittest
 from hamcrest import assert_that, equal_to
 from concept.math.number import is_square, triangle, is_triangle, pentagonal, is_pentagonal
 from concept.math.number import hexagonal, is_hexagonal, is_abundant
+from concept.math.number import divisor_sum_table, divisor_count_table, totient_table, mobius_table
+from concept.math.number import abundant_numbers, perfect_numbers, primes_up_to
+from concept.math.number import square, squares_up_to, squares_between, triangles_up_to
+from concept.math.number import triangles_between, pentagonals_up_to, pentagonals_between
+from concept.math.number import hexagonals_up_to, hexagonals_between, classify_range
+from concept.math.factorization import divisors, factorize
+from concept.primes.factor_sieve import factor_sieve
 
 
 class TestNumber(unittest.TestCase):
@@ -39,6 +46,17 @@ class TestNumber(unittest.TestCase):
         given = [n for n in range(1, 100 + 1) if is_square(n)]
         expected = [1, 4, 9, 16, 25, 36, 49, 64, 81, 100]
         assert_that(expected, equal_to(given))
+        assert_that(is_square(0), equal_to(True))
+        assert_that(is_square(-4), equal_to(False))
+        # beyond the precision of a float
+        assert_that(is_square((2 ** 53 + 1) ** 2), equal_to(True))
+        assert_that(is_square((2 ** 53 + 1) ** 2 - 1), equal_to(False))
+        assert_that(is_square((10 ** 40 + 3) ** 2), equal_to(True))
+        assert_that(is_square((10 ** 40 + 3) ** 2 + 1), equal_to(False))
+
+    def test_square(self):
+        """ Testing square function. """
+        assert_that([square(n) for n in range(5)], equal_to([0, 1, 4, 9, 16]))
 
     def test_triangle(self):
         """ Testing triangle function. """
@@ -50,6 +68,8 @@ class TestNumber(unittest.TestCase):
         """ Testing is_triangle function. """
         assert_that(is_triangle(10), equal_to(True))
         assert_that(is_triangle(4), equal_to(False))
+        assert_that(is_triangle(triangle(2 ** 60 + 1)), equal_to(True))
+        assert_that(is_triangle(triangle(2 ** 60 + 1) + 1), equal_to(False))
 
     def test_penatgonal(self):
         """ Testing pentagonal function. """
@@ -62,6 +82,12 @@ class TestNumber(unittest.TestCase):
         assert_that(is_pentagonal(23), equal_to(False))
         assert_that(is_pentagonal(22), equal_to(True))
         assert_that(is_pentagonal(21), equal_to(False))
+        assert_that(is_pentagonal(0), equal_to(False))
+        assert_that(is_pentagonal(-1), equal_to(False))
+        assert_that(is_pentagonal(pentagonal(2 ** 60 + 1)), equal_to(True))
+        assert_that(is_pentagonal(pentagonal(2 ** 60 + 1) + 1), equal_to(False))
+        expected = [pentagonal(n) for n in range(1, 100)]
+        assert_that([n for n in range(expected[-1] + 1) if is_pentagonal(n)], equal_to(expected))
 
     def test_hexagonal(self):
         """ Testing hexagonal function. """
@@ -74,8 +100,121 @@ class TestNumber(unittest.TestCase):
         assert_that(is_hexagonal(44), equal_to(False))
         assert_that(is_hexagonal(45), equal_to(True))
         assert_that(is_hexagonal(46), equal_to(False))
+        assert_that(is_hexagonal(0), equal_to(False))
+        assert_that(is_hexagonal(hexagonal(2 ** 60 + 1)), equal_to(True))
+        assert_that(is_hexagonal(hexagonal(2 ** 60 + 1) + 1), equal_to(False))
+        expected = [hexagonal(n) for n in range(1, 100)]
+        assert_that([n for n in range(expected[-1] + 1) if is_hexagonal(n)], equal_to(expected))
+
+    def test_squares_up_to(self):
+        """ Testing squares_up_to function. """
+        assert_that(list(squares_up_to(50)), equal_to([1, 4, 9, 16, 25, 36, 49]))
+        assert_that(list(squares_up_to(0)), equal_to([]))
+
+    def test_squares_between(self):
+        """ Testing squares_between function. """
+        assert_that(list(squares_between(16, 49)), equal_to([16, 25, 36, 49]))
+        assert_that(list(squares_between(17, 48)), equal_to([25, 36]))
+        assert_that(list(squares_between(26, 35)), equal_to([]))
+        low = (2 ** 60 + 1) ** 2
+        assert_that(list(squares_between(low, low + 2 * 2 ** 60 + 3)),
+                    equal_to([low, (2 ** 60 + 2) ** 2]))
+
+    def test_triangles_up_to(self):
+        """ Testing triangles_up_to function. """
+        assert_that(list(triangles_up_to(55)), equal_to([triangle(n) for n in range(1, 11)]))
+
+    def test_triangles_between(self):
+        """ Testing triangles_between function. """
+        for low in range(-2, 40):
+            for high in range(low - 1, 60):
+                expected = [triangle(n) for n in range(1, 12) if low <= triangle(n) <= high]
+                assert_that(list(triangles_between(low, high)), equal_to(expected))
+
+    def test_pentagonals_up_to(self):
+        """ Testing pentagonals_up_to function. """
+        assert_that(list(pentagonals_up_to(145)), equal_to([pentagonal(n) for n in range(1, 11)]))
+
+    def test_pentagonals_between(self):
+        """ Testing pentagonals_between function. """
+        for low in range(-2, 60):
+            for high in range(low - 1, 80):
+                expected = [pentagonal(n) for n in range(1, 9) if low <= pentagonal(n) <= high]
+                assert_that(list(pentagonals_between(low, high)), equal_to(expected))
+
+    def test_hexagonals_up_to(self):
+        """ Testing hexagonals_up_to function. """
+        assert_that(list(hexagonals_up_to(190)), equal_to([hexagonal(n) for n in range(1, 11)]))
+
+    def test_hexagonals_between(self):
+        """ Testing hexagonals_between function. """
+        for low in range(-2, 60):
+            for high in range(low - 1, 100):
+                expected = [hexagonal(n) for n in range(1, 9) if low <= hexagonal(n) <= high]
+                assert_that(list(hexagonals_between(low, high)), equal_to(expected))
+
+    def test_classify_range(self):
+        """ Testing classify_range function. """
+        given = classify_range(1, 2000)
+        for number in range(1, 2001):
+            expected = [kind for kind, check in (("square", is_square), ("triangle", is_triangle),
+                                                 ("pentagonal", is_pentagonal),
+                                                 ("hexagonal", is_hexagonal)) if check(number)]
+            assert_that(given.get(number, []), equal_to(expected))
+        assert_that(list(given), equal_to(sorted(given)))
+        # 40755 is triangle, pentagonal and hexagonal (see Project Euler 45)
+        assert_that(classify_range(40755, 40755),
+                    equal_to({40755: ['triangle', 'pentagonal', 'hexagonal']}))
 
     def test_is_abundant(self):
         """ Testing is_abundant function. """
         assert_that(is_abundant(12), equal_to(True))
         assert_that(is_abundant(13), equal_to(False))
+
+        sieve = factor_sieve(100)
+        sieve.calculate()
+        given = [n for n in range(1, 100 + 1) if is_abundant(n, sieve)]
+        assert_that(given, equal_to([n for n in range(1, 100 + 1) if is_abundant(n)]))
+
+    def test_divisor_sum_table(self):
+        """ Testing table of sum of divisors. """
+        table = divisor_sum_table(1000)
+        assert_that(list(table), equal_to([0] + [sum(divisors(n)) for n in range(1, 1000 + 1)]))
+
+    def test_divisor_count_table(self):
+        """ Testing table of number of divisors. """
+        table = divisor_count_table(1000)
+        assert_that(list(table), equal_to([0] + [len(divisors(n)) for n in range(1, 1000 + 1)]))
+
+    def test_totient_table(self):
+        """ Testing table of Euler's totient function. """
+        table = totient_table(1000)
+        for value in range(1, 1000 + 1):
+            expected = value
+            for prime in factorize(value):
+                expected = expected // prime * (prime - 1)
+            assert_that(table[value], equal_to(expected))
+
+    def test_mobius_table(self):
+        """ Testing table of Moebius function. """
+        table = mobius_table(1000)
+        for value in range(1, 1000 + 1):
+            factors = factorize(value)
+            expected = 0 if any(exponent > 1 for exponent in factors.values()) else (-1) ** len(factors)
+            assert_that(table[value], equal_to(expected))
+
+    def test_abundant_numbers(self):
+        """ Testing all abundant numbers up to a limit. """
+        expected = [n for n in range(1, 2000 + 1) if is_abundant(n)]
+        assert_that(abundant_numbers(2000), equal_to(expected))
+        assert_that(len(abundant_numbers(28123)), equal_to(6965))
+
+    def test_perfect_numbers(self):
+        """ Testing all perfect numbers up to a limit. """
+        assert_that(perfect_numbers(10000), equal_to([6, 28, 496, 8128]))
+        assert_that(perfect_numbers(0), equal_to([]))
+
+    def test_primes_up_to(self):
+        """ Testing primes for the number tables. """
+        assert_that(primes_up_to(20), equal_to([2, 3, 5, 7, 11, 13, 17, 19]))
+        assert_that(primes_up_to(1), equal_to([]))
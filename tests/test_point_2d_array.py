@@ -0,0 +1,99 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.math.vector import Vector2d, Vector2dArray
+from concept.math.point import Point2d, Point2dArray
+from concept.math import vector as vector_module
+from concept.errors.exceptions import UnsupportedOperation
+from concept.tools.decorator import validate_test_responsibility_for
+
+
+@validate_test_responsibility_for(Point2dArray)
+class TestPoint2dArray(unittest.TestCase):
+    """ Testing math 2d points (struct of arrays). """
+
+    def test_from_list(self):
+        """Testing of method Point2dArray.from_list (and conversion to Point2d)."""
+        points = Point2dArray.from_list([Point2d(1, 2), Point2d(3, 4)])
+        assert_that(points[1], equal_to(Point2d(3, 4)))
+        assert_that(points.to_list(), equal_to([Point2d(1, 2), Point2d(3, 4)]))
+        assert_that(str(points[:1]), equal_to("Point2dArray([Point2d(x=1, y=2)])"))
+
+    def test_add(self):
+        """Testing of method Point2dArray.__add__."""
+        points = Point2dArray([1, 2], [3, 4])
+        assert_that(points + Vector2d(1, 1), equal_to(Point2dArray([2, 3], [4, 5])))
+        assert_that(points + Vector2dArray([1, 2], [0, 0]), equal_to(Point2dArray([2, 4], [3, 4])))
+        assert_that(calling(points.__add__).with_args(points), raises(UnsupportedOperation))
+
+    def test_iadd(self):
+        """Testing of method Point2dArray.__iadd__."""
+        points = Point2dArray([1, 2], [3, 4])
+        points += Vector2d(1, 1)
+        assert_that(points, equal_to(Point2dArray([2, 3], [4, 5])))
+        assert_that(calling(points.__iadd__).with_args(Point2d(1, 1)), raises(UnsupportedOperation))
+        # slice (a view) changed in place
+        points = Point2dArray([1, 2, 3, 4], [5, 6, 7, 8])
+        points[1:3] += Vector2d(10, 0)
+        assert_that(points, equal_to(Point2dArray([1, 12, 13, 4], [5, 6, 7, 8])))
+        points[::3] = Point2dArray([0, 0], [0, 0])
+        assert_that(points, equal_to(Point2dArray([0, 12, 13, 0], [0, 6, 7, 0])))
+
+    def test_sub(self):
+        """Testing of method Point2dArray.__sub__."""
+        points = Point2dArray([1, 2, 3], [3, 4, 5])
+        # vectors between points
+        vectors = points[1:] - Point2d(1, 1)
+        assert_that(vectors, equal_to(Vector2dArray([1, 2], [3, 4])))
+        assert_that(points[:2] - points[1:], equal_to(Vector2dArray([-1, -1], [-1, -1])))
+        assert_that(points.x.tolist(), equal_to([1.0, 2.0, 3.0]))
+        # translated points
+        assert_that(points - Vector2d(1, 1), equal_to(Point2dArray([0, 1, 2], [2, 3, 4])))
+        assert_that(calling(points.__sub__).with_args(1), raises(UnsupportedOperation))
+
+    def test_isub(self):
+        """Testing of method Point2dArray.__isub__."""
+        points = Point2dArray([1, 2], [3, 4])
+        points -= Vector2dArray([1, 1], [2, 2])
+        assert_that(points, equal_to(Point2dArray([0, 1], [1, 2])))
+        assert_that(calling(points.__isub__).with_args(points), raises(UnsupportedOperation))
+        # slice (a view) changed in place
+        points = Point2dArray([1, 2, 3, 4], [5, 6, 7, 8])
+        points[2:4] -= Vector2dArray([1, 2], [3, 4])
+        assert_that(points, equal_to(Point2dArray([1, 2, 2, 2], [5, 6, 4, 4])))
+
+
+class TestPoint2dArrayWithoutNumpy(TestPoint2dArray):
+    """ Testing math 2d points (struct of arrays) without numpy. """
+
+    def setUp(self):
+        """Disable numpy."""
+        self.numpy = vector_module.numpy
+        vector_module.numpy = None
+
+    def tearDown(self):
+        """Restore numpy."""
+        vector_module.numpy = self.numpy
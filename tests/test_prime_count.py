@@ -0,0 +1,44 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to
+from concept.primes.is_prime import is_prime
+from concept.primes.prime_count import prime_count
+
+
+class TestPrimeCount(unittest.TestCase):
+    """Testing prime counting function pi(x)."""
+
+    def test_prime_count(self):
+        """Testing pi(x) comparing with is_prime function."""
+        count = 0
+        for value in range(-1, 3000):
+            count += 1 if is_prime(value) else 0
+            assert_that(prime_count(value), equal_to(count))
+
+    def test_prime_count_powers_of_ten(self):
+        """Testing well known values of pi(10^n)."""
+        expected = [4, 25, 168, 1229, 9592, 78498, 664579, 5761455]
+        assert_that([prime_count(10 ** n) for n in range(1, 9)], equal_to(expected))
@@ -0,0 +1,54 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import io
+import unittest
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.primes.segmented_sieve import iter_primes
+from concept.primes.prime_stream import write_primes_binary, read_primes_binary, MAGIC
+
+
+class TestPrimeStream(unittest.TestCase):
+    """Testing binary format for primes."""
+
+    def test_write_primes_binary(self):
+        """Testing delta encoding (one byte for small differences)."""
+        stream = io.BytesIO()
+        assert_that(write_primes_binary(stream, [2, 3, 5, 7, 263]), equal_to(5))
+        assert_that(stream.getvalue(), equal_to(MAGIC + b"\x02\x01\x02\x02\x80\x02"))
+
+    def test_read_primes_binary(self):
+        """Testing reading primes with small chunks (varints split between chunks)."""
+        primes = list(iter_primes(10 ** 9, 10 ** 9 + 10000)) + [2 ** 61 - 1]
+        stream = io.BytesIO()
+        write_primes_binary(stream, iter(primes), chunk_size=7)
+        given = list(read_primes_binary(io.BytesIO(stream.getvalue()), chunk_size=3))
+        assert_that(given, equal_to(primes))
+
+    def test_read_invalid_stream(self):
+        """Testing reading a stream not being in the binary format or being truncated."""
+        stream = io.BytesIO(b"12345678")
+        assert_that(calling(list).with_args(read_primes_binary(stream)), raises(ValueError))
+        stream = io.BytesIO(MAGIC + b"\x02\x80")
+        assert_that(calling(list).with_args(read_primes_binary(stream)), raises(ValueError))
@@ -0,0 +1,100 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import os
+import sys
+import tempfile
+import unittest
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.primes.is_prime import is_prime
+from concept.primes.wheel_sieve import wheel_sieve
+from concept.primes.prime_table import prime_table, write_prime_table
+
+
+class TestPrimeTable(unittest.TestCase):
+    """Testing memory mapped prime table."""
+
+    def setUp(self):
+        """Writing a prime table with small blocks into a temporary file."""
+        handle, self.path = tempfile.mkstemp(suffix=".primes")
+        os.close(handle)
+        sieve = wheel_sieve(10000)
+        sieve.calculate()
+        self.primes = sieve.get_primes()
+        write_prime_table(self.path, sieve, block_size=7)
+
+    def tearDown(self):
+        """Removing the temporary file."""
+        os.remove(self.path)
+
+    def test_is_prime(self):
+        """Testing prime check."""
+        with prime_table(self.path) as table:
+            given = [n for n in range(10000 + 1) if table.is_prime(n)]
+        assert_that(given, equal_to([n for n in range(10000 + 1) if is_prime(n)]))
+
+    def test_prime_count(self):
+        """Testing pi(x)."""
+        with prime_table(self.path) as table:
+            assert_that([table.prime_count(n) for n in range(8)],
+                        equal_to([0, 0, 1, 2, 2, 3, 3, 4]))
+            for value in range(0, 10000 + 1, 37):
+                assert_that(table.prime_count(value),
+                            equal_to(len([n for n in self.primes if n <= value])))
+            assert_that(table.prime_count(10000), equal_to(1229))
+
+    def test_nth_prime(self):
+        """Testing n'th prime."""
+        with prime_table(self.path) as table:
+            assert_that([table.nth_prime(n + 1) for n in range(len(self.primes))],
+                        equal_to(self.primes))
+            assert_that(calling(table.nth_prime).with_args(0), raises(ValueError))
+            assert_that(calling(table.nth_prime).with_args(1230), raises(ValueError))
+
+    def test_counts(self):
+        """Testing count index being used from the mapping (no copy)."""
+        table = prime_table(self.path)
+        if sys.byteorder == 'little':
+            assert_that(isinstance(table.counts, memoryview), equal_to(True))
+            assert_that(table.counts.obj is table.mapping, equal_to(True))
+        assert_that(len(table.counts), equal_to(table.blocks + 1))
+        assert_that(table.counts[0], equal_to(0))
+        assert_that(table.counts[-1], equal_to(len(self.primes) - 3))
+        table.close()
+        assert_that(table.mapping.closed, equal_to(True))
+        for view in table.views:
+            assert_that(calling(len).with_args(view), raises(ValueError))
+
+    def test_check(self):
+        """Testing values beyond the table."""
+        table = prime_table(self.path)
+        assert_that(calling(table.is_prime).with_args(10001), raises(ValueError))
+        assert_that(calling(table.prime_count).with_args(10001), raises(ValueError))
+        table.close()
+
+    def test_invalid_file(self):
+        """Testing to open a file which is not a prime table."""
+        with open(self.path, "wb") as handle:
+            handle.write(b"\0" * 64)
+        assert_that(calling(prime_table).with_args(self.path), raises(ValueError))
@@ -0,0 +1,59 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to
+from concept.primes.is_prime import is_prime
+from concept.primes.range_sieve import range_sieve, primes_between
+
+
+class TestRangeSieve(unittest.TestCase):
+    """Testing sieving primes in a window."""
+
+    def test_primes_between(self):
+        """Testing windows at different offsets with a small (reused) window buffer."""
+        sieve = range_sieve(window_size=8)
+        for low in range(0, 500, 17):
+            high = low + 100
+            expected = [n for n in range(low, high + 1) if is_prime(n)]
+            assert_that(sieve.primes_between(low, high), equal_to(expected))
+
+    def test_high_offset(self):
+        """Testing window far away from zero."""
+        low = 10 ** 10
+        expected = [n for n in range(low, low + 1000 + 1) if is_prime(n)]
+        assert_that(primes_between(low, low + 1000), equal_to(expected))
+
+    def test_count_between(self):
+        """Testing counting primes in a window."""
+        sieve = range_sieve()
+        assert_that(sieve.count_between(0, 10000), equal_to(1229))
+        assert_that(sieve.count_between(20, 10), equal_to(0))
+
+    def test_get_base_primes(self):
+        """Testing that base primes are recalculated only when required."""
+        sieve = range_sieve()
+        assert_that(sieve.get_base_primes(100), equal_to([3, 5, 7, 11, 13, 17, 19]))
+        primes = sieve.get_base_primes(300)
+        assert_that(sieve.get_base_primes(400) is primes, equal_to(True))
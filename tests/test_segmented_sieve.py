@@ -24,7 +24,7 @@
 # pylint: disable=R0201
 import unittest
 from hamcrest import assert_that, equal_to
-from concept.primes.segmented_sieve import segmented_sieve
+from concept.primes.segmented_sieve import segmented_sieve, iter_primes, base_primes, count_range
 from concept.primes.is_prime import is_prime
 
 
@@ -43,3 +43,58 @@ class TestSegmentedSieve(unittest.TestCase):
         sieve.calculate()
         primes = [n for n in range(10000 + 1) if is_prime(n)]
         assert_that(primes, equal_to(sieve.get_primes()))
+
+    def test_sieve_with_small_segments(self):
+        """Testing prime generation with segments smaller than some base primes."""
+        sieve = segmented_sieve(10000, segment_size=16)
+        sieve.calculate()
+        primes = [n for n in range(10000 + 1) if is_prime(n)]
+        assert_that(sieve.get_primes(), equal_to(primes))
+
+    def test_iter_primes(self):
+        """Testing lazy prime generation for a range."""
+        for low in range(0, 30):
+            primes = [n for n in range(low, 1000 + 1) if is_prime(n)]
+            assert_that(list(iter_primes(low, 1000, segment_size=7)), equal_to(primes))
+
+        assert_that(list(iter_primes(24, 28)), equal_to([]))
+        assert_that(list(iter_primes(10, 2)), equal_to([]))
+
+    def test_iter_primes_method(self):
+        """Testing lazy prime generation via sieve object (nothing stored)."""
+        sieve = segmented_sieve(100)
+        assert_that(list(sieve.iter_primes(90)), equal_to([97]))
+        assert_that(sieve.get_primes(), equal_to([]))
+
+    def test_base_primes(self):
+        """Testing odd base primes."""
+        assert_that(base_primes(1), equal_to([]))
+        assert_that(base_primes(13), equal_to([3, 5, 7, 11, 13]))
+
+    def test_count_range(self):
+        """Testing counting of primes in a range."""
+        primes = base_primes(100)
+        assert_that(count_range(0, 10000, primes, segment_size=16), equal_to(1229))
+        assert_that(count_range(9000, 10000, primes), equal_to(112))
+
+    def test_get_blocks(self):
+        """Testing split into blocks for worker processes."""
+        sieve = segmented_sieve(1000, segment_size=4, workers=2)
+        blocks = sieve.get_blocks()
+        assert_that(blocks[0], equal_to((0, 119)))
+        assert_that(blocks[-1][1], equal_to(1000))
+        assert_that(all(blocks[n][1] + 1 == blocks[n + 1][0] for n in range(len(blocks) - 1)),
+                    equal_to(True))
+
+    def test_parallel(self):
+        """Testing prime generation with worker processes."""
+        sieve = segmented_sieve(10000, segment_size=64, workers=2)
+        sieve.calculate()
+        primes = [n for n in range(10000 + 1) if is_prime(n)]
+        assert_that(list(sieve.get_primes()), equal_to(primes))
+        assert_that(sieve.count_primes(), equal_to(len(primes)))
+
+    def test_count_primes(self):
+        """Testing counting of primes in current process."""
+        assert_that(segmented_sieve(10000).count_primes(), equal_to(1229))
+        assert_that(segmented_sieve(1).count_primes(), equal_to(0))
@@ -0,0 +1,284 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import operator
+import unittest
+from array import array
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.math.matrix import Matrix
+from concept.math.sparse_matrix import SparseMatrix
+from concept.tools.decorator import validate_test_responsibility_for
+
+
+def create_matrix(width, height, values, typecode=None):
+    """
+    Create a (dense) test matrix.
+
+    :param width: number of columns for matrix
+    :param height:  number of rows for matrix
+    :param values: values row by row
+    :param typecode: storage of the matrix (default: list of rows)
+    :returns: matrix instance
+    """
+    matrix = Matrix(width, height, typecode)
+    matrix.set(values)
+    return matrix
+
+
+def get_rows(matrix):
+    """:returns: list of the values of each row."""
+    return [row.get() for row in matrix.rows()]
+
+
+@validate_test_responsibility_for(SparseMatrix)
+@validate_test_responsibility_for(SparseMatrix.Row, True)
+@validate_test_responsibility_for(SparseMatrix.Column, True)
+class TestSparseMatrix(unittest.TestCase):
+
+    """ Testing of class concept.math.sparse_matrix.SparseMatrix. """
+
+    def setUp(self):
+        """ 3x3 matrix with 4 non zero values. """
+        self.dense = create_matrix(3, 3, [0, 2, 0,
+                                          0, 0, 0,
+                                          1, 0, 3])
+        self.sparse = SparseMatrix.from_matrix(self.dense)
+
+    def test_init(self):
+        """ Testing of SparseMatrix.__init__ method. """
+        matrix = SparseMatrix(4, 3)
+        assert_that((matrix.width, matrix.height), equal_to((4, 3)))
+        assert_that(matrix.entries, equal_to({}))
+
+    def test_from_matrix(self):
+        """ Testing of SparseMatrix.from_matrix static method. """
+        assert_that(self.sparse.entries, equal_to({(1, 0): 2, (0, 2): 1, (2, 2): 3}))
+        assert_that((self.sparse.width, self.sparse.height), equal_to((3, 3)))
+
+    def test_to_matrix(self):
+        """ Testing of SparseMatrix.to_matrix method. """
+        assert_that(get_rows(self.sparse.to_matrix()), equal_to(get_rows(self.dense)))
+        matrix = self.sparse.to_matrix('d')
+        assert_that(matrix.data, equal_to(array('d', [0, 2, 0, 0, 0, 0, 1, 0, 3])))
+
+    def test_len(self):
+        """ Testing of SparseMatrix.__len__ method. """
+        assert_that(len(SparseMatrix(4, 3)), equal_to(3))
+
+    def test_setitem(self):
+        """ Testing of SparseMatrix.__setitem__ method. """
+        self.sparse[1, 1] = 5
+        assert_that(self.sparse.entries[1, 1], equal_to(5))
+        # zero removes the entry
+        self.sparse[1, 0] = 0
+        assert_that((1, 0) in self.sparse.entries, equal_to(False))
+        assert_that(calling(self.sparse.__setitem__).with_args((3, 0), 1), raises(IndexError))
+        assert_that(calling(self.sparse.__setitem__).with_args((0, -1), 1), raises(IndexError))
+
+    def test_getitem(self):
+        """ Testing of SparseMatrix.__getitem__ method. """
+        assert_that(self.sparse[1, 0], equal_to(2))
+        assert_that(self.sparse[2, 2], equal_to(3))
+        assert_that(self.sparse[1, 1], equal_to(0))
+        assert_that(calling(self.sparse.__getitem__).with_args((-1, 0)), raises(IndexError))
+        assert_that(calling(self.sparse.__getitem__).with_args((3, 3)), raises(IndexError))
+
+    def test_delitem(self):
+        """ Testing of SparseMatrix.__delitem__ method. """
+        del self.sparse[1, 0]
+        del self.sparse[1, 1]
+        assert_that(self.sparse.entries, equal_to({(0, 2): 1, (2, 2): 3}))
+
+    def test_repr(self):
+        """ Testing of SparseMatrix.__repr__ method. """
+        assert_that(str(self.sparse), equal_to("SparseMatrix(3x3:(1,0)=2,(0,2)=1,(2,2)=3)"))
+
+    def test_count_nonzero(self):
+        """ Testing of SparseMatrix.count_nonzero method. """
+        assert_that(self.sparse.count_nonzero(), equal_to(3))
+        assert_that(SparseMatrix(100, 100).count_nonzero(), equal_to(0))
+
+    def test_csr(self):
+        """ Testing of SparseMatrix.csr method. """
+        offsets, columns, values = self.sparse.csr()
+        assert_that(offsets, equal_to(array('q', [0, 1, 1, 3])))
+        assert_that(columns, equal_to(array('q', [1, 0, 2])))
+        assert_that(values, equal_to([2, 1, 3]))
+        # kept until the next change
+        assert_that(self.sparse.csr() is self.sparse.csr(), equal_to(True))
+        self.sparse[2, 1] = 4
+        assert_that(self.sparse.csr()[0], equal_to(array('q', [0, 1, 2, 4])))
+
+    def test_csc(self):
+        """ Testing of SparseMatrix.csc method. """
+        offsets, rows, values = self.sparse.csc()
+        assert_that(offsets, equal_to(array('q', [0, 1, 2, 3])))
+        assert_that(rows, equal_to(array('q', [2, 0, 2])))
+        assert_that(values, equal_to([1, 2, 3]))
+        offsets, rows, values = SparseMatrix.from_matrix(create_matrix(2, 1, [0, 7])).csc()
+        assert_that(offsets, equal_to(array('q', [0, 0, 1])))
+
+    def test_compress(self):
+        """ Testing of SparseMatrix.compress static method. """
+        offsets, minors, values = SparseMatrix.compress([], 2)
+        assert_that((offsets, minors, values), equal_to((array('q', [0, 0, 0]), array('q'), [])))
+
+    def test_cells(self):
+        """ Testing of SparseMatrix.cells method. """
+        assert_that([cell.get() for cell in self.sparse.cells()],
+                    equal_to([cell.get() for cell in self.dense.cells()]))
+
+    def test_rows(self):
+        """ Testing of SparseMatrix.rows method. """
+        assert_that(get_rows(self.sparse), equal_to([[0, 2, 0], [0, 0, 0], [1, 0, 3]]))
+
+    def test_columns(self):
+        """ Testing of SparseMatrix.columns method. """
+        assert_that([column.get() for column in self.sparse.columns()],
+                    equal_to([[0, 0, 1], [2, 0, 0], [0, 0, 3]]))
+
+    def test_add(self):
+        """ Testing of SparseMatrix.__add__ method. """
+        other = SparseMatrix.from_matrix(create_matrix(3, 3, [0, -2, 0, 0, 4, 0, 0, 0, 0]))
+        matrix = self.sparse + other
+        assert_that(isinstance(matrix, SparseMatrix), equal_to(True))
+        # 2 + -2 is not stored
+        assert_that(matrix.entries, equal_to({(1, 1): 4, (0, 2): 1, (2, 2): 3}))
+        # sparse + dense is dense
+        matrix = self.sparse + self.dense
+        assert_that(isinstance(matrix, Matrix), equal_to(True))
+        assert_that(get_rows(matrix), equal_to([[0, 4, 0], [0, 0, 0], [2, 0, 6]]))
+
+        assert_that(calling(operator.add).with_args(self.sparse, 1), raises(TypeError))
+        assert_that(calling(self.sparse.__add__).with_args(SparseMatrix(2, 3)), raises(ValueError))
+        # float values with integer storage
+        sparse = SparseMatrix.from_matrix(create_matrix(2, 1, [0.5, 0]))
+        matrix = sparse + create_matrix(2, 1, [1, 2], 'q')
+        assert_that(matrix.typecode, equal_to('d'))
+        assert_that(get_rows(matrix), equal_to([[1.5, 2.0]]))
+
+    def test_radd(self):
+        """ Testing of SparseMatrix.__radd__ method. """
+        for typecode in (None, 'q'):
+            matrix = create_matrix(3, 3, [1] * 9, typecode) + self.sparse
+            assert_that(matrix.typecode, equal_to(typecode))
+            assert_that(get_rows(matrix), equal_to([[1, 3, 1], [1, 1, 1], [2, 1, 4]]))
+        assert_that(self.sparse.__radd__(1), equal_to(NotImplemented))
+
+    def test_product_typecode(self):
+        """ Testing of SparseMatrix.product_typecode method. """
+        floats = SparseMatrix.from_matrix(create_matrix(2, 1, [0.5, 0]))
+        assert_that(self.sparse.product_typecode(Matrix(1, 1, 'q')), equal_to('q'))
+        assert_that(floats.product_typecode(Matrix(1, 1, 'q')), equal_to('d'))
+        assert_that(floats.product_typecode(Matrix(1, 1, 'f')), equal_to('f'))
+        assert_that(floats.product_typecode(Matrix(1, 1)), equal_to(None))
+
+    def test_mul(self):
+        """ Testing of SparseMatrix.__mul__ method. """
+        matrix = self.sparse * 10
+        assert_that(matrix.entries, equal_to({(1, 0): 20, (0, 2): 10, (2, 2): 30}))
+        assert_that((self.sparse * 0).count_nonzero(), equal_to(0))
+
+        dense = create_matrix(2, 3, [1, 2, 3, 4, 5, 6])
+        expected = get_rows(self.dense * dense)
+        # sparse * dense is dense
+        for typecode in (None, 'q'):
+            matrix = self.sparse * create_matrix(2, 3, [1, 2, 3, 4, 5, 6], typecode)
+            assert_that(matrix.typecode, equal_to(typecode))
+            assert_that(get_rows(matrix), equal_to(expected))
+        # sparse * sparse is sparse
+        matrix = self.sparse * SparseMatrix.from_matrix(dense)
+        assert_that(isinstance(matrix, SparseMatrix), equal_to(True))
+        assert_that(get_rows(matrix), equal_to(expected))
+
+        # float values with integer storage
+        matrix = (self.sparse * 0.5) * create_matrix(2, 3, [1, 2, 3, 4, 5, 6], 'q')
+        assert_that(matrix.typecode, equal_to('d'))
+        assert_that(get_rows(matrix), equal_to([[3.0, 4.0], [0.0, 0.0], [8.0, 10.0]]))
+
+        assert_that(calling(operator.mul).with_args(self.sparse, "text"), raises(TypeError))
+        assert_that(calling(self.sparse.__mul__).with_args(SparseMatrix(3, 2)), raises(ValueError))
+
+    def test_rmul(self):
+        """ Testing of SparseMatrix.__rmul__ method. """
+        assert_that((2 * self.sparse).entries, equal_to({(1, 0): 4, (0, 2): 2, (2, 2): 6}))
+        assert_that(self.sparse.__rmul__("text"), equal_to(NotImplemented))
+        # dense * sparse is dense
+        dense = create_matrix(3, 2, [1, 2, 3, 4, 5, 6])
+        expected = get_rows(dense * self.dense)
+        for typecode in (None, 'q', 'd'):
+            matrix = create_matrix(3, 2, [1, 2, 3, 4, 5, 6], typecode) * self.sparse
+            assert_that(matrix.typecode, equal_to(typecode))
+            assert_that(get_rows(matrix), equal_to(expected))
+        matrix = create_matrix(3, 2, [1, 2, 3, 4, 5, 6], 'q') * (self.sparse * 0.5)
+        assert_that(matrix.typecode, equal_to('d'))
+        assert_that(get_rows(matrix), equal_to([[1.5, 1.0, 4.5], [3.0, 4.0, 9.0]]))
+        assert_that(calling(self.sparse.__rmul__).with_args(create_matrix(2, 2, [1] * 4)),
+                    raises(ValueError))
+
+    def test_row_init(self):
+        """ Testing of SparseMatrix.Row.__init__ method. """
+        row = SparseMatrix.Row(1, self.sparse)
+        assert_that((row.row, row.matrix), equal_to((1, self.sparse)))
+
+    def test_row_items(self):
+        """ Testing of SparseMatrix.Row.items method. """
+        assert_that([row.items() for row in self.sparse.rows()], equal_to([[(1, 2)], [], [(0, 1), (2, 3)]]))
+
+    def test_row_get(self):
+        """ Testing of SparseMatrix.Row.get method. """
+        assert_that(SparseMatrix.Row(2, self.sparse).get(), equal_to([1, 0, 3]))
+
+    def test_row_set(self):
+        """ Testing of SparseMatrix.Row.set method. """
+        SparseMatrix.Row(2, self.sparse).set([0, 5, 0])
+        assert_that(self.sparse.entries, equal_to({(1, 0): 2, (1, 2): 5}))
+
+    def test_row_cells(self):
+        """ Testing of SparseMatrix.Row.cells method. """
+        assert_that([cell.get() for cell in SparseMatrix.Row(0, self.sparse).cells()], equal_to([0, 2, 0]))
+
+    def test_column_init(self):
+        """ Testing of SparseMatrix.Column.__init__ method. """
+        column = SparseMatrix.Column(1, self.sparse)
+        assert_that((column.column, column.matrix), equal_to((1, self.sparse)))
+
+    def test_column_items(self):
+        """ Testing of SparseMatrix.Column.items method. """
+        assert_that([column.items() for column in self.sparse.columns()],
+                    equal_to([[(2, 1)], [(0, 2)], [(2, 3)]]))
+
+    def test_column_get(self):
+        """ Testing of SparseMatrix.Column.get method. """
+        assert_that(SparseMatrix.Column(2, self.sparse).get(), equal_to([0, 0, 3]))
+
+    def test_column_set(self):
+        """ Testing of SparseMatrix.Column.set method. """
+        SparseMatrix.Column(0, self.sparse).set([7, 0, 0])
+        assert_that(self.sparse.entries, equal_to({(0, 0): 7, (1, 0): 2, (2, 2): 3}))
+
+    def test_column_cells(self):
+        """ Testing of SparseMatrix.Column.cells method. """
+        assert_that([cell.get() for cell in SparseMatrix.Column(1, self.sparse).cells()],
+                    equal_to([2, 0, 0]))
@@ -0,0 +1,250 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import math
+import unittest
+import operator
+from array import array
+from hamcrest import assert_that, equal_to, calling, raises
+from concept.math.vector import Vector2d, Array2d, Vector2dArray
+from concept.math import vector as vector_module
+from concept.tools.decorator import validate_test_responsibility_for
+
+
+@validate_test_responsibility_for(Array2d)
+@validate_test_responsibility_for(Vector2dArray)
+class TestVector2dArray(unittest.TestCase):
+    """ Testing math 2d vectors (struct of arrays). """
+
+    def test_init(self):
+        """Testing of method Array2d.__init__."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        assert_that(vectors.x, equal_to(array('d', [1.0, 2.0])))
+        assert_that(vectors.y, equal_to(array('d', [3.0, 4.0])))
+        assert_that(len(Vector2dArray()), equal_to(0))
+        # memoryview used without copy
+        values = array('d', [1.0, 2.0])
+        assert_that(Vector2dArray(memoryview(values), memoryview(values)).x.obj is values, equal_to(True))
+        assert_that(calling(Vector2dArray).with_args([1, 2], [3]), raises(ValueError))
+
+    def test_from_list(self):
+        """Testing of method Array2d.from_list."""
+        vectors = Vector2dArray.from_list([Vector2d(1, 2), Vector2d(3, 4)])
+        assert_that(isinstance(vectors, Vector2dArray), equal_to(True))
+        assert_that(vectors.x.tolist(), equal_to([1.0, 3.0]))
+        assert_that(vectors.y.tolist(), equal_to([2.0, 4.0]))
+
+    def test_to_list(self):
+        """Testing of method Array2d.to_list."""
+        assert_that(Vector2dArray([1, 2], [3, 4]).to_list(), equal_to([Vector2d(1, 3), Vector2d(2, 4)]))
+
+    def test_len(self):
+        """Testing of method Array2d.__len__."""
+        assert_that(len(Vector2dArray([1, 2, 3], [4, 5, 6])), equal_to(3))
+
+    def test_iter(self):
+        """Testing of method Array2d.__iter__."""
+        assert_that(list(Vector2dArray([1, 2], [3, 4])), equal_to([Vector2d(1, 3), Vector2d(2, 4)]))
+
+    def test_getitem(self):
+        """Testing of method Array2d.__getitem__."""
+        vectors = Vector2dArray([1, 2, 3], [4, 5, 6])
+        assert_that(vectors[1], equal_to(Vector2d(2, 5)))
+        assert_that(vectors[-1], equal_to(Vector2d(3, 6)))
+        # slice is a view (no copy)
+        view = vectors[::2]
+        assert_that(isinstance(view, Vector2dArray), equal_to(True))
+        assert_that(view.to_list(), equal_to([Vector2d(1, 4), Vector2d(3, 6)]))
+        view.scale(10)
+        assert_that(vectors.x.tolist(), equal_to([10.0, 2.0, 30.0]))
+
+    def test_setitem(self):
+        """Testing of method Array2d.__setitem__."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        vectors[1] = Vector2d(7, 8)
+        assert_that(vectors.to_list(), equal_to([Vector2d(1, 3), Vector2d(7, 8)]))
+        # slices
+        vectors = Vector2dArray([1, 2, 3, 4], [5, 6, 7, 8])
+        vectors[0:2] = Vector2dArray([10, 20], [50, 60])
+        assert_that(vectors, equal_to(Vector2dArray([10, 20, 3, 4], [50, 60, 7, 8])))
+        vectors[::2] = vectors[1::2]
+        assert_that(vectors, equal_to(Vector2dArray([20, 20, 4, 4], [60, 60, 8, 8])))
+        vectors[1:3] += Vector2d(10, 0)
+        assert_that(vectors, equal_to(Vector2dArray([20, 30, 14, 4], [60, 60, 8, 8])))
+        vectors[2:] -= Vector2dArray([4, 4], [8, 8])
+        assert_that(vectors, equal_to(Vector2dArray([20, 30, 10, 0], [60, 60, 0, 0])))
+        # overlapping slices of the same values
+        vectors[1:] = vectors[:3]
+        assert_that(vectors, equal_to(Vector2dArray([20, 20, 30, 10], [60, 60, 60, 0])))
+        assert_that(calling(vectors.__setitem__).with_args(slice(0, 2), Vector2dArray([1], [2])),
+                    raises(ValueError))
+        assert_that(calling(vectors.__setitem__).with_args(slice(0, 1), Vector2d(1, 2)),
+                    raises(TypeError))
+
+    def test_same_values(self):
+        """Testing of method Array2d.same_values."""
+        values = array('d', [1, 2, 3, 4])
+        same = Array2d.same_values(memoryview(values)[1:3], memoryview(values)[1:3])
+        assert_that(same, equal_to(vector_module.numpy is not None))
+        assert_that(Array2d.same_values(memoryview(values)[1:3], memoryview(values)[2:4]), equal_to(False))
+        assert_that(Array2d.same_values(memoryview(values)[::2], memoryview(values)[:2]), equal_to(False))
+        assert_that(Array2d.same_values(memoryview(values), array('d', values)), equal_to(False))
+
+    def test_repr(self):
+        """Testing of method Array2d.__repr__."""
+        assert_that(str(Vector2dArray([1.2], [3.4])), equal_to("Vector2dArray([Vector2d(x=1.2, y=3.4)])"))
+
+    def test_equal(self):
+        """Testing of method Array2d.__eq__."""
+        assert_that(Vector2dArray([1, 2], [3, 4]), equal_to(Vector2dArray([1, 2], [3, 4])))
+        assert_that(Vector2dArray([1, 2], [3, 4]) == Vector2dArray([1, 2], [3, 5]), equal_to(False))
+        assert_that(Vector2dArray([1, 2], [3, 4]) == Vector2dArray([1], [3]), equal_to(False))
+        assert_that(Vector2dArray([1], [3]) == Vector2d(1, 3), equal_to(False))
+
+    def test_clone(self):
+        """Testing of method Array2d.clone."""
+        vectors = Vector2dArray([1, 2, 3], [4, 5, 6])
+        clone = vectors[1:].clone()
+        assert_that(clone.x, equal_to(array('d', [2.0, 3.0])))
+        clone.scale(2)
+        assert_that(vectors.x.tolist(), equal_to([1.0, 2.0, 3.0]))
+
+    def test_columns(self):
+        """Testing of method Array2d.columns."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        other_x, other_y = vectors.columns(Vector2dArray([5, 6], [7, 8]))
+        assert_that(list(other_x), equal_to([5.0, 6.0]))
+        assert_that(list(other_y), equal_to([7.0, 8.0]))
+        # one vector for each vector (numpy: values are broadcasted)
+        other_x, other_y = vectors.columns(Vector2d(5, 7))
+        if vector_module.numpy is not None:
+            assert_that((other_x, other_y), equal_to((5.0, 7.0)))
+        else:
+            assert_that(list(zip(other_x, other_y, range(2))), equal_to([(5.0, 7.0, 0), (5.0, 7.0, 1)]))
+        assert_that(calling(vectors.columns).with_args(Vector2dArray([1], [2])), raises(ValueError))
+
+    def test_combine(self):
+        """Testing of method Array2d.combine."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        assert_that(vectors.combine(Vector2d(1, 1), operator.imul) is vectors, equal_to(True))
+        assert_that(vectors.combine(Vector2dArray([2, 3], [4, 5]), operator.imul),
+                    equal_to(Vector2dArray([2, 6], [12, 20])))
+
+    def test_add(self):
+        """Testing of method Vector2dArray.__add__."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        assert_that(vectors + Vector2dArray([1, 1], [2, 2]), equal_to(Vector2dArray([2, 3], [5, 6])))
+        assert_that(vectors + Vector2d(1, 2), equal_to(Vector2dArray([2, 3], [5, 6])))
+        assert_that(vectors, equal_to(Vector2dArray([1, 2], [3, 4])))
+
+    def test_iadd(self):
+        """Testing of method Vector2dArray.__iadd__."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        values = vectors.x
+        vectors += Vector2d(1, 2)
+        assert_that(vectors, equal_to(Vector2dArray([2, 3], [5, 6])))
+        assert_that(vectors.x is values, equal_to(True))
+
+    def test_sub(self):
+        """Testing of method Vector2dArray.__sub__."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        assert_that(vectors - Vector2dArray([1, 1], [2, 2]), equal_to(Vector2dArray([0, 1], [1, 2])))
+        assert_that(vectors - Vector2d(1, 2), equal_to(Vector2dArray([0, 1], [1, 2])))
+
+    def test_isub(self):
+        """Testing of method Vector2dArray.__isub__."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        vectors -= Vector2dArray([1, 1], [2, 2])
+        assert_that(vectors, equal_to(Vector2dArray([0, 1], [1, 2])))
+
+    def test_neg(self):
+        """Testing of method Vector2dArray.__neg__."""
+        assert_that(-Vector2dArray([1, -2], [3, 0]), equal_to(Vector2dArray([-1, 2], [-3, 0])))
+
+    def test_scalar_product(self):
+        """Testing of method Vector2dArray.scalar_product."""
+        vectors = Vector2dArray([3, 1], [4, 0])
+        assert_that(vectors.scalar_product(Vector2d(1, 3)), equal_to(array('d', [15.0, 1.0])))
+        assert_that(vectors.scalar_product(vectors), equal_to(array('d', [25.0, 1.0])))
+
+    def test_cross_product(self):
+        """Testing of method Vector2dArray.cross_product."""
+        vectors = Vector2dArray([3, 1], [4, 0])
+        assert_that(vectors.cross_product(Vector2d(1, 3)), equal_to(array('d', [5.0, 3.0])))
+        assert_that(vectors.cross_product(vectors), equal_to(array('d', [0.0, 0.0])))
+
+    def test_length(self):
+        """Testing of method Vector2dArray.length."""
+        assert_that(Vector2dArray([3, 0], [4, 0]).length(), equal_to(array('d', [5.0, 0.0])))
+
+    def test_scale(self):
+        """Testing of method Vector2dArray.scale."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        assert_that(vectors.scale(2) is vectors, equal_to(True))
+        assert_that(vectors, equal_to(Vector2dArray([2, 4], [6, 8])))
+
+    def test_scaled(self):
+        """Testing of method Vector2dArray.scaled."""
+        vectors = Vector2dArray([1, 2], [3, 4])
+        assert_that(vectors.scaled(0.5), equal_to(Vector2dArray([0.5, 1], [1.5, 2])))
+        assert_that(vectors, equal_to(Vector2dArray([1, 2], [3, 4])))
+
+    def test_normalize(self):
+        """Testing of method Vector2dArray.normalize."""
+        vectors = Vector2dArray([3, 0], [4, -2])
+        assert_that(vectors.normalize() is vectors, equal_to(True))
+        assert_that(vectors, equal_to(Vector2dArray([0.6, 0], [0.8, -1])))
+        assert_that(calling(Vector2dArray([1, 0], [1, 0]).normalize).with_args(), raises(ZeroDivisionError))
+
+    def test_normalized(self):
+        """Testing of method Vector2dArray.normalized."""
+        vectors = Vector2dArray([3, 0], [4, -2])
+        assert_that(vectors.normalized().length(), equal_to(array('d', [1.0, 1.0])))
+        assert_that(vectors, equal_to(Vector2dArray([3, 0], [4, -2])))
+
+    def test_rotate(self):
+        """Testing of method Vector2dArray.rotate."""
+        vectors = Vector2dArray([1, 0], [0, 1])
+        assert_that(vectors.rotate(math.pi / 2.0) is vectors, equal_to(True))
+        assert_that(vectors, equal_to(Vector2dArray([0, -1], [1, 0])))
+
+    def test_rotated(self):
+        """Testing of method Vector2dArray.rotated."""
+        vectors = Vector2dArray([1, 3], [2, -1])
+        rotated = vectors.rotated(0.3)
+        assert_that(rotated.to_list(), equal_to([vector.rotated(0.3) for vector in vectors]))
+        assert_that(vectors, equal_to(Vector2dArray([1, 3], [2, -1])))
+
+
+class TestVector2dArrayWithoutNumpy(TestVector2dArray):
+    """ Testing math 2d vectors (struct of arrays) without numpy. """
+
+    def setUp(self):
+        """Disable numpy."""
+        self.numpy = vector_module.numpy
+        vector_module.numpy = None
+
+    def tearDown(self):
+        """Restore numpy."""
+        vector_module.numpy = self.numpy
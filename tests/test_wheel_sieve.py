@@ -0,0 +1,66 @@
+"""
+   =======
+   License
+   =======
+   Copyright (c) 2017 Thomas Lehmann
+
+   Permission is hereby granted, free of charge, to any person obtaining a copy of this
+   software and associated documentation files (the "Software"), to deal in the Software
+   without restriction, including without limitation the rights to use, copy, modify, merge,
+   publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons
+   to whom the Software is furnished to do so, subject to the following conditions:
+
+   The above copyright notice and this permission notice shall be included in all copies
+   or substantial portions of the Software.
+
+   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+   INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+   DAMAGES OR OTHER LIABILITY,
+   WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+# pylint: disable=R0201
+import unittest
+from hamcrest import assert_that, equal_to
+from concept.primes.is_prime import is_prime
+from concept.primes.wheel_sieve import wheel_sieve
+
+
+class TestWheelSieve(unittest.TestCase):
+    """Testing bit-packed mod-30 wheel sieve."""
+
+    def test_sieve(self):
+        """Testing prime generation."""
+        sieve = wheel_sieve(20)
+        sieve.calculate()
+        assert_that(sieve.get_primes(), equal_to([2, 3, 5, 7, 11, 13, 17, 19]))
+
+    def test_small_limits(self):
+        """Testing limits inside of the first byte (including 2, 3 and 5)."""
+        for max_n in range(0, 61):
+            sieve = wheel_sieve(max_n)
+            sieve.calculate()
+            expected = [n for n in range(max_n + 1) if is_prime(n)]
+            assert_that(sieve.get_primes(), equal_to(expected))
+
+    def test_sieve_with_is_prime(self):
+        """Testing sieve with several (small) segments comparing with is_prime function."""
+        sieve = wheel_sieve(10000, segment_size=17)
+        sieve.calculate()
+        expected = [n for n in range(10000 + 1) if is_prime(n)]
+        assert_that(sieve.get_primes(), equal_to(expected))
+        assert_that(sieve.count_primes(), equal_to(len(expected)))
+
+    def test_is_prime(self):
+        """Testing is_prime method for even and odd values."""
+        sieve = wheel_sieve(1000)
+        sieve.calculate()
+        given = [n for n in range(1000 + 1) if sieve.is_prime(n)]
+        expected = [n for n in range(1000 + 1) if is_prime(n)]
+        assert_that(given, equal_to(expected))
+
+    def test_memory(self):
+        """Testing that 30 numbers are stored in one byte."""
+        assert_that(len(wheel_sieve(30 * 1000 - 1).sieve), equal_to(1000))